@@ -28,7 +28,7 @@ __all__ = [
 ]
 __version__ = "1.0.0"
 
-_cells = get_cells([cells, fixed, logic])
+_cells = {**get_cells([cells, fixed]), **logic.factories}
 
 
 PDK = Pdk(
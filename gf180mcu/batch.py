@@ -0,0 +1,142 @@
+"""Generate parameter sweeps of a PDK cell in worker processes.
+
+``generate`` splits the parameter sets into chunks and builds every chunk in
+a separate process. A worker returns its cells as OASIS bytes, the parent
+reads them all into one layout. Cells are named after their parameters, so
+a cell built by several workers (a shared contact or finger subcell) is
+kept once: later copies of a name are skipped on read. Cells gdsfactory
+leaves unnamed ("Unnamed_<n>", counted per process) are renamed after a
+hash of their content first, so only identical ones are merged.
+
+    from gf180mcu import batch
+
+    result = batch.generate("nfet", [{"w_gate": w} for w in (0.22, 0.5, 1)])
+    result.layout.write("nfet_sweep.oas")
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import multiprocessing
+import os
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, NamedTuple
+
+import gdsfactory as gf
+import klayout.db as kdb
+
+import gf180mcu  # noqa: F401  (activates the PDK in the workers)
+
+__all__ = ["BatchResult", "generate"]
+
+_CHUNKS_PER_WORKER = 4
+_UNNAMED = "Unnamed_"
+
+
+class BatchResult(NamedTuple):
+    """Merged layout and the top cell name of every parameter set, in order."""
+
+    layout: kdb.Layout
+    names: list[str]
+
+
+def _save_options() -> kdb.SaveLayoutOptions:
+    options = kdb.SaveLayoutOptions()
+    options.format = "OASIS"
+    options.write_context_info = False
+    return options
+
+
+def _content_name(layout: kdb.Layout, cell: kdb.Cell) -> str:
+    """Name an unnamed cell after its shapes and (already renamed) children."""
+    h = hashlib.blake2b(digest_size=8)
+    for index in layout.layer_indexes():
+        shapes = cell.shapes(index)
+        if not shapes.is_empty():
+            h.update(f"{layout.get_info(index)}:".encode())
+            h.update("".join(sorted(str(s) for s in shapes.each())).encode())
+    instances = sorted(
+        f"{layout.cell(i.cell_index).name} {i.cplx_trans} {i.a} {i.b} {i.na} {i.nb}"
+        for i in cell.each_inst()
+    )
+    h.update("".join(instances).encode())
+    return f"{_UNNAMED}{h.hexdigest()}"
+
+
+def _build(cell_name: str, params: Sequence[dict[str, Any]]) -> tuple[bytes, list[str]]:
+    """Worker: build one chunk, return it as OASIS bytes and its top names."""
+    components = [gf.get_component(cell_name, **p) for p in params]
+    options = _save_options()
+    options.clear_cells()
+    for c in components:
+        options.add_cell(c.cell_index())
+    data = components[0].kcl.layout.write_bytes(options)
+
+    # Rename unnamed cells in a copy, the cell cache keeps the originals.
+    # Identical ones get the same name and are merged into the first.
+    layout = kdb.Layout()
+    layout.read_bytes(data)
+    kept: dict[str, int] = {}
+    for index in list(layout.each_cell_bottom_up()):
+        cell = layout.cell(index)
+        if not cell.name.startswith(_UNNAMED):
+            continue
+        name = _content_name(layout, cell)
+        if name in kept:
+            for parent in list(cell.each_parent_inst()):
+                parent.inst().cell_index = kept[name]
+            layout.delete_cell(index)
+        else:
+            cell.name = name
+            kept[name] = index
+    if kept:
+        data = layout.write_bytes(_save_options())
+    return data, [c.name for c in components]
+
+
+def generate(
+    cell_name: str,
+    param_list: Sequence[dict[str, Any]],
+    workers: int | None = None,
+) -> BatchResult:
+    """Build cell_name for every parameter set on a pool of processes.
+
+    The workers are spawned, so scripts must call this under
+    ``if __name__ == "__main__":``.
+
+    Args:
+        cell_name: name of a cell of the gf180mcu PDK.
+        param_list: keyword arguments of the cell, one dict per variant.
+        workers: number of processes, defaults to the number of CPUs. With 1
+            (or a single parameter set) the cells are built in this process.
+
+    Returns:
+        The merged layout, one top cell per distinct parameter set, and the
+        top cell name of every parameter set in param_list order.
+    """
+    if cell_name not in gf.get_active_pdk().cells:
+        raise ValueError(f"{cell_name!r} is not a cell of the gf180mcu PDK")
+    params = [dict(p) for p in param_list]
+    if not params:
+        return BatchResult(kdb.Layout(), [])
+    workers = min(workers or os.cpu_count() or 1, len(params))
+    size = max(1, math.ceil(len(params) / (workers * _CHUNKS_PER_WORKER)))
+    chunks = [params[i : i + size] for i in range(0, len(params), size)]
+
+    if workers <= 1:
+        results = [_build(cell_name, chunk) for chunk in chunks]
+    else:
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(workers, mp_context=context) as pool:
+            results = list(pool.map(_build, [cell_name] * len(chunks), chunks))
+
+    layout = kdb.Layout()
+    options = kdb.LoadLayoutOptions()
+    options.cell_conflict_resolution = kdb.LoadLayoutOptions.SkipNewCell
+    names = []
+    for data, chunk_names in results:
+        layout.read_bytes(data, options)
+        names += chunk_names
+    return BatchResult(layout, names)
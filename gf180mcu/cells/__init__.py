@@ -4,7 +4,11 @@ from .cap_mim import *
 from .cap_mos import *
 from .diode import *
 from .fet import *
+from .fet_array import *
+from .fet_stack import *
 from .guardring import *
 from .res import *
+from .res_array import *
+from .res_serpentine import *
 from .via_generator import *
 from .waveguides import *
@@ -8,6 +8,7 @@ from math import floor
 
 import gdsfactory as gf
 
+from gf180mcu.cells.rules import rule_deck
 from gf180mcu.layers import layer
 
 
@@ -42,7 +43,7 @@ def cap_mim(
     contact_size = 0.36
     metal_surround = 0.05
     via_size = 0.26
-    diff_surround = 0.065  # from ruleset
+    diff_surround = rule_deck("3.3V").diff_surround
 
     # Layer mapping for MIM-A (METALS3)
     upper_layer = layer["metal3"]
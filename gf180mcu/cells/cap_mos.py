@@ -21,10 +21,10 @@ Magic ruleset (painted coordinates):
 
 from __future__ import annotations
 
-from math import floor
-
 import gdsfactory as gf
 
+from gf180mcu.cells import contacts, shapes
+from gf180mcu.cells.rules import rule_deck
 from gf180mcu.layers import layer
 
 # ---------------------------------------------------------------------------
@@ -42,17 +42,17 @@ def _snap(v: float) -> float:
 # GDS (CIF) physical constants
 # ---------------------------------------------------------------------------
 
-_CUT = 0.22  # contact cut size in GDS
-_HCUT = 0.11  # half contact cut
-_PITCH = 0.47  # contact pitch (0.22 + 0.25)
-_CIF_DS = 0.07  # active/poly surround in GDS (painted 0.065 + 0.005 bloat/side)
-_CIF_MS = 0.06  # metal1 surround in GDS (painted 0.055 + 0.005 bloat/side)
+_RULES = rule_deck("3.3V")
+_CUT = _RULES.cif_contact_cut  # contact cut size in GDS
+_HCUT = _CUT / 2  # half contact cut
+_CIF_DS = _RULES.cif_diff_surround  # active/poly surround in GDS
+_CIF_MS = _RULES.cif_metal_surround  # metal1 surround in GDS
 
 # Painted constants (used in Magic's geometric formulas)
-_CS = 0.23  # contact_size
-_DS = 0.065  # diff/poly surround
-_MS = 0.055  # metal surround
-_HCS = 0.115  # contact_size / 2
+_CS = _RULES.contact_size  # contact_size
+_DS = _RULES.diff_surround  # diff/poly surround
+_MS = _RULES.metal_surround  # metal surround
+_HCS = _CS / 2  # contact_size / 2
 
 # Geometric constant
 _DIFFT = _CUT + 2 * _CIF_DS  # comp bar thickness (= 0.36)
@@ -63,7 +63,6 @@ _L_COMP = layer["comp"]
 _L_POLY = layer["poly2"]
 _L_NPLUS = layer["nplus"]
 _L_PPLUS = layer["pplus"]
-_L_CONTACT = layer["contact"]
 _L_METAL1 = layer["metal1"]
 _L_NWELL = layer["nwell"]
 _L_LVPWELL = layer["lvpwell"]
@@ -77,26 +76,8 @@ _L_MOSCAP = layer["mos_cap_mk"]
 
 
 def _rect(c, x0, y0, x1, y1, lyr) -> None:
-    """Add a snapped rectangle."""
-    x0, y0, x1, y1 = _snap(x0), _snap(y0), _snap(x1), _snap(y1)
-    if abs(x1 - x0) < 1e-6 or abs(y1 - y0) < 1e-6:
-        return
-    c.add_polygon([(x0, y0), (x1, y0), (x1, y1), (x0, y1)], layer=lyr)
-
-
-def _contact_array(c, cx, cy, w_env, h_env) -> None:
-    """Place 0.22×0.22 contact cuts within an envelope centered at (cx, cy)."""
-    phys_w = max(w_env - 0.01, _CUT)
-    phys_h = max(h_env - 0.01, _CUT)
-    nx = max(1, floor((phys_w - _CUT) / _PITCH + 1 + 1e-6))
-    ny = max(1, floor((phys_h - _CUT) / _PITCH + 1 + 1e-6))
-    span_x = (nx - 1) * _PITCH
-    span_y = (ny - 1) * _PITCH
-    for ix in range(nx):
-        for iy in range(ny):
-            x = _snap(cx - span_x / 2.0 + ix * _PITCH)
-            y = _snap(cy - span_y / 2.0 + iy * _PITCH)
-            _rect(c, x - _CUT / 2, y - _CUT / 2, x + _CUT / 2, y + _CUT / 2, _L_CONTACT)
+    """Add a rectangle, snapped to the 5 nm grid when the ShapeBuffer flushes."""
+    c.add_rect(x0, y0, x1, y1, lyr)
 
 
 # ---------------------------------------------------------------------------
@@ -114,8 +95,8 @@ def _draw_contact(c, cx, cy, w, h, active_layer, orient="vert") -> None:
     hw = cw / 2.0
     hh = ch / 2.0
 
-    # Contact cuts
-    _contact_array(c, cx, cy, cw, ch)
+    # Contact cuts (0.22 at 0.47 pitch within the CIF-shrunk envelope)
+    contacts.fill_contacts(c, cx, cy, cw, ch, snap=_snap)
 
     # Active / poly surround
     _rect(c, cx - hw - _DS, cy - hh - _DS, cx + hw + _DS, cy + hh + _DS, active_layer)
@@ -269,7 +250,7 @@ def cap_mos(
         g_label: Gate label text.
         sd_label: Source/drain label text.
     """
-    c = gf.Component()
+    c = shapes.ShapeBuffer(gf.Component(), grid=_GRID)
 
     is_nmos = "cap_nmos" in type
     is_6v = volt in ("6.0V", "5/6V", "5.0V")
@@ -278,21 +259,15 @@ def cap_mos(
     hw = wc / 2.0
 
     # Voltage-specific Magic ruleset parameters
-    if is_6v:
-        diff_spacing = 0.36
-        diff_gate_space = 0.30
-        sub_surround = 0.16
-        metal_spacing = 0.23
-        dev_sub_dist = 0.0
-    else:  # 3.3V
-        diff_spacing = 0.33
-        diff_gate_space = 0.11
-        sub_surround = 0.12
-        metal_spacing = 0.23
-        dev_sub_dist = 0.12
-
-    g2d = 0.26  # gate_to_diffcont
-    g2p = 0.28  # gate_to_polycont
+    rules = rule_deck(volt if is_6v else "3.3V")
+    diff_spacing = rules.diff_spacing
+    diff_gate_space = rules.diff_gate_space
+    sub_surround = rules.sub_surround
+    metal_spacing = rules.metal_spacing
+    dev_sub_dist = 0.0 if is_6v else 0.12  # device default, not a rule
+
+    g2d = rules.gate_to_diffcont
+    g2p = rules.gate_to_polycont
 
     # =========================================================
     # 1. mos_cap_mk marker — exactly lc × wc
@@ -444,4 +419,4 @@ def cap_mos(
     voltage = "3p3" if not is_6v else "6p0"
     suffix = "_b" if "_b" in type else ""
 
-    return c
+    return c.flush()
@@ -0,0 +1,89 @@
+"""Contact cut arrays shared by the device generators.
+
+Every generator places 0.22 x 0.22 contact cuts on a regular grid. Here the
+number of cuts and the centering offset are computed in closed form and the
+cuts are emitted as a single array reference to one cached cut cell, instead
+of one polygon (or one rectangle reference) per cut.
+"""
+
+from __future__ import annotations
+
+from math import floor
+
+import gdsfactory as gf
+from gdsfactory.typings import LayerSpec
+
+from gf180mcu.layers import layer
+
+CUT = 0.22  # contact cut in GDS
+PITCH = 0.47  # CUT + 0.25 minimum spacing
+CIF_SHRINK = 0.005  # painted contact regions shrink by this per side in CIF
+
+
+def cut_count(extent: float, size: float = CUT, pitch: float = PITCH) -> int:
+    """Number of cuts of the given size and pitch that fit in extent (at least 1)."""
+    return max(1, floor((max(extent, size) - size) / pitch + 1 + 1e-6))
+
+
+@gf.cell
+def contact_cut(size: float = CUT, layer: LayerSpec = layer["contact"]) -> gf.Component:
+    """Single square cut centered on the origin."""
+    c = gf.Component()
+    h = size / 2
+    c.add_polygon([(-h, -h), (h, -h), (h, h), (-h, h)], layer=layer)
+    return c
+
+
+def add_contacts(
+    c: gf.Component,
+    cx: float,
+    cy: float,
+    nx: int,
+    ny: int,
+    pitch_x: float = PITCH,
+    pitch_y: float | None = None,
+    size: float = CUT,
+    snap=None,
+) -> None:
+    """Add an nx x ny array of cuts centered at (cx, cy) as one reference.
+
+    Nothing is added if nx or ny is 0.
+
+    Args:
+        c: component to add the cuts to.
+        cx: center x of the array.
+        cy: center y of the array.
+        nx: number of columns.
+        ny: number of rows.
+        pitch_x: column pitch.
+        pitch_y: row pitch, defaults to pitch_x.
+        size: cut size.
+        snap: optional function applied to the center of the first cut.
+    """
+    if nx < 1 or ny < 1:
+        return
+    pitch_y = pitch_x if pitch_y is None else pitch_y
+    x0 = cx - (nx - 1) * pitch_x / 2.0
+    y0 = cy - (ny - 1) * pitch_y / 2.0
+    if snap is not None:
+        x0, y0 = snap(x0), snap(y0)
+    c.add_ref(
+        contact_cut(size),
+        columns=nx,
+        rows=ny,
+        column_pitch=pitch_x,
+        row_pitch=pitch_y,
+    ).move((x0, y0))
+
+
+def fill_contacts(
+    c: gf.Component, cx: float, cy: float, w: float, h: float, snap=None
+) -> None:
+    """Fill a painted contact region of w x h centered at (cx, cy) with cuts.
+
+    The region is shrunk by the CIF output rule, then as many cuts as fit
+    at PITCH are centered in it along each axis.
+    """
+    nx = cut_count(w - 2 * CIF_SHRINK)
+    ny = cut_count(h - 2 * CIF_SHRINK)
+    add_contacts(c, cx, cy, nx, ny, snap=snap)
@@ -16,11 +16,22 @@ Contact rules:
   nc_x = floor((wa+0.15)/0.50), pitch_x = 0.47 if nc_x==2 else 0.50
   Guard ring side: nc_guard(nc, volt), pitch = 0.47 always
   Contact inset from guard comp outer: 0.190 (03v3), 0.180 (06v0 or outer guard)
+
+Diffusion surround and well enclosures come from the rule deck of the
+voltage class (gf180mcu.cells.rules); the empirical ring offsets are
+tabulated per voltage in _ND2PS_GUARD and _PD2NW_RINGS and
+every contact count is closed form, so a diode costs the same to generate
+whatever its size.
 """
 
+from math import floor
+from typing import NamedTuple
+
 import gdsfactory as gf
 from gdsfactory.typings import Float2
 
+from gf180mcu.cells import contacts, shapes
+from gf180mcu.cells.rules import rule_deck
 from gf180mcu.cells.via_generator import via_generator, via_stack
 from gf180mcu.layers import layer
 
@@ -30,10 +41,10 @@ from gf180mcu.layers import layer
 
 
 def _add_rect(
-    c: gf.Component, x0: float, y0: float, x1: float, y1: float, lyr: str
+    c: shapes.ShapeBuffer, x0: float, y0: float, x1: float, y1: float, lyr: str
 ) -> None:
-    """Add an exact rectangle polygon directly, avoiding snap-to-grid rounding."""
-    c.add_polygon([(x0, y0), (x0, y1), (x1, y1), (x1, y0)], layer=layer[lyr])
+    """Add an exact rectangle, avoiding snap-to-grid rounding."""
+    c.add_rect(x0, y0, x1, y1, layer[lyr])
 
 
 # ---------------------------------------------------------------------------
@@ -41,14 +52,6 @@ def _add_rect(
 # ---------------------------------------------------------------------------
 
 
-def _positions(nc: int, pitch: float) -> list:
-    """nc contact centre positions centred on zero."""
-    if nc == 1:
-        return [0.0]
-    start = -(nc - 1) / 2.0 * pitch
-    return [round(start + i * pitch, 4) for i in range(nc)]
-
-
 def _nc_inner(w: float) -> int:
     """Number of inner device contacts in dimension w."""
     return int((w + 0.15) / 0.50)
@@ -72,30 +75,50 @@ def _nc_outer_guard_side(og_inner_y: float) -> int:
 
     Contact centres must satisfy: center_y ≤ og_inner_y - 0.340.
     (Empirically derived from reference GDS: 0.340 = contact_half + 0.230 rule.)
+    A centred column of nc contacts at pitch 0.47 reaches (nc - 1) * 0.235.
     """
-    max_y = og_inner_y - 0.340
-    odd_nc = 0
-    for n in range(500):
-        if n * 0.47 <= max_y + 1e-9:
-            odd_nc = 2 * n + 1
-        else:
-            break
-    even_nc = 0
-    for n in range(1, 500):
-        if (n - 0.5) * 0.47 <= max_y + 1e-9:
-            even_nc = 2 * n
-        else:
-            break
-    return max(odd_nc, even_nc)
-
-
-def _place_contacts(c: gf.Component, xs: list, ys: list) -> None:
-    """Place 0.22x0.22 contacts at all (x,y) combinations."""
-    size = 0.22
-    con_rect = gf.components.rectangle(size=(size, size), layer=layer["contact"])
-    for x in xs:
-        for y in ys:
-            c.add_ref(con_rect).move((x - size / 2, y - size / 2))
+    max_y = og_inner_y - 0.340 + 1e-9
+    if max_y < 0:
+        return 0
+    return floor(max_y / 0.235) + 1
+
+
+# ---------------------------------------------------------------------------
+# Guard ring geometry per voltage
+# ---------------------------------------------------------------------------
+
+
+class _Guard(NamedTuple):
+    inner: float  # ring comp inner edge beyond the enclosed edge
+    outer: float  # ring comp outer edge beyond the enclosed edge
+    contact_inset: float  # contact centre to ring comp outer edge
+
+
+class _PD2NWRings(NamedTuple):
+    inner: _Guard  # N+ cathode ring, around the anode
+    outer: _Guard  # P+ ring, around the inner ring's outer edge
+    nplus_enc_in: float  # nplus inward of the inner ring
+
+
+_ND2PS_GUARD = {
+    "3.3V": _Guard(0.300, 0.680, 0.190),
+    "6.0V": _Guard(0.400, 0.760, 0.180),
+}
+
+_PD2NW_RINGS = {
+    "3.3V": _PD2NWRings(
+        _Guard(0.300, 0.680, 0.190), _Guard(0.450, 0.810, 0.180), 0.090
+    ),
+    "6.0V": _PD2NWRings(
+        _Guard(0.360, 0.720, 0.180), _Guard(0.520, 0.880, 0.180), 0.070
+    ),
+}
+
+
+def _guard_edges(h: float, guard: _Guard) -> tuple[float, float, float]:
+    """Ring comp inner and outer edge and contact centre around half-size h."""
+    outer = round(h + guard.outer, 4)
+    return round(h + guard.inner, 4), outer, round(outer - guard.contact_inset, 4)
 
 
 def _guard_ring_comp(
@@ -225,12 +248,10 @@ def _guard_contacts(
     Left/right cols at x=±guard_contact_x, y positions from nc_gy.
     Top/bottom rows at y=±guard_contact_y, x positions from nc_gx.
     """
-    gy_pos = _positions(nc_gy, 0.47)
-    gx_pos = _positions(nc_gx, 0.47)
-    _place_contacts(c, [-guard_contact_x], gy_pos)
-    _place_contacts(c, [guard_contact_x], gy_pos)
-    _place_contacts(c, gx_pos, [guard_contact_y])
-    _place_contacts(c, gx_pos, [-guard_contact_y])
+    contacts.add_contacts(c, -guard_contact_x, 0, 1, nc_gy)
+    contacts.add_contacts(c, guard_contact_x, 0, 1, nc_gy)
+    contacts.add_contacts(c, 0, guard_contact_y, nc_gx, 1)
+    contacts.add_contacts(c, 0, -guard_contact_y, nc_gx, 1)
 
 
 def _guard_metal1(
@@ -321,39 +342,22 @@ def diode_nd2ps(
         p_label: p terminal label.
         n_label: n terminal label.
     """
-    c = gf.Component()
-
-    diff_surround = 0.065
-    lvpwell_enc = 0.12
+    c = shapes.ShapeBuffer(gf.Component())
 
-    # Voltage-dependent geometry constants (all from reference GDS analysis)
-    if volt == "3.3V":
-        dev_spacing = 0.300  # gap between inner comp and guard ring comp inner edge
-        guard_inner_offset = 0.300  # guard_inner = wa/2 + this
-        guard_outer_offset = 0.680  # guard_outer = wa/2 + this (strip = 0.380)
-        contact_inset = 0.190  # guard contact center to guard comp outer edge
-        nplus_enc = 0.16
-        dg_enc = 0.24
-    else:  # 6.0V
-        dev_spacing = 0.400
-        guard_inner_offset = 0.400
-        guard_outer_offset = 0.760
-        contact_inset = 0.180
-        nplus_enc = 0.16
-        dg_enc = 0.24
+    deck = "3.3V" if volt == "3.3V" else "6.0V"
+    diff_surround = rule_deck(deck).diff_surround
+    # the references keep the 3.3V sub_surround around the guard ring at 6.0V
+    lvpwell_enc = rule_deck("3.3V").sub_surround
+    nplus_enc = 0.16
+    dg_enc = 0.24
+    guard = _ND2PS_GUARD[deck]
 
     hw = wa / 2
     hl = la / 2
 
-    # Guard ring comp geometry
-    guard_inner_x = round(hw + guard_inner_offset, 4)
-    guard_inner_y = round(hl + guard_inner_offset, 4)
-    guard_outer_x = round(hw + guard_outer_offset, 4)
-    guard_outer_y = round(hl + guard_outer_offset, 4)
-
-    # Guard ring contact centre positions
-    guard_contact_x = round(guard_outer_x - contact_inset, 4)
-    guard_contact_y = round(guard_outer_y - contact_inset, 4)
+    # Guard ring comp edges and contact centre positions
+    guard_inner_x, guard_outer_x, guard_contact_x = _guard_edges(hw, guard)
+    guard_inner_y, guard_outer_y, guard_contact_y = _guard_edges(hl, guard)
 
     # Contact counts
     nc_x = _nc_inner(wa)
@@ -382,9 +386,7 @@ def diode_nd2ps(
     ).move((-nplus_hw, -nplus_hl))
 
     # Inner contacts
-    inner_xs = _positions(nc_x, pitch_x)
-    inner_ys = _positions(nc_y, pitch_y)
-    _place_contacts(c, inner_xs, inner_ys)
+    contacts.add_contacts(c, 0, 0, nc_x, nc_y, pitch_x, pitch_y)
 
     # Inner metal1
     _inner_metal1(c, wa, la)
@@ -441,7 +443,7 @@ def diode_nd2ps(
         port_type="electrical",
     )
 
-    return c
+    return c.flush()
 
 
 # ---------------------------------------------------------------------------
@@ -472,57 +474,28 @@ def diode_pd2nw(
         p_label: p terminal label.
         n_label: n terminal label.
     """
-    c = gf.Component()
-
-    diff_surround = 0.065
-    lvpwell_enc = 0.12
-
-    if volt == "3.3V":
-        # Inner guard ring
-        ig_inner_offset = 0.300  # guard_inner = wa/2 + this
-        ig_outer_offset = 0.680  # guard_outer = wa/2 + this
-        ig_contact_inset = 0.190
-        nw_enc = 0.12
-        nplus_enc_out = 0.16  # nplus outer enc on ig_outer
-        nplus_enc_in = 0.090  # nplus inner enc on ig_inner (inward)
-        lvpwell_enc = 0.12
-        # Outer guard ring (relative to inner guard outer)
-        og_inner_gap = 0.450  # outer_guard_inner = inner_guard_outer + this
-        og_strip = 0.360  # outer_guard_outer = outer_guard_inner + this
-        # outer_guard_outer = inner_guard_outer + 0.450 + 0.360 = inner_guard_outer + 0.810
-        og_contact_inset = 0.180
-        dg_enc = 0.24
-    else:  # 6.0V
-        ig_inner_offset = 0.360
-        ig_outer_offset = 0.720
-        ig_contact_inset = 0.180
-        nw_enc = 0.16
-        nplus_enc_out = 0.16
-        nplus_enc_in = 0.070  # nplus inner enc (inward) for 6.0V
-        lvpwell_enc = 0.16
-        og_inner_gap = 0.520
-        og_strip = 0.360
-        og_contact_inset = 0.180
-        dg_enc = 0.24
+    c = shapes.ShapeBuffer(gf.Component())
+
+    deck = "3.3V" if volt == "3.3V" else "6.0V"
+    rules = rule_deck(deck)
+    diff_surround = rules.diff_surround
+    nw_enc = rules.sub_surround  # nwell beyond the inner ring
+    lvpwell_enc = rules.sub_surround  # lvpwell beyond the outer ring
+    nplus_enc_out = 0.16  # nplus outer enc on ig_outer
+    dg_enc = 0.24
+    rings = _PD2NW_RINGS[deck]
+    nplus_enc_in = rings.nplus_enc_in
 
     hw = wa / 2
     hl = la / 2
 
     # Inner guard ring geometry
-    ig_inner_x = round(hw + ig_inner_offset, 4)
-    ig_inner_y = round(hl + ig_inner_offset, 4)
-    ig_outer_x = round(hw + ig_outer_offset, 4)
-    ig_outer_y = round(hl + ig_outer_offset, 4)
-    ig_contact_x = round(ig_outer_x - ig_contact_inset, 4)
-    ig_contact_y = round(ig_outer_y - ig_contact_inset, 4)
-
-    # Outer guard ring geometry
-    og_inner_x = round(ig_outer_x + og_inner_gap, 4)
-    og_inner_y = round(ig_outer_y + og_inner_gap, 4)
-    og_outer_x = round(og_inner_x + og_strip, 4)
-    og_outer_y = round(og_inner_y + og_strip, 4)
-    og_contact_x = round(og_outer_x - og_contact_inset, 4)
-    og_contact_y = round(og_outer_y - og_contact_inset, 4)
+    ig_inner_x, ig_outer_x, ig_contact_x = _guard_edges(hw, rings.inner)
+    ig_inner_y, ig_outer_y, ig_contact_y = _guard_edges(hl, rings.inner)
+
+    # Outer guard ring geometry (relative to the inner ring's outer edge)
+    og_inner_x, og_outer_x, og_contact_x = _guard_edges(ig_outer_x, rings.outer)
+    og_inner_y, og_outer_y, _ = _guard_edges(ig_outer_y, rings.outer)
 
     # Contact counts
     nc_x = _nc_inner(wa)
@@ -552,9 +525,7 @@ def diode_pd2nw(
     ).move((-pplus_hw, -pplus_hl))
 
     # Inner contacts
-    inner_xs = _positions(nc_x, pitch_x)
-    inner_ys = _positions(nc_y, pitch_y)
-    _place_contacts(c, inner_xs, inner_ys)
+    contacts.add_contacts(c, 0, 0, nc_x, nc_y, pitch_x, pitch_y)
 
     # Inner metal1
     _inner_metal1(c, wa, la)
@@ -592,9 +563,8 @@ def diode_pd2nw(
     _guard_metal1(c, og_inner_x, og_inner_y, og_outer_x, og_outer_y, diff_surround)
 
     # Outer guard ring contacts (left/right columns only, no top/bottom rows)
-    og_gy_positions = _positions(nc_outer_side_y, 0.47)
-    _place_contacts(c, [-og_contact_x], og_gy_positions)
-    _place_contacts(c, [og_contact_x], og_gy_positions)
+    contacts.add_contacts(c, -og_contact_x, 0, 1, nc_outer_side_y)
+    contacts.add_contacts(c, og_contact_x, 0, 1, nc_outer_side_y)
 
     # LVPWELL: ring (outer guard ring to nwell boundary)
     lvp_outer_x = round(og_outer_x + lvpwell_enc, 4)
@@ -633,7 +603,7 @@ def diode_pd2nw(
         port_type="electrical",
     )
 
-    return c
+    return c.flush()
 
 
 # ---------------------------------------------------------------------------
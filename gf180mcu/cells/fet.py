@@ -22,11 +22,16 @@ The total envelope is conserved (0.23/2 + 0.065 = 0.22/2 + 0.07 = 0.18).
 
 from __future__ import annotations
 
-from math import floor
+import functools
+from typing import NamedTuple
 
 import gdsfactory as gf
+import numpy as np
 from gdsfactory.typings import Strs
 
+from gf180mcu.cells import contacts, shapes
+from gf180mcu.cells.guardring import pcmpgr_gen
+from gf180mcu.cells.rules import DECKS, rule_deck
 from gf180mcu.layers import layer
 
 # ---------------------------------------------------------------------------
@@ -41,45 +46,26 @@ def _snap(v: float) -> float:
     return round(round(v / _GRID) * _GRID, 4)
 
 
-# ---------------------------------------------------------------------------
-# Magic ruleset (from gf180mcu::ruleset in open_pdks gf180mcu.tcl)
-# These are the "painted" values used for all geometric computations.
-# ---------------------------------------------------------------------------
+def _on_grid(v: float) -> bool:
+    """True if *v* is already a 5 nm grid point."""
+    return abs(v / _GRID - round(v / _GRID)) < 1e-6
+
 
-_RULES = dict(
-    contact_size=0.23,
-    poly_surround=0.065,
-    diff_surround=0.065,
-    gate_to_diffcont=0.26,
-    gate_to_polycont=0.28,
-    gate_extension=0.22,
-    diff_extension=0.23,
-    metal_surround=0.055,
-    sub_surround=0.12,
-    diff_spacing=0.33,
-    poly_spacing=0.24,
-    diff_poly_space=0.10,
-    diff_gate_space=0.11,
-    metal_spacing=0.23,
-)
-
-# Physical GDS dimensions (after CIF conversion)
-_CIF_CONTACT_CUT = 0.22  # contact cut on GDS layer 33
-_CIF_DIFF_SURROUND = 0.07  # active/poly surround in GDS
-_CIF_POLY_SURROUND = 0.07  # poly surround in GDS
-_CIF_METAL_SURROUND = 0.06  # metal1 surround in GDS
-_CIF_CONTACT_GAP = 0.25  # min gap between contact cuts
-_CIF_CONTACT_PITCH = 0.47  # _CIF_CONTACT_CUT + _CIF_CONTACT_GAP
+# Physical GDS dimensions (after CIF conversion), the same in every deck
+_CIF_CONTACT_CUT = DECKS["3.3V"].cif_contact_cut  # contact cut on GDS layer 33
+_CIF_DIFF_SURROUND = DECKS["3.3V"].cif_diff_surround  # active surround in GDS
+_CIF_POLY_SURROUND = DECKS["3.3V"].cif_poly_surround  # poly surround in GDS
+_CIF_METAL_SURROUND = DECKS["3.3V"].cif_metal_surround  # metal1 surround in GDS
 
 # Layer aliases
 _L_COMP = layer["comp"]
 _L_POLY = layer["poly2"]
 _L_PPLUS = layer["pplus"]
 _L_NPLUS = layer["nplus"]
-_L_CONTACT = layer["contact"]
 _L_METAL1 = layer["metal1"]
 _L_NWELL = layer["nwell"]
 _L_LVPWELL = layer["lvpwell"]
+_L_DNWELL = layer["dnwell"]
 _L_DUALGATE = layer["dualgate"]
 _L_V5XTOR = layer["v5_xtor"]
 _L_SAB = layer["sab"]
@@ -91,62 +77,20 @@ _L_PR_BNDRY = layer["pr_bndry"]
 
 
 # ---------------------------------------------------------------------------
-# Helper: add a snapped rectangle
-# ---------------------------------------------------------------------------
-
-
-def _rect(c, x0, y0, x1, y1, layer_spec):
-    x0, y0, x1, y1 = _snap(x0), _snap(y0), _snap(x1), _snap(y1)
-    if abs(x1 - x0) < 1e-6 or abs(y1 - y0) < 1e-6:
-        return
-    c.add_polygon([(x0, y0), (x1, y0), (x1, y1), (x0, y1)], layer=layer_spec)
-
-
-# ---------------------------------------------------------------------------
-# Contact cut array — places 0.22 x 0.22 cuts with 0.47 pitch
+# Helper: add a rectangle, snapped and bulk-inserted by the ShapeBuffer
 # ---------------------------------------------------------------------------
 
 
-def _contact_cuts(c, cx, cy, w_envelope, h_envelope):
-    """Place contact cuts within an envelope of size (w_envelope, h_envelope)
-    centered at (cx, cy).
+def _new_component() -> shapes.ShapeBuffer:
+    """Return an empty component wrapped in a 5 nm-snapping ShapeBuffer.
 
-    The envelope is the painted region size (using Magic's contact_size).
-    Physical cuts are 0.22x0.22 within this envelope.
+    Duplicate shapes of the shared S/D contacts are merged away on flush.
     """
-    cut = _CIF_CONTACT_CUT
-    pitch = _CIF_CONTACT_PITCH
+    return shapes.ShapeBuffer(gf.Component(), grid=_GRID, merge=True)
 
-    # Available space for cuts (envelope minus the 0.005 CIF shrink per side)
-    # The envelope matches the painted contact region. Within it, cuts are placed.
-    # Number of cuts based on the envelope size converted to physical space.
-    # Effective size = envelope (which is already the physical contact extent)
-    # Actually, the envelope equals the painted size, and in the CIF output,
-    # the contact region shrinks by 0.005/side. So physical contact region
-    # = envelope - 2*0.005 per axis. For a single contact:
-    # painted 0.23 -> physical 0.22 cut. For larger regions, multiple cuts
-    # are placed within the physical area.
 
-    # For a region painted as contact_size x H:
-    # If H = 0.23, one cut of 0.22 fits.
-    # If H > 0.23, multiple cuts of 0.22 with 0.25 gap.
-    # Physical area = H - 0.01 (0.005 shrink per side)
-    # Number of cuts = floor((phys_H - cut) / pitch) + 1
-
-    phys_w = max(w_envelope - 0.01, cut)
-    phys_h = max(h_envelope - 0.01, cut)
-
-    nx = max(1, floor((phys_w - cut) / pitch + 1 + 1e-6))
-    ny = max(1, floor((phys_h - cut) / pitch + 1 + 1e-6))
-
-    span_x = (nx - 1) * pitch
-    span_y = (ny - 1) * pitch
-
-    for ix in range(nx):
-        for iy in range(ny):
-            x = _snap(cx - span_x / 2.0 + ix * pitch)
-            y = _snap(cy - span_y / 2.0 + iy * pitch)
-            _rect(c, x - cut / 2, y - cut / 2, x + cut / 2, y + cut / 2, _L_CONTACT)
+def _rect(c, x0, y0, x1, y1, layer_spec):
+    c.add_rect(x0, y0, x1, y1, layer_spec)
 
 
 # ---------------------------------------------------------------------------
@@ -164,9 +108,9 @@ def _draw_contact(c, cx, cy, w, h, rules, active_layer, orient="vert", no_cuts=F
 
     Returns (ax0, ay0, ax1, ay1): active/poly surround bounding box.
     """
-    contact_size = rules["contact_size"]
-    diff_surround = rules["diff_surround"]
-    metal_surround = rules["metal_surround"]
+    contact_size = rules.contact_size
+    diff_surround = rules.diff_surround
+    metal_surround = rules.metal_surround
 
     # Enforce minimum painted size
     cw = max(w, contact_size)
@@ -175,9 +119,10 @@ def _draw_contact(c, cx, cy, w, h, rules, active_layer, orient="vert", no_cuts=F
     hw = cw / 2.0
     hh = ch / 2.0
 
-    # Contact cuts (physical 0.22 within the painted region)
+    # Contact cuts: the painted region shrinks by 0.005/side in CIF, and
+    # 0.22 cuts at 0.47 pitch are centered within what remains.
     if not no_cuts:
-        _contact_cuts(c, cx, cy, cw, ch)
+        contacts.fill_contacts(c, cx, cy, cw, ch, snap=_snap)
 
     # Active/poly surround (CIF bloats painted diff_surround to physical)
     # The total extent = hw + diff_surround (painted) stays the same.
@@ -223,12 +168,13 @@ def _guard_ring(
     """Draw guard ring centered at origin.
 
     gx, gy: guard ring size measured to contact centers (painted coords).
+    sub_layer None leaves out the substrate/well layer.
     """
-    contact_size = rules["contact_size"]
-    diff_surround = rules["diff_surround"]
-    metal_surround = rules["metal_surround"]
-    metal_spacing = rules["metal_spacing"]
-    sub_surround = rules["sub_surround"]
+    contact_size = rules.contact_size
+    diff_surround = rules.diff_surround
+    metal_surround = rules.metal_surround
+    metal_spacing = rules.metal_spacing
+    sub_surround = rules.sub_surround
 
     hx = contact_size / 2.0
     hw = gx / 2.0
@@ -274,7 +220,8 @@ def _guard_ring(
 
     # Substrate/well layer
     sub_ext = hx + diff_surround + sub_surround
-    _rect(c, -hw - sub_ext, -hh - sub_ext, hw + sub_ext, hh + sub_ext, sub_layer)
+    if sub_layer is not None:
+        _rect(c, -hw - sub_ext, -hh - sub_ext, hw + sub_ext, hh + sub_ext, sub_layer)
 
     return (-hw - sub_ext, -hh - sub_ext, hw + sub_ext, hh + sub_ext)
 
@@ -293,10 +240,10 @@ def _guard_ring_implant(c, gx, gy, implant_layer, rules):
     For pplus (NFET guard ring): 8 rectangles with ~0.02/0.03 bloat
     For nplus (PFET guard ring): 4 rectangles with ~0.16 bloat
     """
-    contact_size = rules["contact_size"]
-    diff_surround = rules["diff_surround"]
-    metal_surround = rules["metal_surround"]
-    metal_spacing = rules["metal_spacing"]
+    contact_size = rules.contact_size
+    diff_surround = rules.diff_surround
+    metal_surround = rules.metal_surround
+    metal_spacing = rules.metal_spacing
 
     hw = gx / 2.0
     hh = gy / 2.0
@@ -407,7 +354,7 @@ def _guard_ring_implant(c, gx, gy, implant_layer, rules):
         # PFET guard ring: nplus with outer bloat 0.16, inner bloat varies
         enc_out = 0.16
         # Inner bloat depends on voltage variant (from CIF rules)
-        volt = rules.get("volt", "3.3V")
+        volt = rules.volt
         if volt in ("5.0V", "6.0V", "10.0V"):
             enc_in = 0.07
         else:
@@ -441,6 +388,52 @@ def _guard_ring_implant(c, gx, gy, implant_layer, rules):
         _rect(c, inner_x, -inner_y, side_outer_x + enc_out, inner_y, implant_layer)
 
 
+# ---------------------------------------------------------------------------
+# Deep N-well — isolated nfet/pfet, with optional P+ guard ring around it
+# ---------------------------------------------------------------------------
+
+
+def _dnwell_ring(hx: float, hy: float) -> gf.Component:
+    """P+ guard ring around a DNWELL of half extents hx, hy at the origin.
+
+    pcmpgr_gen is a cell, so rings are cached on the 5 nm snapped DNWELL
+    size: devices of different W/L with the same DNWELL share one ring
+    instead of rebuilding it through gf.boolean.
+    """
+    dn_rect = functools.partial(
+        gf.components.rectangle,
+        size=(_snap(2 * hx), _snap(2 * hy)),
+        layer=_L_DNWELL,
+        centered=True,
+    )
+    return pcmpgr_gen(dn_rect=dn_rect)
+
+
+def _deep_nwell(c, gx, gy, rules, is_nfet=True, pcmpgr=False):
+    """Draw the DNWELL around a device whose guard ring measures gx x gy.
+
+    An nfet keeps its LVPWELL (drawn here too if there is no guard ring)
+    and the DNWELL encloses it by rules.dnwell_enc_lvpwell. A pfet sits in
+    the DNWELL instead of an NWELL, which encloses the N+ guard ring
+    diffusion by rules.dnwell_enc_comp, like the DNWELL diodes enclose their
+    N+ comp. Returns the DNWELL half extents.
+    """
+    hc = rules.contact_size / 2.0 + rules.diff_surround
+    if is_nfet:
+        sub_ext = hc + rules.sub_surround
+        hx, hy = gx / 2 + sub_ext, gy / 2 + sub_ext
+        _rect(c, -hx, -hy, hx, hy, _L_LVPWELL)
+        enc = rules.dnwell_enc_lvpwell
+    else:
+        hx, hy = gx / 2 + hc, gy / 2 + hc
+        enc = rules.dnwell_enc_comp
+    hx, hy = _snap(hx + enc), _snap(hy + enc)
+    _rect(c, -hx, -hy, hx, hy, _L_DNWELL)
+    if pcmpgr:
+        c.add_ref(_dnwell_ring(hx, hy))
+    return hx, hy
+
+
 # ---------------------------------------------------------------------------
 # Device implant
 # ---------------------------------------------------------------------------
@@ -539,15 +532,15 @@ def _mos_geometry(w, l, rules, topc=True, botc=True):
     All values in Magic's "painted" coordinate space.
     """
     eps = 0.0005
-    contact_size = rules["contact_size"]
-    diff_surround = rules["diff_surround"]
-    poly_surround = rules["poly_surround"]
-    metal_surround = rules["metal_surround"]
-    gate_to_diffcont = rules["gate_to_diffcont"]
-    gate_to_polycont = rules["gate_to_polycont"]
-    gate_extension = rules["gate_extension"]
-    diff_extension = rules["diff_extension"]
-    diff_poly_space = rules["diff_poly_space"]
+    contact_size = rules.contact_size
+    diff_surround = rules.diff_surround
+    poly_surround = rules.poly_surround
+    metal_surround = rules.metal_surround
+    gate_to_diffcont = rules.gate_to_diffcont
+    gate_to_polycont = rules.gate_to_polycont
+    gate_extension = rules.gate_extension
+    diff_extension = rules.diff_extension
+    diff_poly_space = rules.diff_poly_space
 
     hw = w / 2.0
     hl = l / 2.0
@@ -682,9 +675,9 @@ def _draw_mos_finger(
     cpl = geom["cpl"]
     cdwmin = geom["cdwmin"]
 
-    contact_size = rules["contact_size"]
-    diff_surround = rules["diff_surround"]
-    poly_surround = rules["poly_surround"]
+    contact_size = rules.contact_size
+    diff_surround = rules.diff_surround
+    poly_surround = rules.poly_surround
 
     # Drain/source sides
     if evens == 1:
@@ -717,7 +710,7 @@ def _draw_mos_finger(
     if asym:
         # Asymmetric: source side comp extends from -(hl - sub_surround)
         # to source contact outer. Drain comp is only from draw_contact.
-        sub_surround_v = rules.get("sub_surround", 0.12)
+        sub_surround_v = rules.sub_surround
         if sside == -1:
             # Source on left, drain on right
             _rect(c, source_left, cy - hw, cx + hl - sub_surround_v, cy + hw, _L_COMP)
@@ -767,7 +760,7 @@ def _draw_mos_finger(
         # Asymmetric drain: L-shaped comp (ldndiffc CIF output)
         # Outer part (metal surround area): full hw
         # Inner part (contact cut area): hw - diff_surround
-        metal_surround = rules["metal_surround"]
+        metal_surround = rules.metal_surround
         cw_d = max(0, contact_size)
         ch_d = max(cdw, contact_size)
         ms_phys = _CIF_METAL_SURROUND  # 0.06
@@ -910,6 +903,65 @@ def _draw_mos_finger(
     )
 
 
+# ---------------------------------------------------------------------------
+# Hierarchical fingers — one subcell per finger orientation, placed as arrays
+# ---------------------------------------------------------------------------
+
+
+@gf.cell
+def _mos_finger(
+    w: float,
+    l: float,
+    volt: str,
+    evens: int = 1,
+    topc: bool = True,
+    botc: bool = True,
+    dss: bool = False,
+    asym: bool = False,
+) -> gf.Component:
+    """One MOS finger centered at the origin, extents stored in info."""
+    c = _new_component()
+    rules = rule_deck(volt)
+    geom = _mos_geometry(w, l, rules, topc, botc)
+    c.info["finger"] = _draw_mos_finger(
+        c, 0, 0, geom, rules, evens=evens, topc=topc, botc=botc, dss=dss, asym=asym
+    )
+    return c.flush()
+
+
+def _shift_finger(result, fx, fy=0.0):
+    """Return the extents of a finger drawn at the origin, moved by (fx, fy)."""
+
+    def box(b):
+        return (_snap(b[0] + fx), _snap(b[1] + fy), _snap(b[2] + fx), _snap(b[3] + fy))
+
+    shifted = {k: box(result[k]) for k in ("cext", "active", "channel", "gate")}
+    shifted["dogbone_tabs"] = [box(t) for t in result["dogbone_tabs"]]
+    shifted["drain_cx"] = _snap(result["drain_cx"] + fx)
+    shifted["source_cx"] = _snap(result["source_cx"] + fx)
+    return shifted
+
+
+def _place_fingers(c, w, l, nf, start_x, dx, rules, topc, botc, dss, asym):
+    """Place nf alternating fingers as two instance arrays at pitch 2 * dx.
+
+    Even fingers (drain left) and odd fingers (drain right) are separate
+    subcells. Only valid when the finger origins and half gate length are on
+    the 5 nm grid, so that snapping inside the subcell equals snapping in
+    place. Returns the per-finger extents, as drawn flat by _mos_draw.
+    """
+    results = [None] * nf
+    for evens, first in ((1, 0), (0, 1)):
+        finger = _mos_finger(w, l, rules.volt, evens, topc, botc, dss, asym)
+        columns = len(range(first, nf, 2))
+        c.add_ref(finger, columns=columns, column_pitch=_snap(2 * dx)).move(
+            (_snap(start_x + first * dx), 0)
+        )
+        for i in range(first, nf, 2):
+            results[i] = _shift_finger(finger.info["finger"], start_x + i * dx)
+    return results
+
+
 # ---------------------------------------------------------------------------
 # Main MOS drawing — replicates gf180mcu::mos_draw
 # ---------------------------------------------------------------------------
@@ -928,13 +980,23 @@ def _mos_draw(
     full_metal=True,
     dss=False,
     asym=False,
+    hierarchical=False,
+    deepnwell=False,
+    pcmpgr=False,
 ):
-    """Draw complete MOSFET with guard ring."""
-    contact_size = rules["contact_size"]
-    diff_surround = rules["diff_surround"]
-    diff_spacing = rules["diff_spacing"]
-    diff_gate_space = rules["diff_gate_space"]
-    gate_extension = rules["gate_extension"]
+    """Draw complete MOSFET with guard ring.
+
+    With hierarchical=True the fingers are placed as instance arrays of a
+    single-finger subcell instead of being drawn flat; the flattened geometry
+    is identical. Falls back to flat drawing when the finger pitch is off the
+    5 nm grid. deepnwell isolates the device in a DNWELL (see _deep_nwell),
+    pcmpgr adds the P+ guard ring around it.
+    """
+    contact_size = rules.contact_size
+    diff_surround = rules.diff_surround
+    diff_spacing = rules.diff_spacing
+    diff_gate_space = rules.diff_gate_space
+    gate_extension = rules.gate_extension
 
     geom = _mos_geometry(w, l, rules, topc, botc)
     fw = geom["fw"]
@@ -970,7 +1032,7 @@ def _mos_draw(
     else:
         gr_implant = _L_NPLUS
         dev_implant = _L_PPLUS
-        sub_layer = _L_NWELL
+        sub_layer = None if deepnwell else _L_NWELL
 
     # Draw guard ring
     if guard:
@@ -979,18 +1041,32 @@ def _mos_draw(
 
     # Draw device fingers
     start_x = -(nf - 1) * dx / 2.0
-    evens = 1
-    all_finger_results = []
-    for i in range(nf):
-        fx = start_x + i * dx
-        result = _draw_mos_finger(
-            c, fx, 0, geom, rules, evens=evens, topc=topc, botc=botc, dss=dss, asym=asym
+    if hierarchical and nf > 1 and all(map(_on_grid, (geom["hl"], dx, start_x))):
+        all_finger_results = _place_fingers(
+            c, w, l, nf, start_x, dx, rules, topc, botc, dss, asym
         )
-        all_finger_results.append(result)
-        evens = 1 - evens
+    else:
+        evens = 1
+        all_finger_results = []
+        for i in range(nf):
+            fx = start_x + i * dx
+            result = _draw_mos_finger(
+                c,
+                fx,
+                0,
+                geom,
+                rules,
+                evens=evens,
+                topc=topc,
+                botc=botc,
+                dss=dss,
+                asym=asym,
+            )
+            all_finger_results.append(result)
+            evens = 1 - evens
 
     # Device implant
-    volt = rules.get("volt", "3.3V")
+    volt = rules.volt
     if dss and volt in ("3.3V",) and all_finger_results:
         # 3.3V DSS (ndiffres/pdiffres): implant is active bbox bloated by 0.18.
         act_x0 = min(r["active"][0] for r in all_finger_results)
@@ -1058,7 +1134,7 @@ def _mos_draw(
         def um(v):
             return round(v * 1000)
 
-        sab_enc = rules["gate_extension"]
+        sab_enc = rules.gate_extension
         sab_region = kdb.Region()
         hw_v = geom["hw"]
         cdwmin_v = geom["cdwmin"]
@@ -1092,7 +1168,7 @@ def _mos_draw(
         _draw_region(c, sab_region, _L_SAB)
 
     # --- 10V asymmetric: MVSD ---
-    volt = rules.get("volt", "3.3V")
+    volt = rules.volt
 
     if asym and all_finger_results:
         import klayout.db as kdb
@@ -1105,10 +1181,10 @@ def _mos_draw(
         hw_v = geom["hw"]
         gate_to_diffcont_v = geom["gate_to_diffcont"]
         hl_v = geom["hl"]
-        diff_poly_space_v = rules.get("diff_poly_space", 0.10)
+        diff_poly_space_v = rules.diff_poly_space
         gy_half = gy / 2.0
         gx_half = gx / 2.0
-        sub_surround_v = rules["sub_surround"]
+        sub_surround_v = rules.sub_surround
         mvsd_layer = _L_MVSD if is_nfet else _L_MVPSD
 
         # Y outer extent: gy/2 - 0.14 (constant for 10V process rules)
@@ -1168,7 +1244,7 @@ def _mos_draw(
 
     # Dualgate and V5_XTOR for 5V/6V/10V
     if volt in ("5.0V", "6.0V", "10.0V"):
-        sub_surround = rules["sub_surround"]
+        sub_surround = rules.sub_surround
         hx_c = contact_size / 2.0
         sub_ext = hx_c + diff_surround + sub_surround
         dg_enc = 0.08
@@ -1228,7 +1304,7 @@ def _mos_draw(
         _rect(c, chan_x0 - 0.26, chan_y0 - 0.26, chan_x1 + 0.26, chan_y1 + 0.26, _L_NAT)
 
         # Dualgate for NVT
-        sub_surround = rules["sub_surround"]
+        sub_surround = rules.sub_surround
         hx_c = contact_size / 2.0
         sub_ext = hx_c + diff_surround + sub_surround
         dg_enc = 0.08
@@ -1241,9 +1317,300 @@ def _mos_draw(
             _L_DUALGATE,
         )
 
+    if deepnwell:
+        dn_x, dn_y = _deep_nwell(c, gx, gy, rules, is_nfet, pcmpgr)
+        if volt in ("5.0V", "6.0V", "10.0V"):
+            dg = rules.dualgate_enc_dnwell
+            _rect(c, -(dn_x + dg), -(dn_y + dg), dn_x + dg, dn_y + dg, _L_DUALGATE)
+
     # prBoundary removed — Magic's 10x FIXED_BBOX is unnecessarily large
 
 
+# ---------------------------------------------------------------------------
+# Footprint — device extents and terminal positions without drawing
+# ---------------------------------------------------------------------------
+
+
+class FetFootprint(NamedTuple):
+    """Extents and terminal positions of an nfet/pfet, in um.
+
+    drain, source and gate hold the (x, y) centers of the S/D contacts and
+    the poly contacts per finger; bulk holds the guard ring side contacts.
+    """
+
+    bbox: tuple[float, float, float, float]
+    area: float
+    pitch: float
+    drain: tuple[tuple[float, float], ...]
+    source: tuple[tuple[float, float], ...]
+    gate: tuple[tuple[float, float], ...]
+    bulk: tuple[tuple[float, float], ...]
+
+
+def _snap_array(v):
+    return np.round(np.rint(np.asarray(v) / _GRID) * _GRID, 4)
+
+
+def _geometry_arrays(w, l, rules):
+    """Vectorized _mos_geometry for topc = botc = True, plus the finger pitch."""
+    eps = 0.0005
+    cs = rules.contact_size
+    ds = rules.diff_surround
+    ps = rules.poly_surround
+    hc = cs / 2.0
+    hw = w / 2.0
+    hl = l / 2.0
+
+    # Dogbone rules
+    cdwmin = cs + 2 * ds
+    cplmin = cs + 2 * ps
+    narrow = (w + eps) < cdwmin
+    short = (l + eps) < cplmin
+    cgrow = rules.diff_poly_space - (rules.gate_to_diffcont - cdwmin / 2.0)
+    cgrow_p = rules.diff_poly_space - (rules.gate_to_polycont - cplmin / 2.0)
+    gtd = rules.gate_to_diffcont + np.where(narrow, max(cgrow, 0.0), 0.0)
+    gtp = rules.gate_to_polycont + np.where(short, max(cgrow_p, 0.0), 0.0)
+    gtp = gtp + np.where(narrow & short, (cplmin - w) / 2.0, 0.0)
+
+    diff_grow = np.where(rules.diff_extension > gtd, rules.diff_extension, gtd + hc)
+    poly_ext = np.maximum(rules.gate_extension, gtp)
+    fw = 2 * (hl + diff_grow + ds)
+    fh = 2 * hw + 2 * np.maximum(poly_ext, gtp + ps + hc)
+    return dict(
+        hw=hw,
+        hl=hl,
+        narrow=narrow,
+        gtd=gtd,
+        gtp=gtp,
+        poly_ext=poly_ext,
+        fw=fw,
+        fh=fh,
+        dx=fw - (ds * 2 + cs),  # tiling pitch, diffusion contacts overlap
+    )
+
+
+def _footprint_arrays(w, l, nf, guard, rules, is_nfet=True):
+    """Vectorized _mos_draw extents (topc = botc = True).
+
+    Returns the snapped half extents of the device bounding box, the finger
+    pitch, the S/D contact offset from the gate center, the poly contact y
+    and the guard ring contact x, broadcast over the inputs.
+    """
+    w, l, nf, guard = np.broadcast_arrays(
+        np.asarray(w, float), np.asarray(l, float), np.asarray(nf), np.asarray(guard)
+    )
+    volt = rules.volt
+    cs = rules.contact_size
+    ds = rules.diff_surround
+    hc = cs / 2.0
+    cdwmin = cs + 2 * ds
+    g = _geometry_arrays(w, l, rules)
+    hw, hl, narrow, gtd, gtp = g["hw"], g["hl"], g["narrow"], g["gtd"], g["gtp"]
+    poly_ext, fw, fh, dx = g["poly_ext"], g["fw"], g["fh"], g["dx"]
+
+    # Guard ring, as in _mos_draw
+    gx = (nf - 1) * dx + fw + 2 * (rules.diff_spacing + ds) + cs
+    gy = fh + 2 * (rules.diff_gate_space + ds) + cs
+    sub_ext = hc + ds + rules.sub_surround
+
+    # Fingers and their implants
+    span = (nf - 1) * dx / 2.0
+    act_x = span + hl + gtd + hc + ds
+    act_y = np.where(narrow, np.maximum(hw, cdwmin / 2.0), hw)
+    half_x = act_x + (0.26 if volt == "nvt" else 0.16)
+    half_y = np.maximum.reduce(
+        [
+            act_y + 0.16,
+            hw + (0.26 if volt == "nvt" else 0.23),
+            hw + poly_ext,
+            hw + gtp + hc + ds,
+        ]
+    )
+    if volt in ("5.0V", "6.0V", "10.0V", "nvt"):
+        half_x = np.maximum(half_x, gx / 2 + sub_ext + 0.08)
+        half_y = np.maximum(half_y, gy / 2 + sub_ext + 0.08)
+
+    # Guard ring: well, diffusion bars and their implant
+    bar_x = _snap_array(gx / 2 + cdwmin / 2)
+    bar_y = _snap_array(gy / 2 + cdwmin / 2)
+    enc_x, enc_y = (0.03, 0.02) if is_nfet else (0.16, 0.16)
+    half_x = np.where(
+        guard, np.maximum.reduce([half_x, gx / 2 + sub_ext, bar_x + enc_x]), half_x
+    )
+    half_y = np.where(
+        guard, np.maximum.reduce([half_y, gy / 2 + sub_ext, bar_y + enc_y]), half_y
+    )
+
+    return dict(
+        half_x=_snap_array(half_x),
+        half_y=_snap_array(half_y),
+        pitch=dx,
+        span=span,
+        sd_offset=hl + gtd,
+        gate_y=hw + gtp,
+        bulk_x=np.where(guard, gx / 2, np.nan),
+    )
+
+
+def fet_footprints(w, l, nf=1, volt: str = "3.3V", guard=True, pmos: bool = False):
+    """Vectorized fet_footprint over arrays of w, l, nf and guard.
+
+    Args:
+        w: gate widths.
+        l: gate lengths.
+        nf: numbers of fingers.
+        volt: voltage class ("3.3V", "5.0V", "6.0V", "10.0V", "nvt").
+        guard: whether each device has a guard ring.
+        pmos: pfet instead of nfet.
+
+    Returns:
+        dict of arrays broadcast over the inputs: bbox (..., 4), area,
+        pitch (finger pitch), sd_x (leftmost S/D contact x, the others
+        follow at pitch), gate_y (poly contact y, mirrored at -gate_y) and
+        bulk_x (guard ring contact x, nan without guard ring).
+    """
+    f = _footprint_arrays(w, l, nf, guard, rule_deck(volt), is_nfet=not pmos)
+    hx, hy = f["half_x"], f["half_y"]
+    return dict(
+        bbox=np.stack([-hx, -hy, hx, hy], axis=-1),
+        area=np.round(4 * hx * hy, 6),
+        pitch=_snap_array(f["pitch"]),
+        sd_x=_snap_array(-f["span"] - f["sd_offset"]),
+        gate_y=_snap_array(f["gate_y"]),
+        bulk_x=_snap_array(f["bulk_x"]),
+    )
+
+
+@functools.cache
+def fet_footprint(
+    w: float,
+    l: float,
+    nf: int = 1,
+    volt: str = "3.3V",
+    guard: bool = True,
+    pmos: bool = False,
+) -> FetFootprint:
+    """Returns the bounding box and terminal positions of nfet/pfet.
+
+    Same arguments as the cells (w_gate, l_gate, nf, volt, grw > 0) but
+    nothing is drawn, so it is cheap enough for sizing loops. Fingers
+    alternate drain left / drain right starting with the leftmost one, as
+    drawn by _mos_draw.
+
+    Args:
+        w: gate width.
+        l: gate length.
+        nf: number of fingers.
+        volt: voltage class ("3.3V", "5.0V", "6.0V", "10.0V", "nvt").
+        guard: with guard ring.
+        pmos: pfet instead of nfet.
+    """
+    f = _footprint_arrays(w, l, nf, guard, rule_deck(volt), is_nfet=not pmos)
+    hx, hy = float(f["half_x"]), float(f["half_y"])
+    dx, off, gy = float(f["pitch"]), float(f["sd_offset"]), float(f["gate_y"])
+    xs = [-float(f["span"]) + i * dx for i in range(nf)]
+    drain = [_snap(x + off if i % 2 else x - off) for i, x in enumerate(xs)]
+    source = [_snap(x - off if i % 2 else x + off) for i, x in enumerate(xs)]
+    gx = float(f["bulk_x"])
+    return FetFootprint(
+        bbox=(-hx, -hy, hx, hy),
+        area=round(4 * hx * hy, 6),
+        pitch=_snap(dx),
+        drain=tuple((x, 0.0) for x in dict.fromkeys(drain)),
+        source=tuple((x, 0.0) for x in dict.fromkeys(source)),
+        gate=tuple((_snap(x), _snap(y)) for x in xs for y in (gy, -gy)),
+        bulk=((_snap(-gx), 0.0), (_snap(gx), 0.0)) if guard else (),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Layout-dependent effect and junction parameters
+# ---------------------------------------------------------------------------
+
+
+def _lde_arrays(w, l, nf, rules, asym=False):
+    """Vectorized sa/sb/sd and as/ad/ps/pd of the drawn S/D diffusion, in um.
+
+    Every S/D diffusion reaches from a gate edge to the end of the active
+    (outer) or to the next gate (inner); narrow devices add the dogbone tabs
+    around the contact. The first finger has its drain on the left, so the
+    even S/D contacts are drains. Perimeters include the gate edge
+    (permod = 1 in the BSIM4 models).
+    """
+    w, l, nf = np.broadcast_arrays(
+        np.asarray(w, float), np.asarray(l, float), np.asarray(nf)
+    )
+    cs = rules.contact_size
+    ds = rules.diff_surround
+    hc = cs / 2.0
+    cdwmin = cs + 2 * ds
+    g = _geometry_arrays(w, l, rules)
+
+    outer = g["gtd"] + hc + ds
+    inner = g["dx"] - l
+    height = np.where(g["narrow"], cdwmin, w)
+    tab = np.where(g["narrow"], (cdwmin - w) * cdwmin, 0.0)
+    area = (outer * w + tab, inner * w + tab)
+    perimeter = (2 * (outer + height), 2 * (inner + height))
+    if asym:
+        # L-shaped drain, set back from the gate; shared drains are full
+        # height across both contact surrounds.
+        ms = _CIF_METAL_SURROUND
+        drain_area = ((hc + ds + ms) * w + (hc - ms) * (w - 2 * ds), cdwmin * w)
+        drain_perimeter = (2 * (cs + ds + w), 2 * (cdwmin + w))
+    else:
+        drain_area, drain_perimeter = area, perimeter
+
+    def total(values, n, n_outer):
+        return n_outer * values[0] + (n - n_outer) * values[1]
+
+    n_drain, drain_outer = nf // 2 + 1, 1 + (nf % 2 == 0)
+    n_source, source_outer = (nf + 1) // 2, nf % 2
+    return {
+        "sa": outer,
+        "sb": outer,
+        "sd": np.where(nf > 1, inner, 0.0),
+        "as": total(area, n_source, source_outer),
+        "ad": total(drain_area, n_drain, drain_outer),
+        "ps": total(perimeter, n_source, source_outer),
+        "pd": total(drain_perimeter, n_drain, drain_outer),
+    }
+
+
+def fet_lde_params_batch(
+    w, l, nf=1, volt: str = "3.3V", asym: bool = False
+) -> dict[str, np.ndarray]:
+    """Vectorized fet_lde_params over arrays of w, l and nf."""
+    params = _lde_arrays(w, l, nf, rule_deck(volt), asym)
+    return {k: np.round(v, 6) for k, v in params.items()}
+
+
+@functools.cache
+def _lde_items(w, l, nf, volt, asym):
+    params = _lde_arrays(w, l, nf, rule_deck(volt), asym)
+    return tuple((k, round(float(v), 6)) for k, v in params.items())
+
+
+def fet_lde_params(
+    w: float, l: float, nf: int = 1, volt: str = "3.3V", asym: bool = False
+) -> dict[str, float]:
+    """Returns the BSIM4 LDE and junction instance parameters of nfet/pfet.
+
+    sa, sb and sd (um) are the distances from the outer gate edges to the
+    end of the active and between neighbouring gates; as/ad (um^2) and
+    ps/pd (um) are the total source/drain diffusion areas and perimeters,
+    gate edge included. Scale by 1e-6 and 1e-12 for the SPICE instance.
+
+    Args:
+        w: gate width.
+        l: gate length.
+        nf: number of fingers.
+        volt: voltage class ("3.3V", "5.0V", "6.0V", "10.0V", "nvt").
+        asym: 10V asymmetric device.
+    """
+    return dict(_lde_items(w, l, nf, volt, asym))
+
+
 # ---------------------------------------------------------------------------
 # nfet
 # ---------------------------------------------------------------------------
@@ -1272,9 +1639,13 @@ def nfet(
     patt_label: bool = False,
     dss: bool = False,
     asym: bool = False,
+    hierarchical: bool = False,
 ) -> gf.Component:
     """Return NFET transistor matching Magic VLSI geometry.
 
+    info holds the LDE and junction parameters of the drawn device, see
+    fet_lde_params.
+
     Args:
         l_gate: gate length in microns.
         w_gate: gate width in microns.
@@ -1286,10 +1657,10 @@ def nfet(
         bulk: bulk connection option.
         con_bet_fin: contacts between fingers.
         gate_con_pos: gate contact position ("alternating", "top", "bottom").
-        interdig: interdigitated layout toggle.
-        patt: gate pattern option.
-        deepnwell: deep N-well toggle.
-        pcmpgr: P-comp guard-ring toggle.
+        interdig: interdigitated layout toggle (not drawn, see fet_array).
+        patt: gate pattern option (not drawn, see fet_array).
+        deepnwell: isolate the device in a deep N-well.
+        pcmpgr: P+ guard ring around the deep N-well (with deepnwell).
         label: add text labels.
         sd_label: per-terminal source/drain label strings.
         g_label: gate label strings.
@@ -1297,21 +1668,27 @@ def nfet(
         patt_label: enable pattern labels.
         dss: drain-side symmetric spacing.
         asym: asymmetric layout.
+        hierarchical: place fingers as an instance array of one finger cell.
     """
-    c = gf.Component()
-    rules = dict(_RULES)
-    rules["volt"] = volt
-
-    if volt in ("5.0V", "6.0V", "10.0V"):
-        rules["diff_poly_space"] = 0.30
-        rules["diff_gate_space"] = 0.30
-        rules["diff_spacing"] = 0.36
-        rules["sub_surround"] = 0.16
+    c = _new_component()
+    rules = rule_deck(volt)
 
     _mos_draw(
-        c, w_gate, l_gate, nf, rules, is_nfet=True, guard=grw > 0, dss=dss, asym=asym
+        c,
+        w_gate,
+        l_gate,
+        nf,
+        rules,
+        is_nfet=True,
+        guard=grw > 0,
+        dss=dss,
+        asym=asym,
+        hierarchical=hierarchical,
+        deepnwell=bool(deepnwell),
+        pcmpgr=bool(pcmpgr),
     )
-    return c
+    c.info.update(fet_lde_params(w_gate, l_gate, nf, volt, asym))
+    return c.flush()
 
 
 @gf.cell(tags=["fet"])
@@ -1337,9 +1714,13 @@ def pfet(
     patt_label: bool = False,
     dss: bool = False,
     asym: bool = False,
+    hierarchical: bool = False,
 ) -> gf.Component:
     """Return PFET transistor matching Magic VLSI geometry.
 
+    info holds the LDE and junction parameters of the drawn device, see
+    fet_lde_params.
+
     Args:
         l_gate: gate length in microns.
         w_gate: gate width in microns.
@@ -1351,10 +1732,10 @@ def pfet(
         bulk: bulk connection option.
         con_bet_fin: contacts between fingers.
         gate_con_pos: gate contact position ("alternating", "top", "bottom").
-        interdig: interdigitated layout toggle.
-        patt: gate pattern option.
-        deepnwell: deep N-well toggle.
-        pcmpgr: P-comp guard-ring toggle.
+        interdig: interdigitated layout toggle (not drawn, see fet_array).
+        patt: gate pattern option (not drawn, see fet_array).
+        deepnwell: isolate the device in a deep N-well.
+        pcmpgr: P+ guard ring around the deep N-well (with deepnwell).
         label: add text labels.
         sd_label: per-terminal source/drain label strings.
         g_label: gate label strings.
@@ -1362,21 +1743,27 @@ def pfet(
         patt_label: enable pattern labels.
         dss: drain-side symmetric spacing.
         asym: asymmetric layout.
+        hierarchical: place fingers as an instance array of one finger cell.
     """
-    c = gf.Component()
-    rules = dict(_RULES)
-    rules["volt"] = volt
-
-    if volt in ("5.0V", "6.0V", "10.0V"):
-        rules["diff_poly_space"] = 0.30
-        rules["diff_gate_space"] = 0.30
-        rules["diff_spacing"] = 0.36
-        rules["sub_surround"] = 0.16
+    c = _new_component()
+    rules = rule_deck(volt)
 
     _mos_draw(
-        c, w_gate, l_gate, nf, rules, is_nfet=False, guard=grw > 0, dss=dss, asym=asym
+        c,
+        w_gate,
+        l_gate,
+        nf,
+        rules,
+        is_nfet=False,
+        guard=grw > 0,
+        dss=dss,
+        asym=asym,
+        hierarchical=hierarchical,
+        deepnwell=bool(deepnwell),
+        pcmpgr=bool(pcmpgr),
     )
-    return c
+    c.info.update(fet_lde_params(w_gate, l_gate, nf, volt, asym))
+    return c.flush()
 
 
 @gf.cell(tags=["fet"])
@@ -1400,6 +1787,9 @@ def nfet_06v0_nvt(
 ) -> gf.Component:
     """Return Native NFET 6V transistor matching Magic VLSI geometry.
 
+    info holds the LDE and junction parameters of the drawn device, see
+    fet_lde_params.
+
     Args:
         l_gate: gate length in microns.
         w_gate: gate width in microns.
@@ -1418,11 +1808,9 @@ def nfet_06v0_nvt(
         sub_label: substrate label string.
         patt_label: enable pattern labels.
     """
-    c = gf.Component()
-    rules = dict(_RULES)
-    rules["volt"] = "nvt"
-    rules["gate_extension"] = 0.35
-    rules["sub_surround"] = 0.16
+    c = _new_component()
+    rules = rule_deck("nvt")
 
     _mos_draw(c, w_gate, l_gate, nf, rules, is_nfet=True, guard=grw > 0)
-    return c
+    c.info.update(fet_lde_params(w_gate, l_gate, nf, "nvt"))
+    return c.flush()
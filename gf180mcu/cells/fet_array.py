@@ -0,0 +1,271 @@
+"""Matched transistor arrays (interdigitated / common-centroid) of nfet/pfet.
+
+A pattern such as "ABBA/BAAB" gives one row of gate fingers per "/"
+separated group, one character per finger naming the device it belongs to.
+Every row is one shared diffusion tiled like a multi-finger nfet/pfet, with
+dummy fingers at both ends. The finger to device, S/D contact to net and
+track assignments are computed as NumPy index maps over the whole array;
+the fingers themselves are instance arrays of the cached finger cells of
+gf180mcu.cells.fet.
+
+Routing: every S/D contact runs up on metal1 to a metal2 track of its net
+above the row, every gate down to a metal2 track below the row. Tracks of
+the same net in different rows are joined by a vertical metal1 spine, S/D
+spines on the left and gate spines on the right, where the ports are.
+"""
+
+from __future__ import annotations
+
+import gdsfactory as gf
+import klayout.db as kdb
+import numpy as np
+
+from gf180mcu.cells import fet
+from gf180mcu.cells.rules import rule_deck
+from gf180mcu.layers import layer
+
+_VIA = 0.26  # via1 cut
+_PAD = 0.38  # via1 + 0.06 metal enclosure on each side
+_M1_WIDTH = 0.23  # S/D and gate stubs, as wide as the contact metal
+_M2_SPACE = 0.28
+_PITCH = _PAD + _M2_SPACE  # track and spine pitch
+
+_DUMMY = -1
+
+
+def _index_maps(rows: list[str], devices: str, dummies: int, common_source: bool):
+    """Per-row device, S/D net and gate net index maps of a pattern.
+
+    Returns (grid, sd_net, gate_net, phase) as lists of arrays, one per row:
+    grid holds the device index of every finger (_DUMMY for dummies),
+    sd_net the net of every S/D contact (one more than fingers) and phase
+    whether the first contact of the row is a drain (0) or a source (1).
+    Nets are numbered drains first (one per device), then sources (one, or
+    one per device), then the dummy net.
+    """
+    n = len(devices)
+    source = np.full(n, n) if common_source else n + np.arange(n)
+    dummy_sd = n + (1 if common_source else n)
+    lookup = np.full(128, -2)
+    lookup[[ord(ch) for ch in devices]] = np.arange(n)
+
+    grids, sd_nets, gate_nets, phases = [], [], [], []
+    for row in rows:
+        grid = lookup[np.frombuffer(row.encode("ascii"), np.uint8)]
+        grid = np.pad(grid, dummies, constant_values=_DUMMY)
+        left = np.concatenate([[_DUMMY], grid])
+        right = np.concatenate([grid, [_DUMMY]])
+        clash = (left >= 0) & (right >= 0) & (left != right)
+        j = np.arange(len(left))
+        for phase in (0, 1):
+            drain = (j + phase) % 2 == 0
+            if not np.any(clash & (drain | (not common_source))):
+                break
+        else:
+            raise ValueError(
+                f"Pattern row {row!r} connects {'drains' if common_source else 'S/D'}"
+                " of different devices; pair the fingers as in 'ABBA'."
+            )
+        device = np.where(right >= 0, right, left)
+        sd = np.where(drain, device, source[device])
+        grids.append(grid)
+        sd_nets.append(np.where(device >= 0, sd, dummy_sd))
+        gate_nets.append(np.where(grid >= 0, grid, n))
+        phases.append(phase)
+    return grids, sd_nets, gate_nets, phases
+
+
+def _via(c, x: float, y: float) -> None:
+    """via1 with its metal1 landing pad centered at (x, y)."""
+    h = _PAD / 2
+    c.add_rect(x - h, y - h, x + h, y + h, layer["metal1"])
+    h = _VIA / 2
+    c.add_rect(x - h, y - h, x + h, y + h, layer["via1"])
+
+
+def _enclose(c, impl, v5, core, rules, is_nfet=True, grw=0.22) -> None:
+    """Draw implants, well, dualgate and one guard ring around core.
+
+    impl and v5 are the merged device implant and v5_xtor regions of all
+    fingers; core is the (centered) box the guard ring is sized to, the same
+    way _mos_draw sizes it around the fingers.
+    """
+    volt = rules.volt
+    cs = rules.contact_size
+    ds = rules.diff_surround
+    fet._draw_region(c, impl.merged(), fet._L_NPLUS if is_nfet else fet._L_PPLUS)
+    if volt == "5.0V":
+        fet._draw_region(c, v5.merged(), fet._L_V5XTOR)
+
+    gx = core[2] - core[0] + 2 * (rules.diff_spacing + ds) + cs
+    gy = core[3] - core[1] + 2 * (rules.diff_gate_space + ds) + cs
+    if grw > 0:
+        sub_layer = fet._L_LVPWELL if is_nfet else fet._L_NWELL
+        fet._guard_ring(c, gx, gy, rules, sub_layer)
+        implant = fet._L_PPLUS if is_nfet else fet._L_NPLUS
+        fet._guard_ring_implant(c, gx, gy, implant, rules)
+    if volt in ("5.0V", "6.0V"):
+        ext = cs / 2 + ds + rules.sub_surround + 0.08
+        x, y = gx / 2 + ext, gy / 2 + ext
+        c.add_rect(-x, -y, x, y, fet._L_DUALGATE)
+
+
+@gf.cell(tags=["fet"])
+def fet_array(
+    pattern: str = "ABBA/BAAB",
+    w_gate: float = 1.0,
+    l_gate: float = 0.28,
+    volt: str = "3.3V",
+    pmos: bool = False,
+    dummies: int = 1,
+    common_source: bool = True,
+    grw: float = 0.22,
+) -> gf.Component:
+    """Return a matched nfet/pfet array routed per device.
+
+    Ports are d_<X> and g_<X> per device X, s (or s_<X> without
+    common_source) and sd_dummy/g_dummy for the dummy fingers. info holds
+    the finger count per device.
+
+    Args:
+        pattern: one character per finger naming its device, rows separated
+            by "/", e.g. "ABBA/BAAB" for a common-centroid pair.
+        w_gate: gate width of a finger.
+        l_gate: gate length, a multiple of 10 nm.
+        volt: voltage rating ("3.3V", "5.0V", "6.0V").
+        pmos: pfet instead of nfet.
+        dummies: dummy fingers at each end of every row.
+        common_source: all devices share the source. Otherwise sources are
+            routed per device too, so neighbouring fingers of different
+            devices must not share a contact at all.
+        grw: guard-ring width; set to 0 to disable the guard ring.
+    """
+    if volt not in ("3.3V", "5.0V", "6.0V"):
+        raise ValueError(f"Unsupported volt for fet_array: {volt}")
+    if not fet._on_grid(l_gate / 2):
+        raise ValueError(f"l_gate must be a multiple of 10 nm, got {l_gate}")
+    rows = pattern.split("/")
+    devices = "".join(sorted(set(pattern) - {"/"}))
+    if not devices or not all(rows) or not pattern.isascii():
+        raise ValueError(f"Invalid pattern: {pattern!r}")
+
+    rules = rule_deck(volt)
+    cs = rules.contact_size
+    ds = rules.diff_surround
+    geom = fet._mos_geometry(w_gate, l_gate, rules, topc=False, botc=True)
+    dx = fet._snap(geom["fw"] - (2 * ds + cs))
+    hw, gtp = geom["hw"], geom["gate_to_polycont"]
+    fingers = [fet._mos_finger(w_gate, l_gate, volt, e, False, True) for e in (0, 1)]
+    cext = fingers[1].info["finger"]["cext"]
+
+    grids, sd_nets, gate_nets, phases = _index_maps(
+        rows, devices, dummies, common_source
+    )
+    n = len(devices)
+    sd_names = [f"d_{d}" for d in devices]
+    sd_names += ["s"] if common_source else [f"s_{d}" for d in devices]
+    sd_names += ["sd_dummy"]
+    gate_names = [f"g_{d}" for d in devices] + ["g_dummy"]
+
+    # Vertical layout of a row around its diffusion center: S/D tracks above,
+    # gate tracks below, then stack the rows top to bottom.
+    pad_y = -(hw + gtp)
+    sd_y0 = cext[3] + _M2_SPACE + _PAD / 2
+    gate_y0 = cext[1] - _M2_SPACE - _PAD / 2
+    sd_tracks = [np.unique(s) for s in sd_nets]
+    gate_tracks = [np.unique(g) for g in gate_nets]
+    row_y = [0.0]
+    for r in range(1, len(rows)):
+        bottom = gate_y0 - (len(gate_tracks[r - 1]) - 1) * _PITCH - _PAD / 2
+        top = sd_y0 + (len(sd_tracks[r]) - 1) * _PITCH + _PAD / 2
+        row_y.append(fet._snap(row_y[-1] + bottom - _M2_SPACE - top))
+
+    # Contacts of row r are at x0[r] + j * dx, fingers halfway between.
+    x0 = [fet._snap(-len(g) * dx / 2) for g in grids]
+    x_left = min(x0) - _PAD / 2
+    x_right = max(x + len(g) * dx for x, g in zip(x0, grids)) + _PAD / 2
+    sd_spine = (
+        x_left - rules.metal_spacing - _PAD / 2 - _PITCH * np.arange(len(sd_names))
+    )
+    gate_spine = x_right + rules.metal_spacing + _PAD / 2 + _PITCH * np.arange(n + 1)
+    core = (
+        sd_spine[-1] - _PAD / 2,
+        row_y[-1] + gate_y0 - (len(gate_tracks[-1]) - 1) * _PITCH - _PAD / 2,
+        gate_spine[-1] + _PAD / 2,
+        sd_y0 + (len(sd_tracks[0]) - 1) * _PITCH + _PAD / 2,
+    )
+    ox = fet._snap(-(core[0] + core[2]) / 2)
+    oy = fet._snap(-(core[1] + core[3]) / 2)
+    sd_spine += ox
+    gate_spine += ox
+
+    c = fet._new_component()
+    h = _M1_WIDTH / 2
+    impl = kdb.Region()
+    v5 = kdb.Region()
+    spans = {}
+
+    for r, grid in enumerate(grids):
+        y = row_y[r] + oy
+        xc = x0[r] + ox + dx * np.arange(len(grid) + 1)
+        xf = xc[:-1] + dx / 2
+        for evens, first in ((1, phases[r]), (0, 1 - phases[r])):
+            columns = len(range(first, len(grid), 2))
+            if columns:
+                c.add_ref(fingers[evens], columns=columns, column_pitch=2 * dx).move(
+                    (xf[first], y)
+                )
+        results = [
+            fet._shift_finger(fingers[(i + phases[r] + 1) % 2].info["finger"], x, y)
+            for i, x in enumerate(xf)
+        ]
+        impl += fet._device_implant_region(results, bloat=0.16)
+        v5 += fet._device_implant_region(results, 0, use_gate=False).sized(100)
+
+        for nets, tracks, xs, y_from, y0, step in (
+            (sd_nets[r], sd_tracks[r], xc, y, y + sd_y0, _PITCH),
+            (gate_nets[r], gate_tracks[r], xf, y + pad_y, y + gate_y0, -_PITCH),
+        ):
+            ty = y0 + step * np.searchsorted(tracks, nets)
+            for x, y1 in zip(xs.tolist(), ty.tolist()):
+                c.add_rect(x - h, y_from, x + h, y1, layer["metal1"])
+                _via(c, x, y1)
+            for net, y1 in zip(tracks.tolist(), (y0 + step * np.arange(len(tracks)))):
+                on_track = xs[nets == net]
+                spans.setdefault((step > 0, net), []).append(
+                    (on_track.min(), on_track.max(), y1)
+                )
+
+    ports = []
+    for (is_sd, net), runs in spans.items():
+        spine = (sd_spine if is_sd else gate_spine)[net]
+        for xa, xb, y1 in runs:
+            x1, x2 = min(xa, spine), max(xb, spine)
+            c.add_rect(
+                x1 - _PAD / 2,
+                y1 - _PAD / 2,
+                x2 + _PAD / 2,
+                y1 + _PAD / 2,
+                layer["metal2"],
+            )
+            _via(c, spine, y1)
+        ys = [run[2] for run in runs]
+        y1, y2 = min(ys) - _PAD / 2, max(ys) + _PAD / 2
+        c.add_rect(spine - _PAD / 2, y1, spine + _PAD / 2, y2, layer["metal1"])
+        name = (sd_names if is_sd else gate_names)[net]
+        ports.append((name, spine, y2 if is_sd else y1, 90 if is_sd else 270))
+
+    _enclose(c, impl, v5, core, rules, not pmos, grw)
+
+    for name, x, y, orientation in sorted(ports):
+        c.add_port(
+            name=name,
+            center=(fet._snap(x), fet._snap(y)),
+            width=_PAD,
+            orientation=orientation,
+            layer=layer["metal1"],
+            port_type="electrical",
+        )
+    counts = np.bincount(np.concatenate(grids) + 1, minlength=n + 1)[1:]
+    c.info["fingers"] = dict(zip(devices, counts.tolist()))
+    return c.flush()
@@ -0,0 +1,165 @@
+"""Series/parallel nfet/pfet stacks sharing diffusion between devices.
+
+A stack is an ordered list of gates, each given as (w, l, gate, left, right)
+with the nets of the gate and of the S/D contacts left and right of it.
+Neighbouring gates abut at Magic's finger pitch from _mos_draw (hl + gtd of
+one gate plus hl + gtd of the next), sharing one S/D contact, whenever the
+contact nets match and the gate widths are equal. Otherwise the diffusion is
+broken at diff_spacing. Different widths cannot share a contact: the wide
+contact's active would end closer than diff_poly_space to the narrow gate.
+
+The gates are instances of the cached finger cells of gf180mcu.cells.fet,
+the whole stack gets one guard ring. Routing follows fet_array: S/D
+contacts go up to a metal2 track per net, gates down to a metal2 track per
+net, and every net has one metal1 spine on the left, where its port is.
+"""
+
+from __future__ import annotations
+
+import gdsfactory as gf
+
+from gf180mcu.cells import fet
+from gf180mcu.cells.fet_array import (
+    _M1_WIDTH,
+    _M2_SPACE,
+    _PAD,
+    _PITCH,
+    _enclose,
+    _via,
+)
+from gf180mcu.cells.rules import rule_deck
+from gf180mcu.layers import layer
+
+Gate = tuple[float, float, str, str, str]
+
+
+def _ordered(names) -> list[str]:
+    return list(dict.fromkeys(names))
+
+
+@gf.cell(tags=["fet"])
+def fet_stack(
+    gates: tuple[Gate, ...] = (
+        (1.0, 0.28, "a", "out", "x"),
+        (1.0, 0.28, "b", "x", "vss"),
+    ),
+    volt: str = "3.3V",
+    pmos: bool = False,
+    grw: float = 0.22,
+) -> gf.Component:
+    """Return a stack of nfet/pfet gates sharing diffusion, in one guard ring.
+
+    The default is the series pull-down of a 2-input NAND. Ports are named
+    after the nets, on the metal1 spine of every net. info holds the number
+    of diffusions the stack is drawn with.
+
+    Args:
+        gates: (w, l, gate, left, right) per gate from left to right: gate
+            width, gate length (a multiple of 10 nm) and the nets of the
+            gate and of its left and right S/D contact.
+        volt: voltage rating ("3.3V", "5.0V", "6.0V").
+        pmos: pfet instead of nfet.
+        grw: guard-ring width; set to 0 to disable the guard ring.
+    """
+    if volt not in ("3.3V", "5.0V", "6.0V"):
+        raise ValueError(f"Unsupported volt for fet_stack: {volt}")
+    if not gates or any(len(g) != 5 for g in gates):
+        raise ValueError(f"gates must be (w, l, gate, left, right) tuples: {gates}")
+    for g in gates:
+        if not fet._on_grid(g[1] / 2):
+            raise ValueError(f"l must be a multiple of 10 nm, got {g[1]}")
+
+    rules = rule_deck(volt)
+    fingers = [fet._mos_finger(w, l, volt, 1, False, True) for w, l, *_ in gates]
+    extents = [f.info["finger"] for f in fingers]
+
+    # Gate x positions: abut at the contact pitch or break the diffusion.
+    xf = [0.0]
+    contacts = [(extents[0]["drain_cx"], gates[0][3])]
+    diffusions = 1
+    for i in range(1, len(gates)):
+        prev, cur = extents[i - 1], extents[i]
+        if gates[i - 1][4] == gates[i][3] and gates[i - 1][0] == gates[i][0]:
+            step = prev["source_cx"] - cur["drain_cx"]
+            contacts.append((xf[-1] + prev["source_cx"], gates[i][3]))
+        else:
+            step = prev["cext"][2] + rules.diff_spacing - cur["cext"][0]
+            contacts.append((xf[-1] + prev["source_cx"], gates[i - 1][4]))
+            contacts.append((xf[-1] + step + cur["drain_cx"], gates[i][3]))
+            diffusions += 1
+        xf.append(fet._snap(xf[-1] + step))
+    contacts.append((xf[-1] + extents[-1]["source_cx"], gates[-1][4]))
+    contacts = _ordered((fet._snap(x), net) for x, net in contacts)
+
+    sd_nets = _ordered(net for _, net in contacts)
+    gate_nets = _ordered(g[2] for g in gates)
+    nets = _ordered(n for g in gates for n in (g[3], g[2], g[4]))
+
+    top = max(e["cext"][3] for e in extents)
+    bottom = min(e["cext"][1] for e in extents)
+    sd_y = {n: top + _M2_SPACE + _PAD / 2 + k * _PITCH for k, n in enumerate(sd_nets)}
+    gate_y = {
+        n: bottom - _M2_SPACE - _PAD / 2 - k * _PITCH for k, n in enumerate(gate_nets)
+    }
+    x_left = contacts[0][0] - _PAD / 2
+    spine = {
+        n: x_left - rules.metal_spacing - _PAD / 2 - k * _PITCH
+        for k, n in enumerate(nets)
+    }
+    core = (
+        spine[nets[-1]] - _PAD / 2,
+        gate_y[gate_nets[-1]] - _PAD / 2,
+        max(contacts[-1][0] + _PAD / 2, xf[-1] + extents[-1]["cext"][2]),
+        sd_y[sd_nets[-1]] + _PAD / 2,
+    )
+    ox = fet._snap(-(core[0] + core[2]) / 2)
+    oy = fet._snap(-(core[1] + core[3]) / 2)
+
+    c = fet._new_component()
+    results = []
+    for finger, x in zip(fingers, xf):
+        c.add_ref(finger).move((x + ox, oy))
+        results.append(fet._shift_finger(finger.info["finger"], x + ox, oy))
+    impl = fet._device_implant_region(results, bloat=0.16)
+    v5 = fet._device_implant_region(results, 0, use_gate=False).sized(100)
+
+    h = _M1_WIDTH / 2
+    runs: dict[str, list[tuple[float, float]]] = {}
+    stubs = [(x, oy, sd_y[net], net) for x, net in contacts]
+    for (w, l, net, *_), x in zip(gates, xf):
+        geom = fet._mos_geometry(w, l, rules, topc=False, botc=True)
+        stubs.append((x, oy - geom["hw"] - geom["gate_to_polycont"], gate_y[net], net))
+    for x, y_from, y, net in stubs:
+        x, y = x + ox, y + oy
+        c.add_rect(x - h, y_from, x + h, y, layer["metal1"])
+        _via(c, x, y)
+        runs.setdefault(net, []).append((x, y))
+
+    for net, points in runs.items():
+        sx = spine[net] + ox
+        ys = sorted({y for _, y in points})
+        for y in ys:
+            x2 = max(x for x, y1 in points if y1 == y)
+            c.add_rect(
+                sx - _PAD / 2,
+                y - _PAD / 2,
+                x2 + _PAD / 2,
+                y + _PAD / 2,
+                layer["metal2"],
+            )
+            _via(c, sx, y)
+        y1, y2 = ys[0] - _PAD / 2, ys[-1] + _PAD / 2
+        c.add_rect(sx - _PAD / 2, y1, sx + _PAD / 2, y2, layer["metal1"])
+        on_top = net in sd_y
+        c.add_port(
+            name=net,
+            center=(fet._snap(sx), fet._snap(y2 if on_top else y1)),
+            width=_PAD,
+            orientation=90 if on_top else 270,
+            layer=layer["metal1"],
+            port_type="electrical",
+        )
+
+    _enclose(c, impl, v5, core, rules, not pmos, grw)
+    c.info["diffusions"] = diffusions
+    return c.flush()
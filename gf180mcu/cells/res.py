@@ -6,75 +6,32 @@ matching Magic's coordinate convention.
 
 from __future__ import annotations
 
-from math import floor
+from typing import NamedTuple
 
 import gdsfactory as gf
 from gdsfactory.typings import LayerSpec
 
+from gf180mcu.cells import contacts, shapes
+from gf180mcu.cells.rules import rule_deck
 from gf180mcu.layers import layer
 
 # ---------------------------------------------------------------------------
-# Magic technology constants (from gf180mcu_generators.tcl ruleset)
+# Magic technology constants (from the 3.3V rule deck)
 # ---------------------------------------------------------------------------
 
-_CONTACT_SIZE = 0.23  # internal contact box size
-_CONTACT_GDS = 0.22  # contact size in GDS (shrunk 0.005 each side by CIF)
-_POLY_SURROUND = 0.065  # poly surrounds contact
-_DIFF_SURROUND = 0.065  # diffusion surrounds contact
-_METAL_SURROUND = 0.055  # metal1 overlaps contact
-_SUB_SURROUND = 0.12  # sub/well overlap of diffusion
-_METAL_SPACING = 0.23  # metal1 spacing
-_CONTACT_PITCH = 0.47  # contact center-to-center spacing (size + min space)
+_RULES = rule_deck("3.3V")
+_CONTACT_SIZE = _RULES.contact_size  # internal contact box size
+_POLY_SURROUND = _RULES.poly_surround  # poly surrounds contact
+_DIFF_SURROUND = _RULES.diff_surround  # diffusion surrounds contact
+_METAL_SURROUND = _RULES.metal_surround  # metal1 overlaps contact
+_SUB_SURROUND = _RULES.sub_surround  # sub/well overlap of diffusion
+_METAL_SPACING = _RULES.metal_spacing  # metal1 spacing
 
 # Derived constants
-_DIFFT = _CONTACT_SIZE + 2 * _DIFF_SURROUND  # 0.36, guard ring bar width
+_DIFFT = _RULES.difft  # 0.36, guard ring bar width
 _HX = _CONTACT_SIZE / 2  # 0.115
 
 
-# ---------------------------------------------------------------------------
-# Contact array helper
-# ---------------------------------------------------------------------------
-
-
-def _contact_array_centers(fill_size: float) -> list[float]:
-    """Return list of 1D contact center offsets for a fill region.
-
-    Contacts of internal size _CONTACT_SIZE are tiled at _CONTACT_PITCH
-    within a fill region of the given size, centered.
-    """
-    if fill_size < _CONTACT_SIZE:
-        fill_size = _CONTACT_SIZE
-    n = floor((fill_size - _CONTACT_SIZE) / _CONTACT_PITCH) + 1
-    n = max(n, 1)
-    span = (n - 1) * _CONTACT_PITCH
-    start = -span / 2
-    return [start + i * _CONTACT_PITCH for i in range(n)]
-
-
-def _draw_contacts_2d(
-    c: gf.Component,
-    cx: float,
-    cy: float,
-    fill_w: float,
-    fill_h: float,
-) -> None:
-    """Draw a 2D array of contacts centered at (cx, cy)."""
-    xs = _contact_array_centers(fill_w)
-    ys = _contact_array_centers(fill_h)
-    hs = _CONTACT_GDS / 2
-    for dx in xs:
-        for dy in ys:
-            c.add_polygon(
-                [
-                    (cx + dx - hs, cy + dy - hs),
-                    (cx + dx + hs, cy + dy - hs),
-                    (cx + dx + hs, cy + dy + hs),
-                    (cx + dx - hs, cy + dy + hs),
-                ],
-                layer=layer["contact"],
-            )
-
-
 # ---------------------------------------------------------------------------
 # Guard ring (matching Magic gf180mcu::guard_ring)
 # ---------------------------------------------------------------------------
@@ -177,9 +134,9 @@ def _guard_ring(
         ch = _CONTACT_SIZE
 
     # Left contacts
-    _draw_contacts_2d(c, -hw, 0, 0, ch)
+    contacts.fill_contacts(c, -hw, 0, 0, ch)
     # Right contacts
-    _draw_contacts_2d(c, hw, 0, 0, ch)
+    contacts.fill_contacts(c, hw, 0, 0, ch)
 
     # 5. Draw sub_type (well) covering entire guard ring + surround
     if draw_well:
@@ -447,7 +404,7 @@ def _draw_end_contact(
     hh = h / 2
 
     # Draw contacts
-    _draw_contacts_2d(c, cx, cy, w, h)
+    contacts.fill_contacts(c, cx, cy, w, h)
 
     # Draw end_type (poly/comp) surrounding contacts
     es = _DIFF_SURROUND if end_layer == layer["comp"] else _POLY_SURROUND
@@ -485,6 +442,83 @@ def _draw_end_contact(
         )
 
 
+# ---------------------------------------------------------------------------
+# Resistor guard rings (per res_type, from the Tcl *_draw procedures)
+# ---------------------------------------------------------------------------
+
+
+class _Ring(NamedTuple):
+    end_spacing: float  # body end to guard ring contact edge
+    res_diff_spacing: float  # body side to guard ring contact edge
+    implant: LayerSpec
+    well: LayerSpec
+    is_psd: bool
+    well_ext_extra: float = 0.0
+    dualgate: bool = False
+
+
+# ppolyf_u: body=pplus(rpp), guard=nsd, well=nwell
+# ppolyf_s: body=pplus(rpps), guard=nsd, well=nwell
+# npolyf_u: body=nplus(rnp), guard=psd, well=pwell
+# npolyf_s: body=nplus(rnps), guard=nsd, well=nwell
+_RINGS: dict[str, _Ring] = {
+    "ppolyf_u": _Ring(0.60, 0.60, layer["nplus"], layer["nwell"], False),
+    "npolyf_u": _Ring(0.60, 0.60, layer["pplus"], layer["lvpwell"], True),
+    "ppolyf_s": _Ring(0.28, 0.41, layer["nplus"], layer["nwell"], False),
+    "npolyf_s": _Ring(0.28, 0.28, layer["nplus"], layer["nwell"], False),
+    "nplus_u": _Ring(0.45, 0.45, layer["pplus"], layer["lvpwell"], True),
+    "pplus_u": _Ring(0.45, 0.45, layer["nplus"], layer["nwell"], False),
+    "ppolyf_u_1k": _Ring(0.7, 0.7, layer["pplus"], layer["lvpwell"], True),
+    # the 6p0 lvpwell extends 0.04 beyond the standard well_ext
+    "ppolyf_u_1k_6p0": _Ring(
+        0.7, 0.7, layer["pplus"], layer["lvpwell"], True, 0.04, True
+    ),
+}
+
+
+def _res_guard_ring(
+    c: gf.Component, res_type: str, fw: float, fh: float
+) -> tuple[float, float]:
+    """Draw the guard ring of res_type around a fw x fh footprint at the origin.
+
+    Returns the ring size (gx, gy), measured to the contact centers.
+    """
+    ring = _RINGS[res_type]
+    gx = fw + 2 * (ring.res_diff_spacing + _DIFF_SURROUND) + _CONTACT_SIZE
+    gy = fh + 2 * (ring.end_spacing + _DIFF_SURROUND) + _CONTACT_SIZE
+
+    _guard_ring(
+        c,
+        gx,
+        gy,
+        plus_diff_layer=layer["comp"],
+        plus_contact_layer=layer["contact"],
+        sub_type_layer=ring.well,
+        implant_layer=ring.implant,
+        implant_bloat=0.02 if ring.is_psd else _NSD_IMPLANT_OUTER_BLOAT,
+        is_psd=ring.is_psd,
+        well_ext_extra=ring.well_ext_extra,
+    )
+
+    if ring.dualgate:
+        # From reference: dualgate = (-1.8, -2.41)-(1.8, 2.41) for w=1, l=1
+        # dualgate extends 0.12 beyond standard lvpwell (without 6p0 extension)
+        well_ext = _HX + _DIFF_SURROUND + _SUB_SURROUND
+        dg_ext = 0.12  # dualgate extends beyond well
+        well_x = gx / 2 + well_ext
+        well_y = gy / 2 + well_ext
+        c.add_polygon(
+            [
+                (-(well_x + dg_ext), -(well_y + dg_ext)),
+                (well_x + dg_ext, -(well_y + dg_ext)),
+                (well_x + dg_ext, well_y + dg_ext),
+                (-(well_x + dg_ext), well_y + dg_ext),
+            ],
+            layer=layer["dualgate"],
+        )
+    return gx, gy
+
+
 # ---------------------------------------------------------------------------
 # Metal resistor (rm1, rm2, rm3)
 # ---------------------------------------------------------------------------
@@ -503,7 +537,7 @@ def _metal_res(
     For metal resistors: end_surround=0.0, res_to_endcont=0.2.
     Extension = 0.2 + 0.115 + 0.0 = 0.315.
     """
-    c = gf.Component()
+    c = shapes.ShapeBuffer(gf.Component())
 
     hw = w / 2
     hl = l / 2
@@ -521,7 +555,10 @@ def _metal_res(
         layer=m_layer,
     )
 
-    return c
+    c.info["end_y"] = hl + ext / 2
+    c.info["end_h"] = ext
+    c.info["body_h"] = l + 2 * ext
+    return c.flush()
 
 
 # ---------------------------------------------------------------------------
@@ -533,9 +570,10 @@ def _poly_res(
     w: float,
     l: float,
     res_type: str,
+    guard: bool = True,
 ) -> gf.Component:
     """Draw a poly resistor with guard ring, centered at origin."""
-    c = gf.Component()
+    c = shapes.ShapeBuffer(gf.Component())
 
     hw = w / 2
     hl = l / 2
@@ -545,8 +583,6 @@ def _poly_res(
         # Unsilicided poly
         res_to_endcont = 0.33  # sblk_to_cont
         end_surround = _POLY_SURROUND  # 0.065
-        end_spacing = 0.60
-        res_diff_spacing = 0.60
         mask_clearance = 0.52
         sab_ext_x = 0.28  # sab extends beyond res_mk in X direction
         has_sab = True
@@ -554,35 +590,13 @@ def _poly_res(
         # Silicided poly
         res_to_endcont = _POLY_SURROUND + _CONTACT_SIZE / 2  # 0.065 + 0.115 = 0.18
         end_surround = _POLY_SURROUND
-        end_spacing = 0.28 if res_type == "npolyf_s" else 0.28
-        res_diff_spacing = 0.28 if res_type == "npolyf_s" else 0.41
         has_sab = False
 
-    # Implant and well types (from Tcl *_draw procedures)
-    # ppolyf_u: body=pplus(rpp), guard=nsd, well=nwell
-    # ppolyf_s: body=pplus(rpps), guard=nsd, well=nwell
-    # npolyf_u: body=nplus(rnp), guard=psd, well=pwell
-    # npolyf_s: body=nplus(rnps), guard=nsd, well=nwell
-    if res_type == "ppolyf_u":
-        body_impl_layer = layer["pplus"]
-        gr_impl_layer = layer["nplus"]
-        well_layer = layer["nwell"]
-        is_psd_gr = False
-    elif res_type == "ppolyf_s":
+    # Body implant (from Tcl *_draw procedures), guard ring types in _RINGS
+    if res_type.startswith("p"):
         body_impl_layer = layer["pplus"]
-        gr_impl_layer = layer["nplus"]
-        well_layer = layer["nwell"]
-        is_psd_gr = False
-    elif res_type == "npolyf_u":
-        body_impl_layer = layer["nplus"]
-        gr_impl_layer = layer["pplus"]
-        well_layer = layer["lvpwell"]
-        is_psd_gr = True
-    elif res_type == "npolyf_s":
+    else:
         body_impl_layer = layer["nplus"]
-        gr_impl_layer = layer["nplus"]
-        well_layer = layer["nwell"]
-        is_psd_gr = False
 
     # --- Compute geometry ---
 
@@ -649,28 +663,15 @@ def _poly_res(
     _draw_end_contact(c, 0, end_cy, cpl, layer["poly2"], orient="horz")
     _draw_end_contact(c, 0, -end_cy, cpl, layer["poly2"], orient="horz")
 
-    # 6. Guard ring
-    # Device footprint height (fh) = 2 * poly_ext_y
+    # 6. Guard ring around the device footprint (w x 2 * poly_ext_y)
     fh = 2 * poly_ext_y
-    fw = w  # device footprint width = w
-
-    # Guard ring dimensions (measured to contact centers)
-    gx = fw + 2 * (res_diff_spacing + _DIFF_SURROUND) + _CONTACT_SIZE
-    gy = fh + 2 * (end_spacing + _DIFF_SURROUND) + _CONTACT_SIZE
-
-    _guard_ring(
-        c,
-        gx,
-        gy,
-        plus_diff_layer=layer["comp"],
-        plus_contact_layer=layer["contact"],
-        sub_type_layer=well_layer,
-        implant_layer=gr_impl_layer,
-        implant_bloat=_NSD_IMPLANT_OUTER_BLOAT,
-        is_psd=is_psd_gr,
-    )
+    if guard:
+        _res_guard_ring(c, res_type, w, fh)
 
-    return c
+    c.info["end_y"] = end_cy
+    c.info["end_h"] = _CONTACT_SIZE
+    c.info["body_h"] = fh
+    return c.flush()
 
 
 # ---------------------------------------------------------------------------
@@ -682,9 +683,10 @@ def _diff_res(
     w: float,
     l: float,
     res_type: str,
+    guard: bool = True,
 ) -> gf.Component:
     """Draw a diffusion resistor with guard ring, centered at origin."""
-    c = gf.Component()
+    c = shapes.ShapeBuffer(gf.Component())
 
     hw = w / 2
     hl = l / 2
@@ -692,8 +694,6 @@ def _diff_res(
     # Parameters from Tcl
     res_to_endcont = 0.45
     end_surround = _DIFF_SURROUND  # 0.065
-    end_spacing = 0.45
-    res_diff_spacing = 0.45
     mask_clearance = 0.22
     sab_ext_x = 0.22  # sab extends beyond res_mk in X
 
@@ -706,14 +706,8 @@ def _diff_res(
 
     if res_type == "nplus_u":
         body_impl_layer = layer["nplus"]
-        gr_impl_layer = layer["pplus"]
-        well_layer = layer["lvpwell"]
-        is_psd_gr = True
     else:
         body_impl_layer = layer["pplus"]
-        gr_impl_layer = layer["nplus"]
-        well_layer = layer["nwell"]
-        is_psd_gr = False
 
     # --- Draw layers ---
 
@@ -768,23 +762,13 @@ def _diff_res(
 
     # 6. Guard ring
     fh = 2 * comp_ext_y
-    fw = w
-    gx = fw + 2 * (res_diff_spacing + _DIFF_SURROUND) + _CONTACT_SIZE
-    gy = fh + 2 * (end_spacing + _DIFF_SURROUND) + _CONTACT_SIZE
+    if guard:
+        _res_guard_ring(c, res_type, w, fh)
 
-    _guard_ring(
-        c,
-        gx,
-        gy,
-        plus_diff_layer=layer["comp"],
-        plus_contact_layer=layer["contact"],
-        sub_type_layer=well_layer,
-        implant_layer=gr_impl_layer,
-        implant_bloat=_NSD_IMPLANT_OUTER_BLOAT,
-        is_psd=is_psd_gr,
-    )
-
-    return c
+    c.info["end_y"] = end_cy
+    c.info["end_h"] = _CONTACT_SIZE
+    c.info["body_h"] = fh
+    return c.flush()
 
 
 # ---------------------------------------------------------------------------
@@ -797,7 +781,7 @@ def _well_res(
     l: float,
 ) -> gf.Component:
     """Draw an nwell resistor with guard ring, centered at origin."""
-    c = gf.Component()
+    c = shapes.ShapeBuffer(gf.Component())
 
     hw = w / 2
     hl = l / 2
@@ -888,8 +872,8 @@ def _well_res(
     )
 
     # End contacts
-    _draw_contacts_2d(c, 0, end_cy, cpl, _CONTACT_SIZE)
-    _draw_contacts_2d(c, 0, -end_cy, cpl, _CONTACT_SIZE)
+    contacts.fill_contacts(c, 0, end_cy, cpl, _CONTACT_SIZE)
+    contacts.fill_contacts(c, 0, -end_cy, cpl, _CONTACT_SIZE)
 
     # End contact metal (horz orientation)
     m_hw = max(cpl, _CONTACT_SIZE) / 2 + _METAL_SURROUND
@@ -1045,7 +1029,9 @@ def _well_res(
         layer=layer["pplus"],
     )
 
-    return c
+    c.info["end_y"] = end_cy
+    c.info["end_h"] = _CONTACT_SIZE
+    return c.flush()
 
 
 # ---------------------------------------------------------------------------
@@ -1057,9 +1043,10 @@ def _highR_poly_res(
     w: float,
     l: float,
     is_6p0: bool = False,
+    guard: bool = True,
 ) -> gf.Component:
     """Draw a high-R poly resistor with guard ring."""
-    c = gf.Component()
+    c = shapes.ShapeBuffer(gf.Component())
 
     hw = w / 2
     hl = l / 2
@@ -1067,8 +1054,6 @@ def _highR_poly_res(
     # Parameters from Tcl ppolyf_u_1k_draw
     res_to_endcont = 0.43
     end_surround = _POLY_SURROUND  # 0.065
-    end_spacing = 0.7
-    res_diff_spacing = 0.7
     mask_clearance = 0.22
 
     hesz = _CONTACT_SIZE / 2 + end_surround  # 0.18
@@ -1080,10 +1065,6 @@ def _highR_poly_res(
     # From reference: poly2 w=1.0, l=1.0 -> (-0.5, -1.11)-(0.5, 1.11)
     # poly_ext_y = 0.5 + 0.43 + 0.18 = 1.11 ✓
 
-    # Guard ring uses psd type
-    gr_impl_layer = layer["pplus"]
-    well_layer = layer["lvpwell"]
-
     # --- Draw layers ---
 
     # 1. Inner res_mk: w x l centered
@@ -1185,49 +1166,47 @@ def _highR_poly_res(
         layer=layer["pplus"],
     )
 
-    # 7. Guard ring
+    # 7. Guard ring (psd in lvpwell, with dualgate for the 6p0 variant)
     fh = 2 * poly_ext_y
-    fw = w
-    gx = fw + 2 * (res_diff_spacing + _DIFF_SURROUND) + _CONTACT_SIZE
-    gy = fh + 2 * (end_spacing + _DIFF_SURROUND) + _CONTACT_SIZE
+    if guard:
+        _res_guard_ring(c, "ppolyf_u_1k_6p0" if is_6p0 else "ppolyf_u_1k", w, fh)
 
-    # For the 6p0 variant, the lvpwell extends 0.04 beyond the standard well_ext
-    well_ext_extra_6p0 = 0.04 if is_6p0 else 0.0
+    c.info["end_y"] = end_cy
+    c.info["end_h"] = _CONTACT_SIZE
+    c.info["body_h"] = fh
+    return c.flush()
 
-    _guard_ring(
-        c,
-        gx,
-        gy,
-        plus_diff_layer=layer["comp"],
-        plus_contact_layer=layer["contact"],
-        sub_type_layer=well_layer,
-        implant_layer=gr_impl_layer,
-        implant_bloat=0.02,
-        is_psd=True,
-        well_ext_extra=well_ext_extra_6p0,
-    )
 
-    # 8. Dualgate for 6p0 variant
-    if is_6p0:
-        # From reference: dualgate = (-1.8, -2.41)-(1.8, 2.41) for w=1, l=1
-        # dualgate extends 0.12 beyond standard lvpwell (without 6p0 extension)
-        well_ext = _HX + _DIFF_SURROUND + _SUB_SURROUND
-        gx_half = gx / 2
-        gy_half = gy / 2
-        dg_ext = 0.12  # dualgate extends beyond well
-        well_x = gx_half + well_ext
-        well_y = gy_half + well_ext
-        c.add_polygon(
-            [
-                (-(well_x + dg_ext), -(well_y + dg_ext)),
-                (well_x + dg_ext, -(well_y + dg_ext)),
-                (well_x + dg_ext, well_y + dg_ext),
-                (-(well_x + dg_ext), well_y + dg_ext),
-            ],
-            layer=layer["dualgate"],
-        )
+# ---------------------------------------------------------------------------
+# Device body dispatch
+# ---------------------------------------------------------------------------
 
-    return c
+_METAL_RES = {
+    "rm1": ("metal1", "metal1_res"),
+    "rm2": ("metal2", "metal2_res"),
+    "rm3": ("metal3", "metal3_res"),
+}
+
+
+def _res_body(res_type: str, w: float, l: float, guard: bool = True) -> gf.Component:
+    """Draw the res_type device centered at origin, without ports.
+
+    With guard=False the guard ring (and its well) is left out, for
+    generators that put several bodies in one ring. Metal resistors have no
+    ring; the nwell resistor's ring is part of its body.
+    """
+    if res_type in _METAL_RES:
+        m_layer, res_layer = _METAL_RES[res_type]
+        return _metal_res(w, l, layer[m_layer], layer[res_layer])
+    if res_type in ("ppolyf_u", "npolyf_u", "ppolyf_s", "npolyf_s"):
+        return _poly_res(w, l, res_type, guard)
+    if res_type in ("nplus_u", "pplus_u"):
+        return _diff_res(w, l, res_type, guard)
+    if res_type == "nwell":
+        return _well_res(w, l)
+    if res_type in ("ppolyf_u_1k", "ppolyf_u_1k_6p0"):
+        return _highR_poly_res(w, l, res_type == "ppolyf_u_1k_6p0", guard)
+    raise ValueError(f"Unknown res_type: {res_type}")
 
 
 # ---------------------------------------------------------------------------
@@ -1235,6 +1214,12 @@ def _highR_poly_res(
 # ---------------------------------------------------------------------------
 
 
+@gf.cell
+def _res_device(res_type: str, w_res: float, l_res: float) -> gf.Component:
+    """Geometry of res, one cell per (res_type, w, l) for all labels."""
+    return _res_body(res_type, w_res, l_res)
+
+
 @gf.cell(tags=["res"])
 def res(
     l_res: float = 0.1,
@@ -1247,6 +1232,8 @@ def res(
     """Returns a resistor component matching Magic VLSI geometry.
 
     All layouts are centered at the origin with length along Y and width along X.
+    The geometry is a reference to a cached cell named after res_type, w and
+    l only, so resistors that differ in their labels share it.
 
     Args:
         l_res: resistor length.
@@ -1256,84 +1243,29 @@ def res(
         r0_label: label for terminal 0.
         r1_label: label for terminal 1.
     """
-    # --- Metal resistors ---
-    if res_type == "rm1":
-        c = _metal_res(w_res, l_res, layer["metal1"], layer["metal1_res"])
-    elif res_type == "rm2":
-        c = _metal_res(w_res, l_res, layer["metal2"], layer["metal2_res"])
-    elif res_type == "rm3":
-        c = _metal_res(w_res, l_res, layer["metal3"], layer["metal3_res"])
-
-    # --- Poly resistors ---
-    elif res_type in ("ppolyf_u", "npolyf_u", "ppolyf_s", "npolyf_s"):
-        c = _poly_res(w_res, l_res, res_type)
-
-    # --- Diffusion resistors ---
-    elif res_type in ("nplus_u", "pplus_u"):
-        c = _diff_res(w_res, l_res, res_type)
-
-    # --- Well resistor ---
-    elif res_type == "nwell":
-        c = _well_res(w_res, l_res)
-
-    # --- High-R poly ---
-    elif res_type == "ppolyf_u_1k":
-        c = _highR_poly_res(w_res, l_res, is_6p0=False)
-    elif res_type == "ppolyf_u_1k_6p0":
-        c = _highR_poly_res(w_res, l_res, is_6p0=True)
-
-    else:
-        raise ValueError(f"Unknown res_type: {res_type}")
-
-    # Copy to output component with ports
-    out = gf.Component("res_dev")
-    ref = out.add_ref(c)
-
-    # Add electrical ports
-    hw = w_res / 2
-    hl = l_res / 2
-
-    if res_type in ("rm1", "rm2", "rm3"):
-        ext = 0.315
-        m_layer = {
-            "rm1": layer["metal1"],
-            "rm2": layer["metal2"],
-            "rm3": layer["metal3"],
-        }[res_type]
-        out.add_port(
-            name="r0",
-            center=(0, hl + ext),
-            width=w_res,
-            orientation=90,
-            layer=m_layer,
-            port_type="electrical",
-        )
-        out.add_port(
-            name="r1",
-            center=(0, -(hl + ext)),
-            width=w_res,
-            orientation=270,
-            layer=m_layer,
-            port_type="electrical",
-        )
-    else:
-        out.add_port(
-            name="r0",
-            center=(0, hl),
-            width=w_res,
-            orientation=90,
-            layer=layer["metal1"],
-            port_type="electrical",
-        )
-        out.add_port(
-            name="r1",
-            center=(0, -hl),
+    device = _res_device(res_type, w_res, l_res)
+    c = gf.Component()
+    c.add_ref(device)
+
+    # Electrical ports at the body ends, or for metal resistors the outer edge
+    # of their 0.315 end extensions. Labels go on the terminal metal: the end
+    # contacts, or the middle of the metal extensions.
+    metal = _METAL_RES.get(res_type, ("metal1",))[0]
+    hl = l_res / 2 + (0.315 if res_type in _METAL_RES else 0.0)
+    end_y = device.info["end_y"]
+    for name, sign, orientation, text in (
+        ("r0", 1, 90, r0_label),
+        ("r1", -1, 270, r1_label),
+    ):
+        c.add_port(
+            name=name,
+            center=(0, sign * hl),
             width=w_res,
-            orientation=270,
-            layer=layer["metal1"],
+            orientation=orientation,
+            layer=layer[metal],
             port_type="electrical",
         )
+        if label and text:
+            c.add_label(text, position=(0, sign * end_y), layer=layer[f"{metal}_label"])
 
-    # VLSIR Simulation Metadata
-
-    return out
+    return c
@@ -0,0 +1,164 @@
+"""Matched resistor arrays (interleaved / common-centroid) in one guard ring.
+
+A pattern such as "ABBA" gives one unit segment per character, naming the
+device it belongs to, from left to right. The segments of a device are
+chained in series in pattern order, so "ABAB" interleaves two equal
+resistors, "ABBA" is their common-centroid pair and "ABA" a 2:1 divider
+pair. dummies extra segments at both ends are chained into a device of
+their own.
+
+All segments are one instance array of the cached, ring-less segment cell
+of res_serpentine, at the same pitch, inside a single guard ring. Each link
+of a chain runs up (or down) on metal1 from the end contacts of its two
+segments to a metal2 track above (or below) the array. Links that do not
+overlap share a track, and the ring is sized around the tracks the way
+fet_array sizes it around its routing.
+"""
+
+from __future__ import annotations
+
+import gdsfactory as gf
+
+from gf180mcu.cells import shapes
+from gf180mcu.cells.fet_array import _M1_WIDTH, _M2_SPACE, _PAD, _PITCH, _via
+from gf180mcu.cells.res import _RINGS, _res_guard_ring
+from gf180mcu.cells.res_serpentine import _frame, _res_segment
+from gf180mcu.layers import layer
+from gf180mcu.res_model import resistance
+
+_DUMMY = "dummy"
+
+
+def _chains(pattern: str, dummies: int) -> dict[str, list[int]]:
+    """Segment columns of every device, dummies last."""
+    chains: dict[str, list[int]] = {}
+    for j, ch in enumerate(pattern):
+        chains.setdefault(ch, []).append(j + dummies)
+    chains = dict(sorted(chains.items()))
+    if dummies:
+        n = len(pattern) + 2 * dummies
+        chains[_DUMMY] = [*range(dummies), *range(n - dummies, n)]
+    return chains
+
+
+def _tracks(links: list[tuple[int, int]], pitch: float) -> list[int]:
+    """Track of every (left, right) column link, packing links left-edge first
+    so that the pads of links on one track keep _M2_SPACE apart."""
+    track = [0] * len(links)
+    ends: list[float] = []
+    for i in sorted(range(len(links)), key=lambda i: links[i]):
+        left, right = (x * pitch for x in links[i])
+        t = next((t for t, e in enumerate(ends) if left - e >= _PITCH), len(ends))
+        if t == len(ends):
+            ends.append(right)
+        ends[t] = right
+        track[i] = t
+    return track
+
+
+@gf.cell(tags=["res"])
+def res_array(
+    pattern: str = "ABBA",
+    res_type: str = "ppolyf_u_1k",
+    w_res: float = 1.0,
+    l_res: float = 10.0,
+    dummies: int = 1,
+) -> gf.Component:
+    """Return a matched resistor array routed per device, in one guard ring.
+
+    Ports are r0_<X> and r1_<X> on the end contacts of the first and last
+    segment of every device X (r0_dummy and r1_dummy for the dummies). r0 is
+    the bottom end of the first segment. info holds the segment count and
+    nominal resistance of every device.
+
+    Args:
+        pattern: one character per segment naming its device, e.g. "ABBA"
+            for a common-centroid pair or "ABAB" for an interleaved one.
+        res_type: resistor variant with a guard ring (poly and diffusion).
+        w_res: segment width.
+        l_res: segment length.
+        dummies: dummy segments at each end.
+    """
+    if res_type not in _RINGS:
+        raise ValueError(
+            f"Unsupported res_type for res_array: {res_type}, "
+            f"expected one of {list(_RINGS)}"
+        )
+    if not pattern.isascii() or not pattern.isalnum():
+        raise ValueError(f"Invalid pattern: {pattern!r}")
+    if dummies < 0:
+        raise ValueError(f"dummies must be >= 0, got {dummies}")
+
+    chains = _chains(pattern, dummies)
+    n = len(pattern) + 2 * dummies
+    pitch = _frame(res_type, w_res)[0]
+    seg = _res_segment(res_type, w_res, l_res)
+    end_y, body_h = seg.info["end_y"], seg.info["body_h"]
+    x0 = -(n - 1) * pitch / 2
+
+    # Chain links alternate top and bottom, starting at the top.
+    links = {True: [], False: []}
+    for cols in chains.values():
+        for k in range(len(cols) - 1):
+            links[k % 2 == 0].append((cols[k], cols[k + 1]))
+    y0 = body_h / 2 + _M2_SPACE + _PAD / 2
+    tracks = {top: _tracks(side, pitch) for top, side in links.items()}
+    fh = body_h
+    for side in tracks.values():
+        if side:
+            fh = max(fh, 2 * (y0 + max(side) * _PITCH + _PAD / 2))
+
+    c = shapes.ShapeBuffer(gf.Component())
+    c.add_ref(seg, columns=n, column_pitch=pitch).move((x0, 0))
+
+    h = _M1_WIDTH / 2
+    for top, side in links.items():
+        sign = 1 if top else -1
+        for (a, b), t in zip(side, tracks[top]):
+            y = sign * (y0 + t * _PITCH)
+            xa, xb = x0 + a * pitch, x0 + b * pitch
+            for x in (xa, xb):
+                c.add_rect(
+                    x - h,
+                    min(y, sign * end_y),
+                    x + h,
+                    max(y, sign * end_y),
+                    layer["metal1"],
+                )
+                _via(c, x, y)
+            c.add_rect(
+                xa - _PAD / 2,
+                y - _PAD / 2,
+                xb + _PAD / 2,
+                y + _PAD / 2,
+                layer["metal2"],
+            )
+
+    _res_guard_ring(c, res_type, (n - 1) * pitch + w_res, fh)
+
+    for name, cols in chains.items():
+        top = len(cols) % 2 == 1
+        for port, x, y, orientation in (
+            (f"r0_{name}", x0 + cols[0] * pitch, -end_y, 270),
+            (
+                f"r1_{name}",
+                x0 + cols[-1] * pitch,
+                end_y if top else -end_y,
+                90 if top else 270,
+            ),
+        ):
+            c.add_port(
+                name=port,
+                center=(round(x, 4), round(y, 4)),
+                width=w_res,
+                orientation=orientation,
+                layer=layer["metal1"],
+                port_type="electrical",
+            )
+
+    r_segment = float(resistance(res_type, w_res, l_res))
+    c.info["segments"] = {name: len(cols) for name, cols in chains.items()}
+    c.info["r_nominal"] = {
+        name: round(len(cols) * r_segment, 3) for name, cols in chains.items()
+    }
+    return c.flush()
@@ -0,0 +1,189 @@
+"""Serpentine resistors sized for a target resistance.
+
+A serpentine is n equal resistor segments side by side, chained by metal
+bends at alternating ends, in one guard ring. Every segment is the body of
+gf180mcu.cells.res (res_mk, implants and end contacts) without its ring, so
+LVS sees n series devices of the same w and l.
+
+The segment count and length are solved in closed form from the sheet and
+terminal resistance of the res_type (gf180mcu.res_model, typical at 25 C):
+
+    R = n * (rsh * (l - 2 dl) + 2 rsh_end * 1 um) / (w - 2 dw)
+
+and the aspect ratio of the cell, see serpentine_segments. The segments are
+one instance array of a cached segment cell and the bends two arrays of a
+cached bend cell, so a new target costs one segment cell at most.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import NamedTuple
+
+import gdsfactory as gf
+
+from gf180mcu.cells import shapes
+from gf180mcu.cells.res import (
+    _DIFF_SURROUND,
+    _DIFFT,
+    _HX,
+    _METAL_RES,
+    _RINGS,
+    _res_body,
+    _res_guard_ring,
+)
+from gf180mcu.layers import layer
+from gf180mcu.res_model import res_params, resistance
+
+_L_MIN = 1.0  # shortest segment drawn
+
+
+class _Meander(NamedTuple):
+    spacing: float  # body to body
+    end_ext: float  # res_mk end to body end (res_to_endcont + hesz)
+
+
+# Unsilicided bodies are spaced so their SAB (0.28, diffusion 0.22 beyond
+# res_mk) abuts; high-R bodies keep their res_mk and resistor marks 0.28
+# apart.
+_MEANDERS: dict[str, _Meander] = {
+    "rm1": _Meander(0.23, 0.315),
+    "rm2": _Meander(0.28, 0.315),
+    "rm3": _Meander(0.28, 0.315),
+    "ppolyf_u": _Meander(0.56, 0.51),
+    "npolyf_u": _Meander(0.56, 0.51),
+    "ppolyf_s": _Meander(0.28, 0.36),
+    "npolyf_s": _Meander(0.28, 0.36),
+    "nplus_u": _Meander(0.44, 0.63),
+    "pplus_u": _Meander(0.44, 0.63),
+    "ppolyf_u_1k": _Meander(1.08, 0.61),
+    "ppolyf_u_1k_6p0": _Meander(1.08, 0.61),
+}
+
+
+def _frame(res_type: str, w: float) -> tuple[float, float, float]:
+    """Segment pitch and the width and height the cell adds to the bodies."""
+    pitch = round(w + _MEANDERS[res_type].spacing, 2)
+    mx = my = 0.0
+    if res_type in _RINGS:
+        ring = _RINGS[res_type]
+        edge = _DIFF_SURROUND + _HX + _DIFFT / 2
+        mx = ring.res_diff_spacing + edge
+        my = ring.end_spacing + edge
+    return pitch, w - pitch + 2 * mx, 2 * (_MEANDERS[res_type].end_ext + my)
+
+
+def serpentine_segments(
+    r_target: float,
+    res_type: str = "ppolyf_u_1k",
+    w_res: float = 1.0,
+    max_aspect: float = 2.0,
+) -> tuple[int, float]:
+    """Return the segment count and length of a serpentine of r_target ohm.
+
+    n is the fewest segments that keep the cell at most max_aspect times as
+    tall as it is wide, unless that would make segments shorter than 1 um.
+    With H = A / n - B + h0 and W = n * pitch + w0 the height and width of
+    the cell, H <= max_aspect * W is a quadratic in n. l is rounded to 10
+    nm.
+
+    Args:
+        r_target: resistance in ohm.
+        res_type: resistor variant (all of res but nwell).
+        w_res: segment width.
+        max_aspect: largest height to width ratio of the cell.
+    """
+    if res_type not in _MEANDERS:
+        raise ValueError(
+            f"Unsupported res_type for a serpentine: {res_type}, "
+            f"expected one of {list(_MEANDERS)}"
+        )
+    if r_target <= 0 or max_aspect <= 0:
+        raise ValueError("r_target and max_aspect must be positive")
+
+    p = res_params(res_type)
+    a = r_target * (w_res - 2 * p.dw) / p.rsh
+    b = 2 * p.rsh_end / p.rsh - 2 * p.dl
+    n_max = math.floor(a / (_L_MIN + b))
+    if n_max < 1:
+        raise ValueError(
+            f"r_target {r_target} is below one {_L_MIN} um {res_type} segment"
+        )
+    pitch, w0, h0 = _frame(res_type, w_res)
+    q = max_aspect * w0 + b - h0
+    k = max_aspect * pitch
+    n = math.ceil((-q + math.sqrt(q * q + 4 * k * a)) / (2 * k) - 1e-9)
+    n = min(max(n, 1), n_max)
+    return n, max(round(a / n - b, 2), _L_MIN)
+
+
+@gf.cell
+def _res_segment(res_type: str, w: float, l: float) -> gf.Component:
+    """One resistor body without guard ring, terminal rows in info."""
+    return _res_body(res_type, w, l, guard=False)
+
+
+@gf.cell
+def _res_bend(w: float, pitch: float, h: float, metal: str) -> gf.Component:
+    """Metal strap over the ends of two bodies pitch apart, from the left one."""
+    c = shapes.ShapeBuffer(gf.Component())
+    c.add_rect(-w / 2, -h / 2, pitch + w / 2, h / 2, layer[metal])
+    return c.flush()
+
+
+@gf.cell(tags=["res"])
+def res_serpentine(
+    r_target: float = 100e3,
+    res_type: str = "ppolyf_u_1k",
+    w_res: float = 1.0,
+    max_aspect: float = 2.0,
+) -> gf.Component:
+    """Returns a serpentine resistor of r_target ohm in one guard ring.
+
+    Port r1 is the bottom end of the leftmost segment, r0 the free end of
+    the rightmost one. info holds the segment count and length and the
+    nominal resistance of the drawn segments.
+
+    Args:
+        r_target: resistance in ohm.
+        res_type: resistor variant (all of res but nwell).
+        w_res: segment width.
+        max_aspect: largest height to width ratio of the cell.
+    """
+    n, l = serpentine_segments(r_target, res_type, w_res, max_aspect)
+    pitch = _frame(res_type, w_res)[0]
+    metal = _METAL_RES.get(res_type, ("metal1",))[0]
+
+    seg = _res_segment(res_type, w_res, l)
+    end_y = seg.info["end_y"]
+    bend = _res_bend(w_res, pitch, seg.info["end_h"], metal)
+
+    c = shapes.ShapeBuffer(gf.Component())
+    x0 = -(n - 1) * pitch / 2
+    c.add_ref(seg, columns=n, column_pitch=pitch).move((x0, 0))
+    # even segments turn at the top into the next one, odd ones at the bottom
+    for count, x, y in ((n // 2, x0, end_y), ((n - 1) // 2, x0 + pitch, -end_y)):
+        if count:
+            c.add_ref(bend, columns=count, column_pitch=2 * pitch).move((x, y))
+
+    if res_type in _RINGS:
+        _res_guard_ring(c, res_type, (n - 1) * pitch + w_res, seg.info["body_h"])
+
+    top = n % 2 == 1
+    for name, x, y, orientation in (
+        ("r0", -x0, end_y if top else -end_y, 90 if top else 270),
+        ("r1", x0, -end_y, 270),
+    ):
+        c.add_port(
+            name=name,
+            center=(round(x, 4), round(y, 4)),
+            width=w_res,
+            orientation=orientation,
+            layer=layer[metal],
+            port_type="electrical",
+        )
+
+    c.info["n_segments"] = n
+    c.info["l_segment"] = l
+    c.info["r_nominal"] = round(n * float(resistance(res_type, w_res, l)), 3)
+    return c.flush()
@@ -0,0 +1,101 @@
+"""Magic design-rule decks shared by the Magic-matching generators.
+
+One frozen RuleDeck per voltage class holds the gf180mcu::ruleset values of
+open_pdks (painted coordinates) with the per-device overrides of the Magic
+generators, plus the constants derived from them once: the GDS (CIF)
+contact cut and surrounds, the contact pitch and the guard ring bar.
+
+The decks are built at import; rule_deck(volt) returns the shared instance,
+so generators never copy or rebuild a ruleset per call.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from types import MappingProxyType
+
+from gf180mcu.cells import contacts
+
+__all__ = ["DECKS", "RuleDeck", "rule_deck"]
+
+
+@dataclasses.dataclass(frozen=True)
+class RuleDeck:
+    """Magic ruleset of one voltage class, in um.
+
+    The cif_* fields are the painted sizes after CIF output: contact cuts
+    shrink and surrounds grow by contacts.CIF_SHRINK per side, so the
+    envelope of a contact is unchanged. The DNWELL encloses the LVPWELL of
+    an nfet by dnwell_enc_lvpwell and the N+ comp of a pfet by
+    dnwell_enc_comp; the DUALGATE of a 5/6/10V device encloses the DNWELL
+    by dualgate_enc_dnwell.
+    """
+
+    volt: str
+    contact_size: float = 0.23
+    poly_surround: float = 0.065
+    diff_surround: float = 0.065
+    gate_to_diffcont: float = 0.26
+    gate_to_polycont: float = 0.28
+    gate_extension: float = 0.22
+    diff_extension: float = 0.23
+    metal_surround: float = 0.055
+    sub_surround: float = 0.12
+    diff_spacing: float = 0.33
+    poly_spacing: float = 0.24
+    diff_poly_space: float = 0.10
+    diff_gate_space: float = 0.11
+    metal_spacing: float = 0.23
+    dnwell_enc_lvpwell: float = 2.5
+    dnwell_enc_comp: float = 0.66
+    dualgate_enc_dnwell: float = 0.5
+
+    cif_contact_cut: float = dataclasses.field(init=False)
+    cif_diff_surround: float = dataclasses.field(init=False)
+    cif_poly_surround: float = dataclasses.field(init=False)
+    cif_metal_surround: float = dataclasses.field(init=False)
+    contact_pitch: float = dataclasses.field(init=False)
+    difft: float = dataclasses.field(init=False)
+
+    def __post_init__(self) -> None:
+        shrink = contacts.CIF_SHRINK
+        derived = dict(
+            cif_contact_cut=self.contact_size - 2 * shrink,
+            cif_diff_surround=self.diff_surround + shrink,
+            cif_poly_surround=self.poly_surround + shrink,
+            cif_metal_surround=self.metal_surround + shrink,
+            contact_pitch=contacts.PITCH,
+            difft=self.contact_size + 2 * self.diff_surround,
+        )
+        for name, value in derived.items():
+            object.__setattr__(self, name, round(value, 4))
+
+
+_MV = dict(
+    diff_poly_space=0.30, diff_gate_space=0.30, diff_spacing=0.36, dnwell_enc_comp=0.62
+)
+
+DECKS: MappingProxyType[str, RuleDeck] = MappingProxyType(
+    {
+        "3.3V": RuleDeck("3.3V"),
+        "5.0V": RuleDeck("5.0V", sub_surround=0.16, **_MV),
+        "6.0V": RuleDeck("6.0V", sub_surround=0.16, **_MV),
+        "10.0V": RuleDeck("10.0V", sub_surround=0.16, **_MV),
+        "nvt": RuleDeck(
+            "nvt", gate_extension=0.35, sub_surround=0.16, dnwell_enc_comp=0.62
+        ),
+    }
+)
+
+_ALIASES = {"5/6V": "6.0V"}
+
+
+def rule_deck(volt: str) -> RuleDeck:
+    """Return the rule deck of a voltage class ("3.3V", "5.0V", "6.0V",
+    "10.0V", "nvt"; "5/6V" is the 6.0V deck)."""
+    try:
+        return DECKS[_ALIASES.get(volt, volt)]
+    except KeyError:
+        raise ValueError(
+            f"Unknown voltage class {volt!r}, expected one of {list(DECKS)}"
+        ) from None
@@ -2,6 +2,7 @@
 
 __all__ = ["PATH"]
 
+import os
 import pathlib
 
 home = pathlib.Path.home()
@@ -20,6 +21,10 @@ class Path:
     repo = repo_path
     lyp = module_path / "klayout" / "tech" / "gf180mcu.lyp"
     lyp_yaml = module_path / "layers.yaml"
+    # GF180MCU_CACHE moves the on-disk caches, e.g. for tests or CI
+    cache = pathlib.Path(os.environ.get("GF180MCU_CACHE", home / ".cache" / "gf180mcu"))
+    port_cache = cache / "ports"
+    abstract_cache = cache / "abstracts"
 
 
 PATH = Path()
@@ -1,13 +1,21 @@
 """GF180MCU fixed-geometry cells imported from pre-built GDS.
 
 BJT and efuse cells with fixed dimensions — not parametrically generated.
+
+All fixed GDS files are read once per process into one shared layout; every
+cell function copies its cell from there instead of opening the file again.
 """
 
-from functools import partial
+from functools import cache
 from pathlib import Path
 
 import gdsfactory as gf
+import kfactory as kf
+
+# Underscored so get_cells does not pick it up as a PDK cell.
+from gdsfactory.read.import_gds import kcell_to_component as _kcell_to_component
 
+from gf180mcu import port_cache
 from gf180mcu.layers import LAYER
 
 _GDS_DIR = Path(__file__).parent.parent.parent / "klayout" / "pymacros" / "cells"
@@ -22,73 +30,94 @@ _add_ports = gf.partial(
     guess_port_orientation=True,
 )
 
-_import_gds = partial(gf.import_gds, post_process=(_add_ports,))
+# Top cell name of every fixed GDS file.
+_GDS_PATHS = {
+    **{p.stem: p for p in sorted((_GDS_DIR / "bjt").glob("*.gds"))},
+    "efuse_cell": _GDS_DIR / "efuse" / "efuse.gds",
+}
+
+
+@cache
+def _layout() -> kf.KCLayout:
+    """Returns the shared layout holding every fixed cell, read on first use."""
+    options = kf.utilities.load_layout_options()
+    options.warn_level = 0
+    kcl = kf.KCLayout(name=__name__)
+    for gds_path in _GDS_PATHS.values():
+        kcl.layout.read(str(gds_path), options)
+    return kcl
+
+
+def _fixed_cell(name: str) -> gf.Component:
+    """Returns a copy of a fixed cell from the shared layout, with ports."""
+    c = _kcell_to_component(_layout()[name])
+    return port_cache.add_ports(c, _GDS_PATHS[name], _add_ports)
 
 
 # BJT NPN variants
 @gf.cell
 def npn_00p54x02p00() -> gf.Component:
     """NPN BJT 0.54um x 2.00um emitter."""
-    return _import_gds(_GDS_DIR / "bjt" / "npn_00p54x02p00.gds")
+    return _fixed_cell("npn_00p54x02p00")
 
 
 @gf.cell
 def npn_00p54x04p00() -> gf.Component:
     """NPN BJT 0.54um x 4.00um emitter."""
-    return _import_gds(_GDS_DIR / "bjt" / "npn_00p54x04p00.gds")
+    return _fixed_cell("npn_00p54x04p00")
 
 
 @gf.cell
 def npn_00p54x08p00() -> gf.Component:
     """NPN BJT 0.54um x 8.00um emitter."""
-    return _import_gds(_GDS_DIR / "bjt" / "npn_00p54x08p00.gds")
+    return _fixed_cell("npn_00p54x08p00")
 
 
 @gf.cell
 def npn_00p54x16p00() -> gf.Component:
     """NPN BJT 0.54um x 16.00um emitter."""
-    return _import_gds(_GDS_DIR / "bjt" / "npn_00p54x16p00.gds")
+    return _fixed_cell("npn_00p54x16p00")
 
 
 @gf.cell
 def npn_05p00x05p00() -> gf.Component:
     """NPN BJT 5.00um x 5.00um emitter."""
-    return _import_gds(_GDS_DIR / "bjt" / "npn_05p00x05p00.gds")
+    return _fixed_cell("npn_05p00x05p00")
 
 
 @gf.cell
 def npn_10p00x10p00() -> gf.Component:
     """NPN BJT 10.00um x 10.00um emitter."""
-    return _import_gds(_GDS_DIR / "bjt" / "npn_10p00x10p00.gds")
+    return _fixed_cell("npn_10p00x10p00")
 
 
 # BJT PNP variants
 @gf.cell
 def pnp_05p00x00p42() -> gf.Component:
     """PNP BJT 5.00um x 0.42um emitter."""
-    return _import_gds(_GDS_DIR / "bjt" / "pnp_05p00x00p42.gds")
+    return _fixed_cell("pnp_05p00x00p42")
 
 
 @gf.cell
 def pnp_05p00x05p00() -> gf.Component:
     """PNP BJT 5.00um x 5.00um emitter."""
-    return _import_gds(_GDS_DIR / "bjt" / "pnp_05p00x05p00.gds")
+    return _fixed_cell("pnp_05p00x05p00")
 
 
 @gf.cell
 def pnp_10p00x00p42() -> gf.Component:
     """PNP BJT 10.00um x 0.42um emitter."""
-    return _import_gds(_GDS_DIR / "bjt" / "pnp_10p00x00p42.gds")
+    return _fixed_cell("pnp_10p00x00p42")
 
 
 @gf.cell
 def pnp_10p00x10p00() -> gf.Component:
     """PNP BJT 10.00um x 10.00um emitter."""
-    return _import_gds(_GDS_DIR / "bjt" / "pnp_10p00x10p00.gds")
+    return _fixed_cell("pnp_10p00x10p00")
 
 
 # eFuse
 @gf.cell
 def efuse() -> gf.Component:
     """Electronic fuse."""
-    return _import_gds(_GDS_DIR / "efuse" / "efuse.gds")
+    return _fixed_cell("efuse_cell")
@@ -1,16 +1,37 @@
 """GF180MCU digital standard cells imported from GDS.
 
 Two libraries:
-  - gf180mcu_fd_sc_mcu7t5v0: 7-track 5V standard cells (249 cells)
-  - gf180mcu_fd_sc_mcu9t5v0: 9-track 5V standard cells (249 cells)
+  - gf180mcu_fd_sc_mcu7t5v0: 7-track 5V standard cells (229 cells)
+  - gf180mcu_fd_sc_mcu9t5v0: 9-track 5V standard cells (229 cells)
+
+The cell list lives in ``cells.json`` (library -> cell directory -> cell
+names). Cell functions are created on first attribute access, so importing
+this module does not decorate every cell up front.
+
+``load_library`` reads a whole library into one shared layout in a single
+pass; afterwards the cell functions of that library copy from it instead of
+opening one GDS file per cell, and take their ports from one per-library
+port table instead of one cache file per cell.
+
+``abstract`` returns the outline, row height and pin shapes of a cell from a
+per-library table, without building a Component.
 """
 
+from __future__ import annotations
+
+import inspect
+import json
+from collections.abc import Callable
 from functools import partial
 from pathlib import Path
 
 import gdsfactory as gf
+import kfactory as kf
+from gdsfactory.read.import_gds import kcell_to_component
 
+from gf180mcu import port_cache
 from gf180mcu.layers import LAYER
+from gf180mcu.logic import views
 
 _add_ports = gf.partial(
     gf.add_ports.add_ports_from_labels,
@@ -22,3774 +43,149 @@ _add_ports = gf.partial(
     guess_port_orientation=True,
 )
 
-_import_gds = partial(gf.import_gds, post_process=(_add_ports,))
+_import_gds = partial(port_cache.import_gds, add_ports_from_labels=_add_ports)
 
 _SRC = Path(__file__).parent.parent / "src"
+_MANIFEST = Path(__file__).parent / "cells.json"
+
 
+def _load_manifest() -> dict[str, dict[str, Path]]:
+    """Returns {library: {cell_name: gds_path}} for every cell in the manifest."""
+    with _MANIFEST.open() as f:
+        libraries = json.load(f)
+    return {
+        lib: {
+            f"{lib}__{cell}": _SRC / lib / "cells" / directory / f"{lib}__{cell}.gds"
+            for directory, cell_names in directories.items()
+            for cell in cell_names
+        }
+        for lib, directories in libraries.items()
+    }
 
-# ── 7-track 5V standard cells ──
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__addf_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/addf/gf180mcu_fd_sc_mcu7t5v0__addf_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__addf_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/addf/gf180mcu_fd_sc_mcu7t5v0__addf_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__addf_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/addf/gf180mcu_fd_sc_mcu7t5v0__addf_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__addh_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/addh/gf180mcu_fd_sc_mcu7t5v0__addh_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__addh_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/addh/gf180mcu_fd_sc_mcu7t5v0__addh_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__addh_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/addh/gf180mcu_fd_sc_mcu7t5v0__addh_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__and2_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/and2/gf180mcu_fd_sc_mcu7t5v0__and2_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__and2_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/and2/gf180mcu_fd_sc_mcu7t5v0__and2_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__and2_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/and2/gf180mcu_fd_sc_mcu7t5v0__and2_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__and3_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/and3/gf180mcu_fd_sc_mcu7t5v0__and3_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__and3_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/and3/gf180mcu_fd_sc_mcu7t5v0__and3_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__and3_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/and3/gf180mcu_fd_sc_mcu7t5v0__and3_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__and4_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/and4/gf180mcu_fd_sc_mcu7t5v0__and4_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__and4_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/and4/gf180mcu_fd_sc_mcu7t5v0__and4_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__and4_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/and4/gf180mcu_fd_sc_mcu7t5v0__and4_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__antenna() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/antenna/gf180mcu_fd_sc_mcu7t5v0__antenna.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__aoi21_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/aoi21/gf180mcu_fd_sc_mcu7t5v0__aoi21_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__aoi21_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/aoi21/gf180mcu_fd_sc_mcu7t5v0__aoi21_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__aoi21_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/aoi21/gf180mcu_fd_sc_mcu7t5v0__aoi21_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__aoi211_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/aoi211/gf180mcu_fd_sc_mcu7t5v0__aoi211_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__aoi211_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/aoi211/gf180mcu_fd_sc_mcu7t5v0__aoi211_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__aoi211_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/aoi211/gf180mcu_fd_sc_mcu7t5v0__aoi211_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__aoi22_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/aoi22/gf180mcu_fd_sc_mcu7t5v0__aoi22_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__aoi22_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/aoi22/gf180mcu_fd_sc_mcu7t5v0__aoi22_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__aoi22_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/aoi22/gf180mcu_fd_sc_mcu7t5v0__aoi22_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__aoi221_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/aoi221/gf180mcu_fd_sc_mcu7t5v0__aoi221_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__aoi221_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/aoi221/gf180mcu_fd_sc_mcu7t5v0__aoi221_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__aoi221_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/aoi221/gf180mcu_fd_sc_mcu7t5v0__aoi221_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__aoi222_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/aoi222/gf180mcu_fd_sc_mcu7t5v0__aoi222_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__aoi222_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/aoi222/gf180mcu_fd_sc_mcu7t5v0__aoi222_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__aoi222_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/aoi222/gf180mcu_fd_sc_mcu7t5v0__aoi222_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__buf_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/buf/gf180mcu_fd_sc_mcu7t5v0__buf_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__buf_12() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/buf/gf180mcu_fd_sc_mcu7t5v0__buf_12.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__buf_16() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/buf/gf180mcu_fd_sc_mcu7t5v0__buf_16.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__buf_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/buf/gf180mcu_fd_sc_mcu7t5v0__buf_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__buf_20() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/buf/gf180mcu_fd_sc_mcu7t5v0__buf_20.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__buf_3() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/buf/gf180mcu_fd_sc_mcu7t5v0__buf_3.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__buf_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/buf/gf180mcu_fd_sc_mcu7t5v0__buf_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__buf_8() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/buf/gf180mcu_fd_sc_mcu7t5v0__buf_8.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__bufz_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/bufz/gf180mcu_fd_sc_mcu7t5v0__bufz_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__bufz_12() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/bufz/gf180mcu_fd_sc_mcu7t5v0__bufz_12.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__bufz_16() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/bufz/gf180mcu_fd_sc_mcu7t5v0__bufz_16.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__bufz_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/bufz/gf180mcu_fd_sc_mcu7t5v0__bufz_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__bufz_3() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/bufz/gf180mcu_fd_sc_mcu7t5v0__bufz_3.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__bufz_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/bufz/gf180mcu_fd_sc_mcu7t5v0__bufz_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__bufz_8() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/bufz/gf180mcu_fd_sc_mcu7t5v0__bufz_8.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__clkbuf_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/clkbuf/gf180mcu_fd_sc_mcu7t5v0__clkbuf_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__clkbuf_12() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/clkbuf/gf180mcu_fd_sc_mcu7t5v0__clkbuf_12.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__clkbuf_16() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/clkbuf/gf180mcu_fd_sc_mcu7t5v0__clkbuf_16.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__clkbuf_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/clkbuf/gf180mcu_fd_sc_mcu7t5v0__clkbuf_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__clkbuf_20() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/clkbuf/gf180mcu_fd_sc_mcu7t5v0__clkbuf_20.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__clkbuf_3() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/clkbuf/gf180mcu_fd_sc_mcu7t5v0__clkbuf_3.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__clkbuf_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/clkbuf/gf180mcu_fd_sc_mcu7t5v0__clkbuf_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__clkbuf_8() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/clkbuf/gf180mcu_fd_sc_mcu7t5v0__clkbuf_8.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__clkinv_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/clkinv/gf180mcu_fd_sc_mcu7t5v0__clkinv_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__clkinv_12() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/clkinv/gf180mcu_fd_sc_mcu7t5v0__clkinv_12.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__clkinv_16() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/clkinv/gf180mcu_fd_sc_mcu7t5v0__clkinv_16.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__clkinv_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/clkinv/gf180mcu_fd_sc_mcu7t5v0__clkinv_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__clkinv_20() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/clkinv/gf180mcu_fd_sc_mcu7t5v0__clkinv_20.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__clkinv_3() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/clkinv/gf180mcu_fd_sc_mcu7t5v0__clkinv_3.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__clkinv_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/clkinv/gf180mcu_fd_sc_mcu7t5v0__clkinv_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__clkinv_8() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/clkinv/gf180mcu_fd_sc_mcu7t5v0__clkinv_8.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__dffnq_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/dffnq/gf180mcu_fd_sc_mcu7t5v0__dffnq_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__dffnq_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/dffnq/gf180mcu_fd_sc_mcu7t5v0__dffnq_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__dffnq_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/dffnq/gf180mcu_fd_sc_mcu7t5v0__dffnq_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__dffnrnq_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/dffnrnq/gf180mcu_fd_sc_mcu7t5v0__dffnrnq_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__dffnrnq_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/dffnrnq/gf180mcu_fd_sc_mcu7t5v0__dffnrnq_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__dffnrnq_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/dffnrnq/gf180mcu_fd_sc_mcu7t5v0__dffnrnq_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__dffnrsnq_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/dffnrsnq/gf180mcu_fd_sc_mcu7t5v0__dffnrsnq_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__dffnrsnq_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/dffnrsnq/gf180mcu_fd_sc_mcu7t5v0__dffnrsnq_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__dffnrsnq_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/dffnrsnq/gf180mcu_fd_sc_mcu7t5v0__dffnrsnq_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__dffnsnq_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/dffnsnq/gf180mcu_fd_sc_mcu7t5v0__dffnsnq_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__dffnsnq_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/dffnsnq/gf180mcu_fd_sc_mcu7t5v0__dffnsnq_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__dffnsnq_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/dffnsnq/gf180mcu_fd_sc_mcu7t5v0__dffnsnq_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__dffq_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/dffq/gf180mcu_fd_sc_mcu7t5v0__dffq_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__dffq_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/dffq/gf180mcu_fd_sc_mcu7t5v0__dffq_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__dffq_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/dffq/gf180mcu_fd_sc_mcu7t5v0__dffq_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__sdffq_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/dffq/gf180mcu_fd_sc_mcu7t5v0__sdffq_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__sdffq_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/dffq/gf180mcu_fd_sc_mcu7t5v0__sdffq_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__sdffq_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/dffq/gf180mcu_fd_sc_mcu7t5v0__sdffq_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__dffrnq_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/dffrnq/gf180mcu_fd_sc_mcu7t5v0__dffrnq_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__dffrnq_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/dffrnq/gf180mcu_fd_sc_mcu7t5v0__dffrnq_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__dffrnq_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/dffrnq/gf180mcu_fd_sc_mcu7t5v0__dffrnq_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__sdffrnq_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/dffrnq/gf180mcu_fd_sc_mcu7t5v0__sdffrnq_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__sdffrnq_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/dffrnq/gf180mcu_fd_sc_mcu7t5v0__sdffrnq_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__sdffrnq_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/dffrnq/gf180mcu_fd_sc_mcu7t5v0__sdffrnq_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__dffrsnq_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/dffrsnq/gf180mcu_fd_sc_mcu7t5v0__dffrsnq_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__dffrsnq_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/dffrsnq/gf180mcu_fd_sc_mcu7t5v0__dffrsnq_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__dffrsnq_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/dffrsnq/gf180mcu_fd_sc_mcu7t5v0__dffrsnq_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__sdffrsnq_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/dffrsnq/gf180mcu_fd_sc_mcu7t5v0__sdffrsnq_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__sdffrsnq_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/dffrsnq/gf180mcu_fd_sc_mcu7t5v0__sdffrsnq_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__sdffrsnq_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/dffrsnq/gf180mcu_fd_sc_mcu7t5v0__sdffrsnq_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__dffsnq_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/dffsnq/gf180mcu_fd_sc_mcu7t5v0__dffsnq_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__dffsnq_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/dffsnq/gf180mcu_fd_sc_mcu7t5v0__dffsnq_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__dffsnq_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/dffsnq/gf180mcu_fd_sc_mcu7t5v0__dffsnq_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__sdffsnq_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/dffsnq/gf180mcu_fd_sc_mcu7t5v0__sdffsnq_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__sdffsnq_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/dffsnq/gf180mcu_fd_sc_mcu7t5v0__sdffsnq_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__sdffsnq_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/dffsnq/gf180mcu_fd_sc_mcu7t5v0__sdffsnq_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__dlya_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/dlya/gf180mcu_fd_sc_mcu7t5v0__dlya_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__dlya_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/dlya/gf180mcu_fd_sc_mcu7t5v0__dlya_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__dlya_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/dlya/gf180mcu_fd_sc_mcu7t5v0__dlya_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__dlyb_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/dlyb/gf180mcu_fd_sc_mcu7t5v0__dlyb_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__dlyb_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/dlyb/gf180mcu_fd_sc_mcu7t5v0__dlyb_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__dlyb_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/dlyb/gf180mcu_fd_sc_mcu7t5v0__dlyb_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__dlyc_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/dlyc/gf180mcu_fd_sc_mcu7t5v0__dlyc_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__dlyc_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/dlyc/gf180mcu_fd_sc_mcu7t5v0__dlyc_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__dlyc_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/dlyc/gf180mcu_fd_sc_mcu7t5v0__dlyc_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__dlyd_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/dlyd/gf180mcu_fd_sc_mcu7t5v0__dlyd_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__dlyd_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/dlyd/gf180mcu_fd_sc_mcu7t5v0__dlyd_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__dlyd_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/dlyd/gf180mcu_fd_sc_mcu7t5v0__dlyd_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__endcap() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/endcap/gf180mcu_fd_sc_mcu7t5v0__endcap.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__fill_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/fill/gf180mcu_fd_sc_mcu7t5v0__fill_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__fill_16() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/fill/gf180mcu_fd_sc_mcu7t5v0__fill_16.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__fill_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/fill/gf180mcu_fd_sc_mcu7t5v0__fill_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__fill_32() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/fill/gf180mcu_fd_sc_mcu7t5v0__fill_32.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__fill_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/fill/gf180mcu_fd_sc_mcu7t5v0__fill_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__fill_64() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/fill/gf180mcu_fd_sc_mcu7t5v0__fill_64.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__fill_8() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/fill/gf180mcu_fd_sc_mcu7t5v0__fill_8.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__fillcap_16() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/fillcap/gf180mcu_fd_sc_mcu7t5v0__fillcap_16.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__fillcap_32() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/fillcap/gf180mcu_fd_sc_mcu7t5v0__fillcap_32.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__fillcap_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/fillcap/gf180mcu_fd_sc_mcu7t5v0__fillcap_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__fillcap_64() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/fillcap/gf180mcu_fd_sc_mcu7t5v0__fillcap_64.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__fillcap_8() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/fillcap/gf180mcu_fd_sc_mcu7t5v0__fillcap_8.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__filltie() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/filltie/gf180mcu_fd_sc_mcu7t5v0__filltie.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__hold() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/hold/gf180mcu_fd_sc_mcu7t5v0__hold.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__icgtn_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/icgtn/gf180mcu_fd_sc_mcu7t5v0__icgtn_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__icgtn_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/icgtn/gf180mcu_fd_sc_mcu7t5v0__icgtn_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__icgtn_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/icgtn/gf180mcu_fd_sc_mcu7t5v0__icgtn_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__icgtp_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/icgtp/gf180mcu_fd_sc_mcu7t5v0__icgtp_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__icgtp_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/icgtp/gf180mcu_fd_sc_mcu7t5v0__icgtp_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__icgtp_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/icgtp/gf180mcu_fd_sc_mcu7t5v0__icgtp_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__clkinv_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/inv/gf180mcu_fd_sc_mcu7t5v0__clkinv_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__clkinv_12() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/inv/gf180mcu_fd_sc_mcu7t5v0__clkinv_12.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__clkinv_16() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/inv/gf180mcu_fd_sc_mcu7t5v0__clkinv_16.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__clkinv_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/inv/gf180mcu_fd_sc_mcu7t5v0__clkinv_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__clkinv_20() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/inv/gf180mcu_fd_sc_mcu7t5v0__clkinv_20.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__clkinv_3() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/inv/gf180mcu_fd_sc_mcu7t5v0__clkinv_3.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__clkinv_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/inv/gf180mcu_fd_sc_mcu7t5v0__clkinv_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__clkinv_8() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/inv/gf180mcu_fd_sc_mcu7t5v0__clkinv_8.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__inv_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/inv/gf180mcu_fd_sc_mcu7t5v0__inv_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__inv_12() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/inv/gf180mcu_fd_sc_mcu7t5v0__inv_12.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__inv_16() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/inv/gf180mcu_fd_sc_mcu7t5v0__inv_16.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__inv_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/inv/gf180mcu_fd_sc_mcu7t5v0__inv_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__inv_20() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/inv/gf180mcu_fd_sc_mcu7t5v0__inv_20.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__inv_3() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/inv/gf180mcu_fd_sc_mcu7t5v0__inv_3.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__inv_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/inv/gf180mcu_fd_sc_mcu7t5v0__inv_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__inv_8() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/inv/gf180mcu_fd_sc_mcu7t5v0__inv_8.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__invz_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/invz/gf180mcu_fd_sc_mcu7t5v0__invz_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__invz_12() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/invz/gf180mcu_fd_sc_mcu7t5v0__invz_12.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__invz_16() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/invz/gf180mcu_fd_sc_mcu7t5v0__invz_16.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__invz_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/invz/gf180mcu_fd_sc_mcu7t5v0__invz_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__invz_3() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/invz/gf180mcu_fd_sc_mcu7t5v0__invz_3.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__invz_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/invz/gf180mcu_fd_sc_mcu7t5v0__invz_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__invz_8() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/invz/gf180mcu_fd_sc_mcu7t5v0__invz_8.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__latq_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/latq/gf180mcu_fd_sc_mcu7t5v0__latq_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__latq_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/latq/gf180mcu_fd_sc_mcu7t5v0__latq_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__latq_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/latq/gf180mcu_fd_sc_mcu7t5v0__latq_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__latrnq_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/latrnq/gf180mcu_fd_sc_mcu7t5v0__latrnq_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__latrnq_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/latrnq/gf180mcu_fd_sc_mcu7t5v0__latrnq_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__latrnq_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/latrnq/gf180mcu_fd_sc_mcu7t5v0__latrnq_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__latrsnq_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/latrsnq/gf180mcu_fd_sc_mcu7t5v0__latrsnq_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__latrsnq_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/latrsnq/gf180mcu_fd_sc_mcu7t5v0__latrsnq_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__latrsnq_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/latrsnq/gf180mcu_fd_sc_mcu7t5v0__latrsnq_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__latsnq_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/latsnq/gf180mcu_fd_sc_mcu7t5v0__latsnq_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__latsnq_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/latsnq/gf180mcu_fd_sc_mcu7t5v0__latsnq_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__latsnq_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/latsnq/gf180mcu_fd_sc_mcu7t5v0__latsnq_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__mux2_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/mux2/gf180mcu_fd_sc_mcu7t5v0__mux2_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__mux2_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/mux2/gf180mcu_fd_sc_mcu7t5v0__mux2_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__mux2_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/mux2/gf180mcu_fd_sc_mcu7t5v0__mux2_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__mux4_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/mux4/gf180mcu_fd_sc_mcu7t5v0__mux4_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__mux4_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/mux4/gf180mcu_fd_sc_mcu7t5v0__mux4_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__mux4_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/mux4/gf180mcu_fd_sc_mcu7t5v0__mux4_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__nand2_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/nand2/gf180mcu_fd_sc_mcu7t5v0__nand2_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__nand2_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/nand2/gf180mcu_fd_sc_mcu7t5v0__nand2_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__nand2_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/nand2/gf180mcu_fd_sc_mcu7t5v0__nand2_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__nand3_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/nand3/gf180mcu_fd_sc_mcu7t5v0__nand3_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__nand3_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/nand3/gf180mcu_fd_sc_mcu7t5v0__nand3_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__nand3_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/nand3/gf180mcu_fd_sc_mcu7t5v0__nand3_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__nand4_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/nand4/gf180mcu_fd_sc_mcu7t5v0__nand4_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__nand4_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/nand4/gf180mcu_fd_sc_mcu7t5v0__nand4_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__nand4_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/nand4/gf180mcu_fd_sc_mcu7t5v0__nand4_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__nor2_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/nor2/gf180mcu_fd_sc_mcu7t5v0__nor2_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__nor2_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/nor2/gf180mcu_fd_sc_mcu7t5v0__nor2_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__nor2_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/nor2/gf180mcu_fd_sc_mcu7t5v0__nor2_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__nor3_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/nor3/gf180mcu_fd_sc_mcu7t5v0__nor3_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__nor3_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/nor3/gf180mcu_fd_sc_mcu7t5v0__nor3_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__nor3_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/nor3/gf180mcu_fd_sc_mcu7t5v0__nor3_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__nor4_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/nor4/gf180mcu_fd_sc_mcu7t5v0__nor4_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__nor4_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/nor4/gf180mcu_fd_sc_mcu7t5v0__nor4_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__nor4_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/nor4/gf180mcu_fd_sc_mcu7t5v0__nor4_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__oai21_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/oai21/gf180mcu_fd_sc_mcu7t5v0__oai21_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__oai21_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/oai21/gf180mcu_fd_sc_mcu7t5v0__oai21_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__oai21_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/oai21/gf180mcu_fd_sc_mcu7t5v0__oai21_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__oai211_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/oai211/gf180mcu_fd_sc_mcu7t5v0__oai211_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__oai211_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/oai211/gf180mcu_fd_sc_mcu7t5v0__oai211_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__oai211_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/oai211/gf180mcu_fd_sc_mcu7t5v0__oai211_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__oai22_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/oai22/gf180mcu_fd_sc_mcu7t5v0__oai22_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__oai22_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/oai22/gf180mcu_fd_sc_mcu7t5v0__oai22_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__oai22_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/oai22/gf180mcu_fd_sc_mcu7t5v0__oai22_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__oai221_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/oai221/gf180mcu_fd_sc_mcu7t5v0__oai221_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__oai221_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/oai221/gf180mcu_fd_sc_mcu7t5v0__oai221_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__oai221_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/oai221/gf180mcu_fd_sc_mcu7t5v0__oai221_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__oai222_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/oai222/gf180mcu_fd_sc_mcu7t5v0__oai222_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__oai222_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/oai222/gf180mcu_fd_sc_mcu7t5v0__oai222_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__oai222_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/oai222/gf180mcu_fd_sc_mcu7t5v0__oai222_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__oai31_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/oai31/gf180mcu_fd_sc_mcu7t5v0__oai31_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__oai31_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/oai31/gf180mcu_fd_sc_mcu7t5v0__oai31_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__oai31_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/oai31/gf180mcu_fd_sc_mcu7t5v0__oai31_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__oai32_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/oai32/gf180mcu_fd_sc_mcu7t5v0__oai32_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__oai32_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/oai32/gf180mcu_fd_sc_mcu7t5v0__oai32_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__oai32_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/oai32/gf180mcu_fd_sc_mcu7t5v0__oai32_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__oai33_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/oai33/gf180mcu_fd_sc_mcu7t5v0__oai33_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__oai33_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/oai33/gf180mcu_fd_sc_mcu7t5v0__oai33_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__oai33_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/oai33/gf180mcu_fd_sc_mcu7t5v0__oai33_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__or2_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/or2/gf180mcu_fd_sc_mcu7t5v0__or2_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__or2_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/or2/gf180mcu_fd_sc_mcu7t5v0__or2_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__or2_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/or2/gf180mcu_fd_sc_mcu7t5v0__or2_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__or3_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/or3/gf180mcu_fd_sc_mcu7t5v0__or3_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__or3_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/or3/gf180mcu_fd_sc_mcu7t5v0__or3_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__or3_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/or3/gf180mcu_fd_sc_mcu7t5v0__or3_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__or4_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/or4/gf180mcu_fd_sc_mcu7t5v0__or4_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__or4_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/or4/gf180mcu_fd_sc_mcu7t5v0__or4_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__or4_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/or4/gf180mcu_fd_sc_mcu7t5v0__or4_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__sdffq_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/sdffq/gf180mcu_fd_sc_mcu7t5v0__sdffq_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__sdffq_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/sdffq/gf180mcu_fd_sc_mcu7t5v0__sdffq_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__sdffq_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/sdffq/gf180mcu_fd_sc_mcu7t5v0__sdffq_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__sdffrnq_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/sdffrnq/gf180mcu_fd_sc_mcu7t5v0__sdffrnq_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__sdffrnq_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/sdffrnq/gf180mcu_fd_sc_mcu7t5v0__sdffrnq_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__sdffrnq_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/sdffrnq/gf180mcu_fd_sc_mcu7t5v0__sdffrnq_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__sdffrsnq_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/sdffrsnq/gf180mcu_fd_sc_mcu7t5v0__sdffrsnq_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__sdffrsnq_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/sdffrsnq/gf180mcu_fd_sc_mcu7t5v0__sdffrsnq_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__sdffrsnq_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/sdffrsnq/gf180mcu_fd_sc_mcu7t5v0__sdffrsnq_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__sdffsnq_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/sdffsnq/gf180mcu_fd_sc_mcu7t5v0__sdffsnq_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__sdffsnq_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/sdffsnq/gf180mcu_fd_sc_mcu7t5v0__sdffsnq_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__sdffsnq_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/sdffsnq/gf180mcu_fd_sc_mcu7t5v0__sdffsnq_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__tieh() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/tieh/gf180mcu_fd_sc_mcu7t5v0__tieh.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__tiel() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/tiel/gf180mcu_fd_sc_mcu7t5v0__tiel.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__xnor2_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/xnor2/gf180mcu_fd_sc_mcu7t5v0__xnor2_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__xnor2_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/xnor2/gf180mcu_fd_sc_mcu7t5v0__xnor2_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__xnor2_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/xnor2/gf180mcu_fd_sc_mcu7t5v0__xnor2_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__xnor3_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/xnor3/gf180mcu_fd_sc_mcu7t5v0__xnor3_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__xnor3_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/xnor3/gf180mcu_fd_sc_mcu7t5v0__xnor3_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__xnor3_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu7t5v0/cells/xnor3/gf180mcu_fd_sc_mcu7t5v0__xnor3_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__xor2_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/xor2/gf180mcu_fd_sc_mcu7t5v0__xor2_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__xor2_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/xor2/gf180mcu_fd_sc_mcu7t5v0__xor2_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__xor2_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/xor2/gf180mcu_fd_sc_mcu7t5v0__xor2_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__xor3_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/xor3/gf180mcu_fd_sc_mcu7t5v0__xor3_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__xor3_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/xor3/gf180mcu_fd_sc_mcu7t5v0__xor3_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu7t5v0__xor3_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu7t5v0/cells/xor3/gf180mcu_fd_sc_mcu7t5v0__xor3_4.gds"
-    )
-
-
-# ── 9-track 5V standard cells ──
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__addf_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/addf/gf180mcu_fd_sc_mcu9t5v0__addf_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__addf_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/addf/gf180mcu_fd_sc_mcu9t5v0__addf_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__addf_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/addf/gf180mcu_fd_sc_mcu9t5v0__addf_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__addh_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/addh/gf180mcu_fd_sc_mcu9t5v0__addh_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__addh_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/addh/gf180mcu_fd_sc_mcu9t5v0__addh_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__addh_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/addh/gf180mcu_fd_sc_mcu9t5v0__addh_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__and2_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/and2/gf180mcu_fd_sc_mcu9t5v0__and2_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__and2_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/and2/gf180mcu_fd_sc_mcu9t5v0__and2_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__and2_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/and2/gf180mcu_fd_sc_mcu9t5v0__and2_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__and3_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/and3/gf180mcu_fd_sc_mcu9t5v0__and3_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__and3_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/and3/gf180mcu_fd_sc_mcu9t5v0__and3_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__and3_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/and3/gf180mcu_fd_sc_mcu9t5v0__and3_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__and4_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/and4/gf180mcu_fd_sc_mcu9t5v0__and4_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__and4_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/and4/gf180mcu_fd_sc_mcu9t5v0__and4_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__and4_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/and4/gf180mcu_fd_sc_mcu9t5v0__and4_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__antenna() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/antenna/gf180mcu_fd_sc_mcu9t5v0__antenna.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__aoi21_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/aoi21/gf180mcu_fd_sc_mcu9t5v0__aoi21_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__aoi21_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/aoi21/gf180mcu_fd_sc_mcu9t5v0__aoi21_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__aoi21_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/aoi21/gf180mcu_fd_sc_mcu9t5v0__aoi21_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__aoi211_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/aoi211/gf180mcu_fd_sc_mcu9t5v0__aoi211_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__aoi211_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/aoi211/gf180mcu_fd_sc_mcu9t5v0__aoi211_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__aoi211_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/aoi211/gf180mcu_fd_sc_mcu9t5v0__aoi211_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__aoi22_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/aoi22/gf180mcu_fd_sc_mcu9t5v0__aoi22_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__aoi22_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/aoi22/gf180mcu_fd_sc_mcu9t5v0__aoi22_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__aoi22_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/aoi22/gf180mcu_fd_sc_mcu9t5v0__aoi22_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__aoi221_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/aoi221/gf180mcu_fd_sc_mcu9t5v0__aoi221_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__aoi221_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/aoi221/gf180mcu_fd_sc_mcu9t5v0__aoi221_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__aoi221_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/aoi221/gf180mcu_fd_sc_mcu9t5v0__aoi221_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__aoi222_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/aoi222/gf180mcu_fd_sc_mcu9t5v0__aoi222_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__aoi222_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/aoi222/gf180mcu_fd_sc_mcu9t5v0__aoi222_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__aoi222_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/aoi222/gf180mcu_fd_sc_mcu9t5v0__aoi222_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__buf_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/buf/gf180mcu_fd_sc_mcu9t5v0__buf_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__buf_12() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/buf/gf180mcu_fd_sc_mcu9t5v0__buf_12.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__buf_16() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/buf/gf180mcu_fd_sc_mcu9t5v0__buf_16.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__buf_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/buf/gf180mcu_fd_sc_mcu9t5v0__buf_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__buf_20() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/buf/gf180mcu_fd_sc_mcu9t5v0__buf_20.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__buf_3() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/buf/gf180mcu_fd_sc_mcu9t5v0__buf_3.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__buf_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/buf/gf180mcu_fd_sc_mcu9t5v0__buf_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__buf_8() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/buf/gf180mcu_fd_sc_mcu9t5v0__buf_8.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__bufz_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/bufz/gf180mcu_fd_sc_mcu9t5v0__bufz_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__bufz_12() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/bufz/gf180mcu_fd_sc_mcu9t5v0__bufz_12.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__bufz_16() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/bufz/gf180mcu_fd_sc_mcu9t5v0__bufz_16.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__bufz_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/bufz/gf180mcu_fd_sc_mcu9t5v0__bufz_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__bufz_3() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/bufz/gf180mcu_fd_sc_mcu9t5v0__bufz_3.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__bufz_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/bufz/gf180mcu_fd_sc_mcu9t5v0__bufz_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__bufz_8() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/bufz/gf180mcu_fd_sc_mcu9t5v0__bufz_8.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__clkbuf_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/clkbuf/gf180mcu_fd_sc_mcu9t5v0__clkbuf_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__clkbuf_12() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/clkbuf/gf180mcu_fd_sc_mcu9t5v0__clkbuf_12.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__clkbuf_16() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/clkbuf/gf180mcu_fd_sc_mcu9t5v0__clkbuf_16.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__clkbuf_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/clkbuf/gf180mcu_fd_sc_mcu9t5v0__clkbuf_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__clkbuf_20() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/clkbuf/gf180mcu_fd_sc_mcu9t5v0__clkbuf_20.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__clkbuf_3() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/clkbuf/gf180mcu_fd_sc_mcu9t5v0__clkbuf_3.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__clkbuf_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/clkbuf/gf180mcu_fd_sc_mcu9t5v0__clkbuf_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__clkbuf_8() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/clkbuf/gf180mcu_fd_sc_mcu9t5v0__clkbuf_8.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__clkinv_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/clkinv/gf180mcu_fd_sc_mcu9t5v0__clkinv_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__clkinv_12() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/clkinv/gf180mcu_fd_sc_mcu9t5v0__clkinv_12.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__clkinv_16() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/clkinv/gf180mcu_fd_sc_mcu9t5v0__clkinv_16.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__clkinv_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/clkinv/gf180mcu_fd_sc_mcu9t5v0__clkinv_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__clkinv_20() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/clkinv/gf180mcu_fd_sc_mcu9t5v0__clkinv_20.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__clkinv_3() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/clkinv/gf180mcu_fd_sc_mcu9t5v0__clkinv_3.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__clkinv_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/clkinv/gf180mcu_fd_sc_mcu9t5v0__clkinv_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__clkinv_8() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/clkinv/gf180mcu_fd_sc_mcu9t5v0__clkinv_8.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__dffnq_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/dffnq/gf180mcu_fd_sc_mcu9t5v0__dffnq_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__dffnq_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/dffnq/gf180mcu_fd_sc_mcu9t5v0__dffnq_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__dffnq_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/dffnq/gf180mcu_fd_sc_mcu9t5v0__dffnq_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__dffnrnq_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/dffnrnq/gf180mcu_fd_sc_mcu9t5v0__dffnrnq_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__dffnrnq_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/dffnrnq/gf180mcu_fd_sc_mcu9t5v0__dffnrnq_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__dffnrnq_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/dffnrnq/gf180mcu_fd_sc_mcu9t5v0__dffnrnq_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__dffnrsnq_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/dffnrsnq/gf180mcu_fd_sc_mcu9t5v0__dffnrsnq_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__dffnrsnq_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/dffnrsnq/gf180mcu_fd_sc_mcu9t5v0__dffnrsnq_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__dffnrsnq_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/dffnrsnq/gf180mcu_fd_sc_mcu9t5v0__dffnrsnq_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__dffnsnq_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/dffnsnq/gf180mcu_fd_sc_mcu9t5v0__dffnsnq_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__dffnsnq_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/dffnsnq/gf180mcu_fd_sc_mcu9t5v0__dffnsnq_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__dffnsnq_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/dffnsnq/gf180mcu_fd_sc_mcu9t5v0__dffnsnq_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__dffq_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/dffq/gf180mcu_fd_sc_mcu9t5v0__dffq_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__dffq_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/dffq/gf180mcu_fd_sc_mcu9t5v0__dffq_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__dffq_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/dffq/gf180mcu_fd_sc_mcu9t5v0__dffq_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__sdffq_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/dffq/gf180mcu_fd_sc_mcu9t5v0__sdffq_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__sdffq_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/dffq/gf180mcu_fd_sc_mcu9t5v0__sdffq_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__sdffq_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/dffq/gf180mcu_fd_sc_mcu9t5v0__sdffq_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__dffrnq_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/dffrnq/gf180mcu_fd_sc_mcu9t5v0__dffrnq_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__dffrnq_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/dffrnq/gf180mcu_fd_sc_mcu9t5v0__dffrnq_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__dffrnq_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/dffrnq/gf180mcu_fd_sc_mcu9t5v0__dffrnq_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__sdffrnq_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/dffrnq/gf180mcu_fd_sc_mcu9t5v0__sdffrnq_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__sdffrnq_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/dffrnq/gf180mcu_fd_sc_mcu9t5v0__sdffrnq_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__sdffrnq_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/dffrnq/gf180mcu_fd_sc_mcu9t5v0__sdffrnq_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__dffrsnq_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/dffrsnq/gf180mcu_fd_sc_mcu9t5v0__dffrsnq_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__dffrsnq_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/dffrsnq/gf180mcu_fd_sc_mcu9t5v0__dffrsnq_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__dffrsnq_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/dffrsnq/gf180mcu_fd_sc_mcu9t5v0__dffrsnq_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__sdffrsnq_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/dffrsnq/gf180mcu_fd_sc_mcu9t5v0__sdffrsnq_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__sdffrsnq_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/dffrsnq/gf180mcu_fd_sc_mcu9t5v0__sdffrsnq_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__sdffrsnq_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/dffrsnq/gf180mcu_fd_sc_mcu9t5v0__sdffrsnq_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__dffsnq_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/dffsnq/gf180mcu_fd_sc_mcu9t5v0__dffsnq_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__dffsnq_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/dffsnq/gf180mcu_fd_sc_mcu9t5v0__dffsnq_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__dffsnq_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/dffsnq/gf180mcu_fd_sc_mcu9t5v0__dffsnq_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__sdffsnq_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/dffsnq/gf180mcu_fd_sc_mcu9t5v0__sdffsnq_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__sdffsnq_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/dffsnq/gf180mcu_fd_sc_mcu9t5v0__sdffsnq_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__sdffsnq_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/dffsnq/gf180mcu_fd_sc_mcu9t5v0__sdffsnq_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__dlya_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/dlya/gf180mcu_fd_sc_mcu9t5v0__dlya_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__dlya_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/dlya/gf180mcu_fd_sc_mcu9t5v0__dlya_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__dlya_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/dlya/gf180mcu_fd_sc_mcu9t5v0__dlya_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__dlyb_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/dlyb/gf180mcu_fd_sc_mcu9t5v0__dlyb_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__dlyb_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/dlyb/gf180mcu_fd_sc_mcu9t5v0__dlyb_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__dlyb_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/dlyb/gf180mcu_fd_sc_mcu9t5v0__dlyb_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__dlyc_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/dlyc/gf180mcu_fd_sc_mcu9t5v0__dlyc_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__dlyc_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/dlyc/gf180mcu_fd_sc_mcu9t5v0__dlyc_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__dlyc_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/dlyc/gf180mcu_fd_sc_mcu9t5v0__dlyc_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__dlyd_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/dlyd/gf180mcu_fd_sc_mcu9t5v0__dlyd_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__dlyd_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/dlyd/gf180mcu_fd_sc_mcu9t5v0__dlyd_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__dlyd_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/dlyd/gf180mcu_fd_sc_mcu9t5v0__dlyd_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__endcap() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/endcap/gf180mcu_fd_sc_mcu9t5v0__endcap.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__fill_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/fill/gf180mcu_fd_sc_mcu9t5v0__fill_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__fill_16() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/fill/gf180mcu_fd_sc_mcu9t5v0__fill_16.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__fill_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/fill/gf180mcu_fd_sc_mcu9t5v0__fill_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__fill_32() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/fill/gf180mcu_fd_sc_mcu9t5v0__fill_32.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__fill_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/fill/gf180mcu_fd_sc_mcu9t5v0__fill_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__fill_64() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/fill/gf180mcu_fd_sc_mcu9t5v0__fill_64.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__fill_8() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/fill/gf180mcu_fd_sc_mcu9t5v0__fill_8.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__fillcap_16() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/fillcap/gf180mcu_fd_sc_mcu9t5v0__fillcap_16.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__fillcap_32() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/fillcap/gf180mcu_fd_sc_mcu9t5v0__fillcap_32.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__fillcap_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/fillcap/gf180mcu_fd_sc_mcu9t5v0__fillcap_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__fillcap_64() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/fillcap/gf180mcu_fd_sc_mcu9t5v0__fillcap_64.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__fillcap_8() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/fillcap/gf180mcu_fd_sc_mcu9t5v0__fillcap_8.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__filltie() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/filltie/gf180mcu_fd_sc_mcu9t5v0__filltie.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__hold() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/hold/gf180mcu_fd_sc_mcu9t5v0__hold.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__icgtn_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/icgtn/gf180mcu_fd_sc_mcu9t5v0__icgtn_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__icgtn_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/icgtn/gf180mcu_fd_sc_mcu9t5v0__icgtn_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__icgtn_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/icgtn/gf180mcu_fd_sc_mcu9t5v0__icgtn_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__icgtp_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/icgtp/gf180mcu_fd_sc_mcu9t5v0__icgtp_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__icgtp_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/icgtp/gf180mcu_fd_sc_mcu9t5v0__icgtp_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__icgtp_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/icgtp/gf180mcu_fd_sc_mcu9t5v0__icgtp_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__clkinv_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/inv/gf180mcu_fd_sc_mcu9t5v0__clkinv_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__clkinv_12() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/inv/gf180mcu_fd_sc_mcu9t5v0__clkinv_12.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__clkinv_16() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/inv/gf180mcu_fd_sc_mcu9t5v0__clkinv_16.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__clkinv_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/inv/gf180mcu_fd_sc_mcu9t5v0__clkinv_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__clkinv_20() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/inv/gf180mcu_fd_sc_mcu9t5v0__clkinv_20.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__clkinv_3() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/inv/gf180mcu_fd_sc_mcu9t5v0__clkinv_3.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__clkinv_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/inv/gf180mcu_fd_sc_mcu9t5v0__clkinv_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__clkinv_8() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/inv/gf180mcu_fd_sc_mcu9t5v0__clkinv_8.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__inv_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/inv/gf180mcu_fd_sc_mcu9t5v0__inv_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__inv_12() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/inv/gf180mcu_fd_sc_mcu9t5v0__inv_12.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__inv_16() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/inv/gf180mcu_fd_sc_mcu9t5v0__inv_16.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__inv_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/inv/gf180mcu_fd_sc_mcu9t5v0__inv_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__inv_20() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/inv/gf180mcu_fd_sc_mcu9t5v0__inv_20.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__inv_3() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/inv/gf180mcu_fd_sc_mcu9t5v0__inv_3.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__inv_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/inv/gf180mcu_fd_sc_mcu9t5v0__inv_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__inv_8() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/inv/gf180mcu_fd_sc_mcu9t5v0__inv_8.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__invz_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/invz/gf180mcu_fd_sc_mcu9t5v0__invz_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__invz_12() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/invz/gf180mcu_fd_sc_mcu9t5v0__invz_12.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__invz_16() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/invz/gf180mcu_fd_sc_mcu9t5v0__invz_16.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__invz_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/invz/gf180mcu_fd_sc_mcu9t5v0__invz_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__invz_3() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/invz/gf180mcu_fd_sc_mcu9t5v0__invz_3.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__invz_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/invz/gf180mcu_fd_sc_mcu9t5v0__invz_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__invz_8() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/invz/gf180mcu_fd_sc_mcu9t5v0__invz_8.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__latq_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/latq/gf180mcu_fd_sc_mcu9t5v0__latq_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__latq_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/latq/gf180mcu_fd_sc_mcu9t5v0__latq_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__latq_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/latq/gf180mcu_fd_sc_mcu9t5v0__latq_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__latrnq_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/latrnq/gf180mcu_fd_sc_mcu9t5v0__latrnq_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__latrnq_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/latrnq/gf180mcu_fd_sc_mcu9t5v0__latrnq_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__latrnq_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/latrnq/gf180mcu_fd_sc_mcu9t5v0__latrnq_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__latrsnq_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/latrsnq/gf180mcu_fd_sc_mcu9t5v0__latrsnq_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__latrsnq_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/latrsnq/gf180mcu_fd_sc_mcu9t5v0__latrsnq_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__latrsnq_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/latrsnq/gf180mcu_fd_sc_mcu9t5v0__latrsnq_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__latsnq_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/latsnq/gf180mcu_fd_sc_mcu9t5v0__latsnq_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__latsnq_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/latsnq/gf180mcu_fd_sc_mcu9t5v0__latsnq_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__latsnq_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/latsnq/gf180mcu_fd_sc_mcu9t5v0__latsnq_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__mux2_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/mux2/gf180mcu_fd_sc_mcu9t5v0__mux2_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__mux2_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/mux2/gf180mcu_fd_sc_mcu9t5v0__mux2_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__mux2_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/mux2/gf180mcu_fd_sc_mcu9t5v0__mux2_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__mux4_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/mux4/gf180mcu_fd_sc_mcu9t5v0__mux4_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__mux4_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/mux4/gf180mcu_fd_sc_mcu9t5v0__mux4_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__mux4_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/mux4/gf180mcu_fd_sc_mcu9t5v0__mux4_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__nand2_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/nand2/gf180mcu_fd_sc_mcu9t5v0__nand2_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__nand2_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/nand2/gf180mcu_fd_sc_mcu9t5v0__nand2_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__nand2_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/nand2/gf180mcu_fd_sc_mcu9t5v0__nand2_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__nand3_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/nand3/gf180mcu_fd_sc_mcu9t5v0__nand3_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__nand3_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/nand3/gf180mcu_fd_sc_mcu9t5v0__nand3_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__nand3_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/nand3/gf180mcu_fd_sc_mcu9t5v0__nand3_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__nand4_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/nand4/gf180mcu_fd_sc_mcu9t5v0__nand4_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__nand4_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/nand4/gf180mcu_fd_sc_mcu9t5v0__nand4_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__nand4_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/nand4/gf180mcu_fd_sc_mcu9t5v0__nand4_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__nor2_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/nor2/gf180mcu_fd_sc_mcu9t5v0__nor2_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__nor2_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/nor2/gf180mcu_fd_sc_mcu9t5v0__nor2_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__nor2_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/nor2/gf180mcu_fd_sc_mcu9t5v0__nor2_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__nor3_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/nor3/gf180mcu_fd_sc_mcu9t5v0__nor3_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__nor3_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/nor3/gf180mcu_fd_sc_mcu9t5v0__nor3_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__nor3_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/nor3/gf180mcu_fd_sc_mcu9t5v0__nor3_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__nor4_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/nor4/gf180mcu_fd_sc_mcu9t5v0__nor4_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__nor4_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/nor4/gf180mcu_fd_sc_mcu9t5v0__nor4_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__nor4_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/nor4/gf180mcu_fd_sc_mcu9t5v0__nor4_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__oai21_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/oai21/gf180mcu_fd_sc_mcu9t5v0__oai21_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__oai21_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/oai21/gf180mcu_fd_sc_mcu9t5v0__oai21_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__oai21_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/oai21/gf180mcu_fd_sc_mcu9t5v0__oai21_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__oai211_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/oai211/gf180mcu_fd_sc_mcu9t5v0__oai211_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__oai211_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/oai211/gf180mcu_fd_sc_mcu9t5v0__oai211_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__oai211_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/oai211/gf180mcu_fd_sc_mcu9t5v0__oai211_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__oai22_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/oai22/gf180mcu_fd_sc_mcu9t5v0__oai22_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__oai22_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/oai22/gf180mcu_fd_sc_mcu9t5v0__oai22_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__oai22_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/oai22/gf180mcu_fd_sc_mcu9t5v0__oai22_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__oai221_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/oai221/gf180mcu_fd_sc_mcu9t5v0__oai221_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__oai221_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/oai221/gf180mcu_fd_sc_mcu9t5v0__oai221_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__oai221_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/oai221/gf180mcu_fd_sc_mcu9t5v0__oai221_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__oai222_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/oai222/gf180mcu_fd_sc_mcu9t5v0__oai222_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__oai222_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/oai222/gf180mcu_fd_sc_mcu9t5v0__oai222_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__oai222_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/oai222/gf180mcu_fd_sc_mcu9t5v0__oai222_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__oai31_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/oai31/gf180mcu_fd_sc_mcu9t5v0__oai31_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__oai31_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/oai31/gf180mcu_fd_sc_mcu9t5v0__oai31_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__oai31_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/oai31/gf180mcu_fd_sc_mcu9t5v0__oai31_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__oai32_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/oai32/gf180mcu_fd_sc_mcu9t5v0__oai32_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__oai32_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/oai32/gf180mcu_fd_sc_mcu9t5v0__oai32_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__oai32_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/oai32/gf180mcu_fd_sc_mcu9t5v0__oai32_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__oai33_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/oai33/gf180mcu_fd_sc_mcu9t5v0__oai33_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__oai33_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/oai33/gf180mcu_fd_sc_mcu9t5v0__oai33_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__oai33_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/oai33/gf180mcu_fd_sc_mcu9t5v0__oai33_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__or2_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/or2/gf180mcu_fd_sc_mcu9t5v0__or2_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__or2_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/or2/gf180mcu_fd_sc_mcu9t5v0__or2_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__or2_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/or2/gf180mcu_fd_sc_mcu9t5v0__or2_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__or3_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/or3/gf180mcu_fd_sc_mcu9t5v0__or3_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__or3_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/or3/gf180mcu_fd_sc_mcu9t5v0__or3_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__or3_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/or3/gf180mcu_fd_sc_mcu9t5v0__or3_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__or4_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/or4/gf180mcu_fd_sc_mcu9t5v0__or4_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__or4_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/or4/gf180mcu_fd_sc_mcu9t5v0__or4_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__or4_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/or4/gf180mcu_fd_sc_mcu9t5v0__or4_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__sdffq_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/sdffq/gf180mcu_fd_sc_mcu9t5v0__sdffq_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__sdffq_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/sdffq/gf180mcu_fd_sc_mcu9t5v0__sdffq_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__sdffq_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/sdffq/gf180mcu_fd_sc_mcu9t5v0__sdffq_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__sdffrnq_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/sdffrnq/gf180mcu_fd_sc_mcu9t5v0__sdffrnq_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__sdffrnq_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/sdffrnq/gf180mcu_fd_sc_mcu9t5v0__sdffrnq_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__sdffrnq_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/sdffrnq/gf180mcu_fd_sc_mcu9t5v0__sdffrnq_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__sdffrsnq_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/sdffrsnq/gf180mcu_fd_sc_mcu9t5v0__sdffrsnq_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__sdffrsnq_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/sdffrsnq/gf180mcu_fd_sc_mcu9t5v0__sdffrsnq_2.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__sdffrsnq_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/sdffrsnq/gf180mcu_fd_sc_mcu9t5v0__sdffrsnq_4.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__sdffsnq_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/sdffsnq/gf180mcu_fd_sc_mcu9t5v0__sdffsnq_1.gds"
-    )
-
-
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__sdffsnq_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/sdffsnq/gf180mcu_fd_sc_mcu9t5v0__sdffsnq_2.gds"
-    )
 
+_LIBRARY_PATHS = _load_manifest()
+_GDS_PATHS = {
+    name: path for paths in _LIBRARY_PATHS.values() for name, path in paths.items()
+}
 
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__sdffsnq_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/sdffsnq/gf180mcu_fd_sc_mcu9t5v0__sdffsnq_4.gds"
-    )
+LIBRARIES = tuple(_LIBRARY_PATHS)
 
+__all__ = ["LIBRARIES", "abstract", "load_library", *sorted(_GDS_PATHS)]
 
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__tieh() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/tieh/gf180mcu_fd_sc_mcu9t5v0__tieh.gds"
-    )
+# Shared layouts and port tables filled by load_library, keyed by library name.
+_LOADED: dict[str, kf.KCLayout] = {}
+_PORTS: dict[str, port_cache.PortTable] = {}
 
 
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__tiel() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/tiel/gf180mcu_fd_sc_mcu9t5v0__tiel.gds"
-    )
+def _library_of(name: str) -> str:
+    return name.split("__", 1)[0]
 
 
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__xnor2_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/xnor2/gf180mcu_fd_sc_mcu9t5v0__xnor2_1.gds"
-    )
+def _read_library(library: str) -> kf.KCLayout:
+    kcl = _LOADED.get(library)
+    if kcl is None:
+        options = kf.utilities.load_layout_options()
+        options.warn_level = 0
+        options.cell_conflict_resolution = (
+            kf.kdb.LoadLayoutOptions.CellConflictResolution.RenameCell
+        )
+        kcl = kf.KCLayout(name=f"{__name__}.{library}")
+        for gds_path in _LIBRARY_PATHS[library].values():
+            kcl.layout.read(str(gds_path), options)
+        _PORTS[library] = port_cache.PortTable(
+            library, _LIBRARY_PATHS[library], _add_ports
+        )
+        _LOADED[library] = kcl
+    return kcl
 
 
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__xnor2_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/xnor2/gf180mcu_fd_sc_mcu9t5v0__xnor2_2.gds"
-    )
+def load_library(library: str) -> dict[str, gf.Component]:
+    """Returns all cells of a library, read from disk in a single pass.
 
+    Args:
+        library: library name, one of LIBRARIES.
+    """
+    if library not in _LIBRARY_PATHS:
+        raise ValueError(f"Unknown library {library!r}, expected one of {LIBRARIES}")
+    _read_library(library)
+    cells = {name: _get_cell(name)() for name in _LIBRARY_PATHS[library]}
+    _PORTS[library].save()
+    return cells
 
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__xnor2_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/xnor2/gf180mcu_fd_sc_mcu9t5v0__xnor2_4.gds"
-    )
 
+def abstract(name: str) -> views.Abstract:
+    """Returns the abstract view (outline, row height and pins) of a cell.
 
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__xnor3_1() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/xnor3/gf180mcu_fd_sc_mcu9t5v0__xnor3_1.gds"
-    )
+    Args:
+        name: cell name, e.g. "gf180mcu_fd_sc_mcu7t5v0__nand2_1".
+    """
+    if name not in _GDS_PATHS:
+        raise ValueError(f"Unknown standard cell {name!r}")
+    library = _library_of(name)
+    return views.load_abstracts(library, _LIBRARY_PATHS[library])[name]
 
 
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__xnor3_2() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/xnor3/gf180mcu_fd_sc_mcu9t5v0__xnor3_2.gds"
-    )
+def _make_cell(name: str) -> Callable[[], gf.Component]:
+    gds_path = _GDS_PATHS[name]
+    library = _library_of(name)
 
+    def _cell() -> gf.Component:
+        kcl = _LOADED.get(library)
+        if kcl is None:
+            return _import_gds(gds_path)
+        c = kcell_to_component(kcl[name])
+        return _PORTS[library].add_ports(c, name)
 
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__xnor3_4() -> gf.Component:
-    return _import_gds(
-        _SRC
-        / "gf180mcu_fd_sc_mcu9t5v0/cells/xnor3/gf180mcu_fd_sc_mcu9t5v0__xnor3_4.gds"
-    )
+    _cell.__name__ = _cell.__qualname__ = name
+    _cell.__module__ = __name__
+    _cell.__doc__ = f"Returns {name} imported from GDS."
+    return gf.cell(_cell)
 
 
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__xor2_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/xor2/gf180mcu_fd_sc_mcu9t5v0__xor2_1.gds"
-    )
+def _get_cell(name: str) -> Callable[[], gf.Component]:
+    func = globals().get(name)
+    if func is None:
+        func = globals()[name] = _make_cell(name)
+    return func
 
 
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__xor2_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/xor2/gf180mcu_fd_sc_mcu9t5v0__xor2_2.gds"
-    )
+def __getattr__(name: str) -> Callable[[], gf.Component]:
+    if name in _GDS_PATHS:
+        return _get_cell(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__xor2_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/xor2/gf180mcu_fd_sc_mcu9t5v0__xor2_4.gds"
-    )
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_GDS_PATHS})
 
 
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__xor3_1() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/xor3/gf180mcu_fd_sc_mcu9t5v0__xor3_1.gds"
-    )
+class _LazyCell:
+    """Stand-in registered in the PDK until the cell function is needed.
 
+    It carries the name, module and docstring of the cell function itself,
+    so listing or introspecting PDK.cells does not build any cell. Other
+    public attributes are looked up on the real cell function.
+    """
 
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__xor3_2() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/xor3/gf180mcu_fd_sc_mcu9t5v0__xor3_2.gds"
-    )
+    def __init__(self, name: str) -> None:
+        self.name = self.__name__ = self.__qualname__ = name
+        self.__module__ = __name__
+        self.__doc__ = f"Returns {name} imported from GDS."
+        self.__signature__ = inspect.Signature()
 
+    def __call__(self, *args, **kwargs) -> gf.Component:
+        return _get_cell(self.name)(*args, **kwargs)
 
-@gf.cell
-def gf180mcu_fd_sc_mcu9t5v0__xor3_4() -> gf.Component:
-    return _import_gds(
-        _SRC / "gf180mcu_fd_sc_mcu9t5v0/cells/xor3/gf180mcu_fd_sc_mcu9t5v0__xor3_4.gds"
-    )
+    def __getattr__(self, attr: str):
+        # dunder probes (__wrapped__, __func__, ...) come from introspection
+        if attr.startswith("__"):
+            raise AttributeError(attr)
+        return getattr(_get_cell(self.name), attr)
+
+    def __repr__(self) -> str:
+        return f"<lazy cell {__name__}.{self.name}>"
+
+
+factories: dict[str, Callable[[], gf.Component]] = {
+    name: _LazyCell(name) for name in _GDS_PATHS
+}
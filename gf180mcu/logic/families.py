@@ -0,0 +1,177 @@
+"""Drive-strength families of the standard cells and in-place resizing.
+
+Cell names encode the function and the drive strength
+(``gf180mcu_fd_sc_mcu7t5v0__nand2_4`` is function ``nand2``, drive 4). The
+family index groups the variants of every function per library, with their
+widths from the abstract views. ``resize`` swaps the cell of a placed
+instance for another variant, keeps its origin and pushes right-hand
+neighbours in the same row only as far as needed, both in the Placement
+and, if given, in the component built from it.
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+from typing import NamedTuple
+
+import gdsfactory as gf
+import klayout.db as kdb
+import numpy as np
+
+from gf180mcu import logic
+from gf180mcu.logic.placer import Placement, master_widths
+
+__all__ = ["Variant", "families", "next_size", "parse", "resize", "variants"]
+
+_NAME = re.compile(r"(?P<library>\w+?)__(?P<function>\w+?)(?:_(?P<drive>\d+))?$")
+
+
+class Variant(NamedTuple):
+    """One drive strength of a cell function."""
+
+    name: str
+    drive: int | None
+    width: float
+
+
+def parse(name: str) -> tuple[str, str, int | None]:
+    """Returns (library, function, drive) of a cell name.
+
+    Cells without a drive suffix (e.g. ``filltie``) have drive None.
+    """
+    m = _NAME.match(name)
+    if m is None or name not in logic._GDS_PATHS:
+        raise ValueError(f"Unknown standard cell {name!r}")
+    drive = m["drive"]
+    return m["library"], m["function"], int(drive) if drive else None
+
+
+@functools.cache
+def families(library: str) -> dict[str, tuple[Variant, ...]]:
+    """Returns {function: variants sorted by drive} for a library."""
+    if library not in logic._LIBRARY_PATHS:
+        raise ValueError(
+            f"Unknown library {library!r}, expected one of {logic.LIBRARIES}"
+        )
+    names = list(logic._LIBRARY_PATHS[library])
+    widths = master_widths(library, names) * 0.001
+    grouped: dict[str, list[Variant]] = {}
+    for name, width in zip(names, widths.tolist()):
+        _, function, drive = parse(name)
+        grouped.setdefault(function, []).append(Variant(name, drive, round(width, 3)))
+    return {
+        function: tuple(sorted(v, key=lambda v: v.drive or 0))
+        for function, v in sorted(grouped.items())
+    }
+
+
+def variants(name: str) -> tuple[Variant, ...]:
+    """Returns all drive strengths of the function of a cell."""
+    library, function, _ = parse(name)
+    return families(library)[function]
+
+
+def next_size(name: str, step: int = 1) -> str:
+    """Returns the variant ``step`` drive strengths up (or down if negative).
+
+    Raises:
+        ValueError: if there is no such variant.
+    """
+    names = [v.name for v in variants(name)]
+    i = names.index(name) + step
+    if not 0 <= i < len(names):
+        raise ValueError(f"{name} has no variant {step:+d} drive steps away")
+    return names[i]
+
+
+def _find_instance(
+    cell: kdb.Cell, cell_index: int, x: int, y: int
+) -> kdb.Instance | None:
+    origin = kdb.Point(x, y)
+    for inst in cell.each_overlapping_inst(kdb.Box(origin, origin).enlarged(1)):
+        if inst.cell_index == cell_index and inst.trans.disp == origin:
+            return inst
+    return None
+
+
+def _update_layout(
+    c: gf.Component,
+    placement: Placement,
+    moved: np.ndarray,
+    old_x: np.ndarray,
+    old_master: int,
+    instance: int,
+) -> None:
+    """Applies a resize to the instances placer.build put into ``c``."""
+    cell = c.kdb_cell
+    index = [getattr(logic, m)().kdb_cell.cell_index() for m in placement.masters]
+    y = placement.y + np.where(placement.mirror, placement.row_height, 0)
+    changes = [(instance, old_master, int(placement.x[instance]))]
+    changes += [(j, int(placement.master[j]), int(x)) for j, x in zip(moved, old_x)]
+    for j, master, x in changes:
+        inst = _find_instance(cell, index[master], x, int(y[j]))
+        if inst is None:
+            raise ValueError(f"Instance {j} of the placement is not in {c.name}")
+        if j == instance:
+            inst.cell_index = index[int(placement.master[j])]
+        else:
+            trans = inst.trans
+            inst.trans = kdb.Trans(
+                trans.rot, trans.is_mirror(), int(placement.x[j]), trans.disp.y
+            )
+
+
+def resize(
+    placement: Placement,
+    instance: int,
+    cell: str,
+    component: gf.Component | None = None,
+) -> Placement:
+    """Replaces the cell of a placed instance in place, keeping its origin.
+
+    Cells to the right in the same row are shifted right just enough to
+    clear the new width; a smaller cell leaves a gap for the filler.
+
+    Args:
+        placement: placement to modify.
+        instance: index of the instance to resize.
+        cell: new cell name, usually a variant of the current one.
+        component: component built from the placement with placer.build.
+            Its instances are swapped and moved in place as well.
+
+    Raises:
+        ValueError: if the resized row would not fit in the row width.
+    """
+    if cell.split("__", 1)[0] != placement.library:
+        raise ValueError(f"{cell} is not in library {placement.library}")
+    widths = master_widths(placement.library, placement.masters)
+    new_width = int(master_widths(placement.library, [cell])[0])
+
+    x = placement.x
+    end = int(x[instance]) + new_width
+    same_row = placement.row == placement.row[instance]
+    right = np.flatnonzero(same_row & (x > x[instance]))
+    right = right[np.argsort(x[right], kind="stable")]
+
+    # new_x[j] = max(x[j], new_x[j-1] + w[j-1]) as a running max.
+    w = widths[placement.master[right]]
+    before = np.cumsum(w) - w
+    new_x = before + np.maximum.accumulate(np.maximum(x[right] - before, end))
+    row_end = int(new_x[-1] + w[-1]) if len(right) else end
+    if row_end > placement.row_width:
+        raise ValueError(
+            f"Resizing instance {instance} to {cell} overflows row "
+            f"{int(placement.row[instance])}"
+        )
+
+    if cell not in placement.masters:
+        placement.masters.append(cell)
+    old_master = int(placement.master[instance])
+    moved = right[new_x != x[right]]
+    old_x = x[moved].copy()
+    placement.master[instance] = placement.masters.index(cell)
+    placement.x[right] = new_x
+    if component is not None:
+        _update_layout(component, placement, moved, old_x, old_master, instance)
+    return placement
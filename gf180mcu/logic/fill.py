@@ -0,0 +1,203 @@
+"""Tap, fill and decap insertion for placed standard-cell rows.
+
+The free intervals of every row are found with NumPy interval arithmetic
+over the placed instances. Well taps (``filltie``) go into those intervals
+at a fixed pitch, staggered by half a pitch on odd rows. The remaining gaps
+are packed greedily with the widest fitting ``fill_*`` cells, or
+``fillcap_*`` decap cells where they fit if ``decap`` is set. The inserted
+cells are returned as a Placement, to be emitted with ``placer.build``.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from gf180mcu import logic
+from gf180mcu.logic.placer import Placement, _um, master_widths
+from gf180mcu.logic.views import SITE_WIDTH
+
+__all__ = ["fill_rows", "free_intervals"]
+
+
+def _cells(library: str, family: str) -> list[str]:
+    return [
+        name
+        for name in logic._LIBRARY_PATHS[library]
+        if name.split("__", 1)[1].rsplit("_", 1)[0] == family
+    ]
+
+
+def _occupied(placement: Placement) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    return placement.row, placement.x, placement.x + placement.widths()
+
+
+def free_intervals(
+    placement: Placement,
+    occupied: tuple[np.ndarray, np.ndarray, np.ndarray] | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Returns (row, start, end) of the empty intervals of every row.
+
+    Args:
+        placement: placed cells; rows span [0, row_width).
+        occupied: optional (row, start, end) to use instead of the placement.
+    """
+    row, start, end = occupied if occupied is not None else _occupied(placement)
+    rows = np.arange(placement.rows, dtype=np.int64)
+    zeros = np.zeros_like(rows)
+    right = np.full_like(rows, placement.row_width)
+
+    # Sentinel cells at both ends of every row bound the first and last gap.
+    r = np.concatenate([rows, row.astype(np.int64), rows])
+    s = np.concatenate([zeros, start, right])
+    e = np.concatenate([zeros, end, right])
+    order = np.lexsort((s, r))
+    r, s, e = r[order], s[order], e[order]
+
+    # Running max of the occupied end within a row makes overlaps harmless.
+    # Offsetting row r by r * span keeps it from spilling into the next row,
+    # even past a cell wider than the row.
+    span = int(e.max(initial=0)) + 1
+    e = np.maximum.accumulate(e + r * span) - r * span
+
+    gap = (r[:-1] == r[1:]) & (s[1:] > e[:-1])
+    return r[:-1][gap], e[:-1][gap], s[1:][gap]
+
+
+def _place_taps(
+    row: np.ndarray,
+    start: np.ndarray,
+    end: np.ndarray,
+    rows: int,
+    row_width: int,
+    pitch: int,
+    width: int,
+    site: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Returns (row, x) of taps as close as possible to every pitch target."""
+    fits = end - start >= width
+    row, start, end = row[fits], start[fits], end[fits]
+    if not len(row):
+        return np.empty(0, np.int64), np.empty(0, np.int64)
+
+    per_row = row_width // pitch + 1
+    target_row = np.repeat(np.arange(rows, dtype=np.int64), per_row)
+    target = np.tile(np.arange(per_row, dtype=np.int64) * pitch, rows)
+    target += (target_row % 2) * (pitch // 2)
+    target = np.round(target / site).astype(np.int64) * site
+    keep = target < row_width
+    target_row, target = target_row[keep], target[keep]
+
+    # Gaps are sorted by (row, start): search each target in its own row.
+    key = row * (2 * row_width + 1)
+    i = np.searchsorted(key + start, target_row * (2 * row_width + 1) + target)
+    candidates = []
+    for j in (i - 1, i):
+        j = np.clip(j, 0, len(row) - 1)
+        x = np.clip(target, start[j], end[j] - width)
+        distance = np.where(row[j] == target_row, np.abs(x - target), np.inf)
+        candidates.append((distance, x))
+    (d0, x0), (d1, x1) = candidates
+    x = np.where(d0 <= d1, x0, x1)
+    found = np.isfinite(np.minimum(d0, d1))
+    tap_row, tap_x = target_row[found], x[found]
+
+    # Two targets may land on the same spot of one gap: keep the first.
+    order = np.lexsort((tap_x, tap_row))
+    tap_row, tap_x = tap_row[order], tap_x[order]
+    clear = np.ones(len(tap_x), dtype=bool)
+    clear[1:] = (tap_row[1:] != tap_row[:-1]) | (tap_x[1:] >= tap_x[:-1] + width)
+    return tap_row[clear], tap_x[clear]
+
+
+def _pack_gaps(
+    start: np.ndarray, end: np.ndarray, widths: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Greedy widest-first packing of every gap at once.
+
+    Returns:
+        gap index, fill index (into widths) and x of every fill cell.
+    """
+    order = np.argsort(-widths, kind="stable")
+    remaining = end - start
+    counts = np.empty((len(widths), len(start)), dtype=np.int64)
+    for k in order:
+        counts[k] = remaining // widths[k]
+        remaining = remaining - counts[k] * widths[k]
+
+    # Cells of one gap are laid out widest first, left to right.
+    offset = start.copy()
+    gap_index, fill_index, xs = [], [], []
+    for k in order:
+        n = counts[k]
+        total = int(n.sum())
+        if not total:
+            continue
+        g = np.repeat(np.arange(len(start)), n)
+        first = np.repeat(np.cumsum(n) - n, n)
+        step = np.arange(total) - first
+        gap_index.append(g)
+        fill_index.append(np.full(total, k))
+        xs.append(offset[g] + step * widths[k])
+        offset = offset + n * widths[k]
+    if not xs:
+        empty = np.empty(0, np.int64)
+        return empty, empty, empty
+    return np.concatenate(gap_index), np.concatenate(fill_index), np.concatenate(xs)
+
+
+def fill_rows(
+    placement: Placement,
+    tap_pitch: float | None = None,
+    decap: bool = False,
+) -> Placement:
+    """Returns taps and fill cells that close every gap of the placed rows.
+
+    Args:
+        placement: placed cells.
+        tap_pitch: distance between well taps (filltie) in um. None for no taps.
+        decap: prefer fillcap_* decap cells over fill_* cells of equal width.
+    """
+    library = placement.library
+    fills = _cells(library, "fill")
+    if decap:
+        fills = _cells(library, "fillcap") + fills
+    widths = master_widths(library, fills)
+    # One cell per width; with decap the fillcap cell of a width wins.
+    _, first = np.unique(widths, return_index=True)
+    fills = [fills[i] for i in sorted(first)]
+    widths = widths[sorted(first)]
+
+    masters = list(fills)
+    occupied = _occupied(placement)
+    tap_row = tap_x = np.empty(0, np.int64)
+    if tap_pitch is not None:
+        tap = f"{library}__filltie"
+        tap_width = int(master_widths(library, [tap])[0])
+        tap_row, tap_x = _place_taps(
+            *free_intervals(placement, occupied),
+            rows=placement.rows,
+            row_width=placement.row_width,
+            pitch=_um(tap_pitch),
+            width=tap_width,
+            site=_um(SITE_WIDTH),
+        )
+        occupied = tuple(
+            np.concatenate([a, b])
+            for a, b in zip(occupied, (tap_row, tap_x, tap_x + tap_width))
+        )
+        masters.append(tap)
+
+    row, start, end = free_intervals(placement, occupied)
+    gap, fill, x = _pack_gaps(start, end, widths)
+
+    rows = np.concatenate([row[gap], tap_row]).astype(np.int32)
+    master = np.concatenate([fill, np.full(len(tap_x), len(fills))]).astype(np.int32)
+    return Placement(
+        library=library,
+        masters=masters,
+        master=master,
+        x=np.concatenate([x, tap_x]).astype(np.int64),
+        y=rows.astype(np.int64) * placement.row_height,
+        row=rows,
+        row_width=placement.row_width,
+    )
@@ -0,0 +1,226 @@
+"""Spatial index over the pins of placed standard cells.
+
+Pin rectangles come from the abstract views, transformed by each instance
+placement, so no Component or port list is walked. Rectangles are bucketed
+on a uniform grid stored as sorted (bucket, pin) arrays; each call to
+``add`` appends a new sorted chunk and small chunks are merged as the index
+grows, so adding instances never rebuilds the whole index.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import NamedTuple
+
+import numpy as np
+
+from gf180mcu import logic
+from gf180mcu.logic.placer import Placement, _um
+
+__all__ = ["Pin", "PinIndex"]
+
+_DBU = 0.001
+
+
+class Pin(NamedTuple):
+    """A placed pin rectangle, in um."""
+
+    instance: int
+    name: str
+    net: str | None
+    rect: tuple[float, float, float, float]
+
+
+class _Chunk(NamedTuple):
+    bucket: np.ndarray  # sorted bucket keys
+    pin: np.ndarray  # pin id per bucket entry
+
+
+class PinIndex:
+    """Uniform-grid index of placed pins, queryable by net, region or point.
+
+    Args:
+        placement: placed cells to index.
+        nets: optional {pin: net} per instance, e.g. verilog Instance.pins.
+        layer: metal layer of the pins.
+        grid: grid pitch in um.
+    """
+
+    def __init__(
+        self,
+        placement: Placement | None = None,
+        nets: Sequence[Mapping[str, str]] | None = None,
+        layer: str = "metal1",
+        grid: float = 5.0,
+    ) -> None:
+        self.layer = layer
+        self.grid = _um(grid)
+        self.rects = np.empty((0, 4), dtype=np.int64)
+        self.instance = np.empty(0, dtype=np.int64)
+        self.names: list[str] = []
+        self.nets: list[str | None] = []
+        self._by_net: dict[str, list[int]] = {}
+        self._chunks: list[_Chunk] = []
+        self._instances = 0
+        if placement is not None:
+            self.add(placement, nets)
+
+    def __len__(self) -> int:
+        return len(self.instance)
+
+    def _templates(self, placement: Placement) -> list[tuple[list[str], np.ndarray]]:
+        abstracts = logic.views.load_abstracts(
+            placement.library, logic._LIBRARY_PATHS[placement.library]
+        )
+        templates = []
+        for master in placement.masters:
+            names, rects = [], []
+            for pin, layers in abstracts[master].pins.items():
+                for rect in layers.get(self.layer, ()):
+                    names.append(pin)
+                    rects.append([_um(v) for v in rect])
+            templates.append((names, np.array(rects, dtype=np.int64).reshape(-1, 4)))
+        return templates
+
+    def add(
+        self, placement: Placement, nets: Sequence[Mapping[str, str]] | None = None
+    ) -> None:
+        """Adds the pins of more placed instances.
+
+        Instance numbers continue from the instances added before.
+        """
+        if nets is not None and len(nets) != len(placement):
+            raise ValueError(f"Got {len(nets)} net maps for {len(placement)} instances")
+        templates = self._templates(placement)
+        counts = np.array([len(t[1]) for t in templates], dtype=np.int64)
+        per_instance = counts[placement.master]
+        inst = np.repeat(np.arange(len(placement), dtype=np.int64), per_instance)
+        first = np.repeat(np.cumsum(per_instance) - per_instance, per_instance)
+        local = np.arange(len(inst), dtype=np.int64) - first
+        offset = np.concatenate([[0], np.cumsum(counts)[:-1]])
+        table = np.concatenate([t[1] for t in templates])
+        names = [name for t in templates for name in t[0]]
+        row = offset[placement.master[inst]] + local
+
+        rects = table[row].copy()
+        x = placement.x[inst]
+        base = placement.y[inst]
+        mirror = placement.mirror[inst]
+        top = base + placement.row_height
+        y0 = np.where(mirror, top - rects[:, 3], base + rects[:, 1])
+        y1 = np.where(mirror, top - rects[:, 1], base + rects[:, 3])
+        rects[:, 0] += x
+        rects[:, 2] += x
+        rects[:, 1], rects[:, 3] = y0, y1
+
+        start = len(self.instance)
+        pin_names = [names[i] for i in row.tolist()]
+        pin_nets = (
+            [nets[i].get(n) for i, n in zip(inst.tolist(), pin_names)]
+            if nets is not None
+            else [None] * len(pin_names)
+        )
+        for i, net in enumerate(pin_nets, start):
+            if net is not None:
+                self._by_net.setdefault(net, []).append(i)
+
+        self.rects = np.concatenate([self.rects, rects])
+        self.instance = np.concatenate([self.instance, inst + self._instances])
+        self.names += pin_names
+        self.nets += pin_nets
+        self._instances += len(placement)
+        self._chunks.append(self._bucket(rects, start))
+        self._compact()
+
+    def _keys(self, ix: np.ndarray, iy: np.ndarray) -> np.ndarray:
+        return (ix << 32) + iy
+
+    def _bucket(self, rects: np.ndarray, start: int) -> _Chunk:
+        """Sorted (bucket, pin) pairs for every grid cell a rect overlaps."""
+        g = self.grid
+        ix0, iy0 = rects[:, 0] // g, rects[:, 1] // g
+        nx = rects[:, 2] // g - ix0 + 1
+        ny = rects[:, 3] // g - iy0 + 1
+        n = nx * ny
+        pin = np.repeat(np.arange(start, start + len(rects), dtype=np.int64), n)
+        k = np.arange(int(n.sum()), dtype=np.int64) - np.repeat(np.cumsum(n) - n, n)
+        nyr = np.repeat(ny, n)
+        keys = self._keys(np.repeat(ix0, n) + k // nyr, np.repeat(iy0, n) + k % nyr)
+        order = np.argsort(keys, kind="stable")
+        return _Chunk(keys[order], pin[order])
+
+    def _compact(self) -> None:
+        """Merges the two newest chunks while the older is at most twice the newer."""
+        while len(self._chunks) > 1 and len(self._chunks[-2].bucket) <= 2 * len(
+            self._chunks[-1].bucket
+        ):
+            b, a = self._chunks.pop(), self._chunks.pop()
+            keys = np.concatenate([a.bucket, b.bucket])
+            pins = np.concatenate([a.pin, b.pin])
+            order = np.argsort(keys, kind="stable")
+            self._chunks.append(_Chunk(keys[order], pins[order]))
+
+    def _candidates(self, x0: int, y0: int, x1: int, y1: int) -> np.ndarray:
+        g = self.grid
+        ix = np.arange(x0 // g, x1 // g + 1, dtype=np.int64)
+        iy0, iy1 = y0 // g, y1 // g
+        found = []
+        for chunk in self._chunks:
+            # One contiguous key range per grid column.
+            lo = np.searchsorted(chunk.bucket, self._keys(ix, iy0), side="left")
+            hi = np.searchsorted(chunk.bucket, self._keys(ix, iy1), side="right")
+            n = hi - lo
+            if n.sum():
+                idx = np.repeat(lo - np.cumsum(n) + n, n) + np.arange(int(n.sum()))
+                found.append(chunk.pin[idx])
+        return np.unique(np.concatenate(found)) if found else np.empty(0, np.int64)
+
+    def pins(self, ids: Sequence[int] | np.ndarray) -> list[Pin]:
+        """Returns the pins with the given ids."""
+        return [
+            Pin(
+                instance=int(self.instance[i]),
+                name=self.names[i],
+                net=self.nets[i],
+                rect=tuple(round(v * _DBU, 3) for v in self.rects[i].tolist()),
+            )
+            for i in np.asarray(ids, dtype=np.int64).tolist()
+        ]
+
+    def by_net(self, net: str) -> list[Pin]:
+        """Returns all pins on a net."""
+        return self.pins(self._by_net.get(net, []))
+
+    def in_region(
+        self, xmin: float, ymin: float, xmax: float, ymax: float
+    ) -> list[Pin]:
+        """Returns the pins overlapping a box, in um."""
+        box = np.array([_um(xmin), _um(ymin), _um(xmax), _um(ymax)])
+        ids = self._candidates(*box.tolist())
+        r = self.rects[ids]
+        hit = (
+            (r[:, 0] <= box[2])
+            & (r[:, 2] >= box[0])
+            & (r[:, 1] <= box[3])
+            & (r[:, 3] >= box[1])
+        )
+        return self.pins(ids[hit])
+
+    def nearest(self, x: float, y: float, k: int = 1) -> list[Pin]:
+        """Returns the k pins closest to a point, in um, nearest first."""
+        if not len(self):
+            return []
+        px, py = _um(x), _um(y)
+        k = min(k, len(self))
+        radius = self.grid
+        while True:
+            ids = self._candidates(px - radius, py - radius, px + radius, py + radius)
+            r = self.rects[ids]
+            dx = np.maximum(np.maximum(r[:, 0] - px, px - r[:, 2]), 0)
+            dy = np.maximum(np.maximum(r[:, 1] - py, py - r[:, 3]), 0)
+            d = np.hypot(dx, dy)
+            # Pins within the searched square are complete up to `radius`.
+            if np.count_nonzero(d <= radius) >= k or len(ids) == len(self):
+                order = np.argsort(d, kind="stable")[:k]
+                return self.pins(ids[order])
+            radius *= 2
@@ -0,0 +1,226 @@
+"""Row placement of standard cells.
+
+Cells are packed left to right into rows of a fixed width. Odd rows are
+mirrored about the x axis so neighbouring rows share their power rails.
+Placements are kept as NumPy arrays in database units and turned into
+instances of a single cell in one pass, so blocks of 100k cells stay cheap
+in both time and memory.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import gdsfactory as gf
+import klayout.db as kdb
+import numpy as np
+
+from gf180mcu import logic
+from gf180mcu.logic.views import ROW_HEIGHT, SITE_WIDTH
+
+__all__ = [
+    "Placement",
+    "build",
+    "master_widths",
+    "pack_rows",
+    "place_rows",
+    "read_cell_list",
+]
+
+_DBU = 0.001
+
+
+def _um(value: float) -> int:
+    return round(value / _DBU)
+
+
+@dataclass
+class Placement:
+    """Standard-cell placement as parallel arrays, in database units.
+
+    Args:
+        library: standard-cell library name.
+        masters: distinct cell names; ``master`` indexes into it.
+        master: index into ``masters`` per instance.
+        x: left edge per instance.
+        y: bottom edge of the row per instance.
+        row: row index per instance.
+        row_width: width of every row.
+        instances: optional instance names, one per instance.
+    """
+
+    library: str
+    masters: list[str]
+    master: np.ndarray
+    x: np.ndarray
+    y: np.ndarray
+    row: np.ndarray
+    row_width: int
+    instances: list[str] | None = field(default=None)
+
+    @property
+    def row_height(self) -> int:
+        return _um(ROW_HEIGHT[self.library])
+
+    @property
+    def rows(self) -> int:
+        return int(self.row.max()) + 1 if len(self.row) else 0
+
+    @property
+    def mirror(self) -> np.ndarray:
+        """True for instances in mirrored (odd) rows."""
+        return (self.row % 2).astype(bool)
+
+    def widths(self) -> np.ndarray:
+        """Returns the width of every instance."""
+        return master_widths(self.library, self.masters)[self.master]
+
+    def __len__(self) -> int:
+        return len(self.master)
+
+
+def _library(names: Iterable[str]) -> str:
+    libraries = {name.split("__", 1)[0] for name in names}
+    if len(libraries) != 1 or not libraries <= ROW_HEIGHT.keys():
+        raise ValueError(
+            f"Cells must all come from one of {sorted(ROW_HEIGHT)}, got {sorted(libraries)}"
+        )
+    return libraries.pop()
+
+
+def master_widths(library: str, masters: Sequence[str]) -> np.ndarray:
+    """Returns the width of each master cell in database units."""
+    abstracts = logic.views.load_abstracts(library, logic._LIBRARY_PATHS[library])
+    try:
+        return np.array([_um(abstracts[m].width) for m in masters], dtype=np.int64)
+    except KeyError as e:
+        raise ValueError(f"Unknown standard cell {e.args[0]!r}") from e
+
+
+def pack_rows(
+    widths: np.ndarray, row_width: int, x0: int = 0, row0: int = 0
+) -> tuple[np.ndarray, np.ndarray, int, int]:
+    """Packs cell widths left to right into rows, starting at (x0, row0).
+
+    A cell wider than a row gets a row of its own.
+
+    Args:
+        widths: cell widths in database units.
+        row_width: row width in database units.
+        x0: first free x in row0.
+        row0: row to start in.
+
+    Returns:
+        x and row per cell, then the first free x and its row.
+    """
+    n = len(widths)
+    ends = np.cumsum(widths)
+    row = np.empty(n, dtype=np.int32)
+    x = np.empty(n, dtype=np.int64)
+    base, r, i = -x0, row0, 0
+    while i < n:
+        j = int(np.searchsorted(ends, base + row_width, side="right"))
+        if j == i:
+            start = int(ends[i] - widths[i])
+            if start > base:
+                base, r = start, r + 1
+                continue
+            j = i + 1
+        row[i:j] = r
+        x[i:j] = ends[i:j] - widths[i:j] - base
+        i = j
+        if i < n:
+            base, r = int(ends[i - 1]), r + 1
+    cursor = int(ends[-1]) - base if n else x0
+    return x, row, cursor, r
+
+
+def read_cell_list(filepath: str | Path) -> tuple[list[str], list[str] | None]:
+    """Reads a placement file with one ``cell`` or ``instance cell`` per line.
+
+    Blank lines and lines starting with ``#`` are ignored.
+
+    Returns:
+        cell names and instance names (None if the file has no instance names).
+    """
+    cells: list[str] = []
+    instances: list[str] = []
+    with open(filepath) as f:
+        for line in f:
+            fields = line.split("#", 1)[0].split()
+            if not fields:
+                continue
+            if len(fields) == 1:
+                cells.append(fields[0])
+            else:
+                instances.append(fields[0])
+                cells.append(fields[1])
+    if instances and len(instances) != len(cells):
+        raise ValueError(f"{filepath}: mixed 'cell' and 'instance cell' lines")
+    return cells, instances or None
+
+
+def place_rows(
+    cells: Sequence[str] | str | Path,
+    row_width: float | None = None,
+    instances: Sequence[str] | None = None,
+) -> Placement:
+    """Packs cells left to right into rows, in the given order.
+
+    Args:
+        cells: cell names, or a placement file read with read_cell_list.
+        row_width: row width in um. Defaults to a roughly square block.
+        instances: optional instance names, one per cell.
+    """
+    if isinstance(cells, str | Path):
+        cells, instances = read_cell_list(cells)
+    masters, master = np.unique(np.asarray(cells, dtype=object), return_inverse=True)
+    masters = masters.tolist()
+    library = _library(masters)
+    master = master.astype(np.int32)
+    widths = master_widths(library, masters)[master]
+    row_height = _um(ROW_HEIGHT[library])
+    site = _um(SITE_WIDTH)
+
+    if row_width is None:
+        total = int(widths.sum())
+        width = max(math.ceil(math.sqrt(total * row_height) / site) * site, site)
+    else:
+        width = _um(row_width)
+
+    x, row, _, _ = pack_rows(widths, width)
+
+    return Placement(
+        library=library,
+        masters=masters,
+        master=master,
+        x=x,
+        y=row.astype(np.int64) * row_height,
+        row=row,
+        row_width=width,
+        instances=list(instances) if instances is not None else None,
+    )
+
+
+def build(placement: Placement, component: gf.Component | None = None) -> gf.Component:
+    """Inserts the placed instances into a component.
+
+    Args:
+        placement: placement to emit.
+        component: component to add the instances to. Defaults to a new one.
+    """
+    c = gf.Component() if component is None else component
+    cell = c.kdb_cell
+    masters = [getattr(logic, m)().kdb_cell.cell_index() for m in placement.masters]
+    h = placement.row_height
+
+    mirror = placement.mirror
+    y = np.where(mirror, placement.y + h, placement.y)
+    for m, xi, yi, mi in zip(
+        placement.master.tolist(), placement.x.tolist(), y.tolist(), mirror.tolist()
+    ):
+        cell.insert(kdb.CellInstArray(masters[m], kdb.Trans(0, mi, xi, yi)))
+    return c
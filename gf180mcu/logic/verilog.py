@@ -0,0 +1,330 @@
+"""Gate-level Verilog to standard-cell layout.
+
+Structural netlists that instantiate ``gf180mcu_fd_sc_mcu*`` cells are read
+one statement at a time, placed in chunks with the row placer and written
+out as they go. For GDS output the instances are streamed straight into the
+file, so neither the netlist nor the placed layout is ever held in full.
+OASIS output keeps the placed instances in a klayout layout and writes it at
+the end.
+"""
+
+from __future__ import annotations
+
+import re
+import struct
+import time
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from pathlib import Path
+from typing import BinaryIO, NamedTuple
+
+import klayout.db as kdb
+import numpy as np
+
+from gf180mcu import logic
+from gf180mcu.logic.placer import _um, master_widths, pack_rows
+from gf180mcu.logic.views import ROW_HEIGHT
+
+__all__ = ["Instance", "read_instances", "write_layout"]
+
+_KEYWORDS = {
+    "assign",
+    "inout",
+    "input",
+    "localparam",
+    "module",
+    "output",
+    "parameter",
+    "reg",
+    "supply0",
+    "supply1",
+    "tri",
+    "wire",
+}
+_INSTANCE = re.compile(
+    r"(?P<cell>\S+)\s+(?:#\s*\(.*?\)\s*)?(?P<name>\\\S+|\w+)\s*(?:\[[^\]]*\]\s*)?"
+    r"\((?P<pins>.*)\)\s*$",
+    re.DOTALL,
+)
+_PIN = re.compile(r"\.(\w+)\s*\(\s*(.*?)\s*\)\s*(?:,|$)", re.DOTALL)
+
+
+class Instance(NamedTuple):
+    """A cell instance from a gate-level netlist."""
+
+    cell: str
+    name: str
+    module: str
+    pins: dict[str, str]
+
+
+_SPANS = {"//": "", "/*": "*/", "(*": "*)"}
+
+
+def _strip(line: str) -> tuple[str, str]:
+    """Drops comments and (* attributes *) from line.
+
+    Returns the remaining text and the closing delimiter of a span that
+    continues on the next line ("" if none).
+    """
+    while True:
+        hits = [(line.find(s), s) for s in _SPANS if s in line]
+        if not hits:
+            return line, ""
+        start, opening = min(hits)
+        closing = _SPANS[opening]
+        end = line.find(closing, start + 2) if closing else -1
+        if end < 0:
+            return line[:start], closing
+        line = line[:start] + " " + line[end + 2 :]
+
+
+def _statements(lines: Iterable[str]) -> Iterator[str]:
+    """Yields ';'-terminated statements without comments, attributes and
+    compiler directives, and endmodule."""
+    buffer: list[str] = []
+    closing = ""
+    for line in lines:
+        if closing:
+            end = line.find(closing)
+            if end < 0:
+                continue
+            line = line[end + 2 :]
+        elif line.lstrip().startswith("`"):
+            continue
+        line, closing = _strip(line)
+        *complete, rest = line.split(";")
+        for part in complete:
+            buffer.append(part)
+            yield from _split_endmodule(" ".join(buffer))
+            buffer.clear()
+        buffer.append(rest)
+    yield from _split_endmodule(" ".join(buffer))
+
+
+def _split_endmodule(text: str) -> Iterator[str]:
+    *ends, text = re.split(r"\bendmodule\b", text)
+    for _ in ends:
+        yield "endmodule"
+    text = text.strip()
+    if text:
+        yield text
+
+
+def read_instances(
+    filepath: str | Path, module: str | None = None
+) -> Iterator[Instance]:
+    """Yields the cell instances of a gate-level Verilog netlist in file order.
+
+    Args:
+        filepath: Verilog file.
+        module: only yield instances of this module. Defaults to all modules.
+    """
+    current = ""
+    with open(filepath) as f:
+        for statement in _statements(f):
+            if statement == "endmodule":
+                current = ""
+                continue
+            keyword = statement.split(None, 1)[0]
+            if keyword == "module":
+                current = statement.split(None, 2)[1].split("(", 1)[0]
+                continue
+            if keyword in _KEYWORDS or (module is not None and current != module):
+                continue
+            m = _INSTANCE.match(statement)
+            if m is None:
+                raise ValueError(f"{filepath}: cannot parse {statement[:80]!r}")
+            yield Instance(
+                cell=m["cell"],
+                name=m["name"],
+                module=current,
+                pins=dict(_PIN.findall(m["pins"])),
+            )
+
+
+def _record(rtype: int, dtype: int, data: bytes = b"") -> bytes:
+    return struct.pack(">HBB", 4 + len(data), rtype, dtype) + data
+
+
+def _string(rtype: int, text: str) -> bytes:
+    data = text.encode()
+    return _record(rtype, 0x06, data + b"\0" * (len(data) % 2))
+
+
+def _real8(value: float) -> bytes:
+    """GDSII 8-byte excess-64 base-16 real."""
+    if value == 0:
+        return bytes(8)
+    sign = 0x80 if value < 0 else 0
+    value = abs(value)
+    exponent = 64
+    while value >= 1:
+        value /= 16
+        exponent += 1
+    while value < 1 / 16:
+        value *= 16
+        exponent -= 1
+    return bytes([sign | exponent]) + round(value * 2**56).to_bytes(7, "big")
+
+
+def _timestamp() -> bytes:
+    t = time.localtime()
+    stamp = (t.tm_year, t.tm_mon, t.tm_mday, t.tm_hour, t.tm_min, t.tm_sec)
+    return struct.pack(">12h", *stamp, *stamp)
+
+
+def _gds_records(data: bytes) -> Iterator[tuple[int, bytes]]:
+    pos = 0
+    while pos < len(data):
+        (length,) = struct.unpack_from(">H", data, pos)
+        yield data[pos + 2], data[pos : pos + length]
+        pos += length
+
+
+def _master_structures(masters: Iterable[str]) -> bytes:
+    """Returns the GDS structures (BGNSTR..ENDSTR) of the master cells."""
+    layout = kdb.Layout()
+    layout.dbu = 0.001
+    for name in masters:
+        src = getattr(logic, name)().kdb_cell
+        layout.create_cell(name).copy_tree(src)
+    options = kdb.SaveLayoutOptions()
+    options.format = "GDS2"
+    options.write_context_info = False
+    body = bytearray()
+    in_structure = False
+    for rtype, record in _gds_records(layout.write_bytes(options)):
+        if rtype == 0x05:  # BGNSTR
+            in_structure = True
+        if in_structure:
+            body += record
+        if rtype == 0x07:  # ENDSTR
+            in_structure = False
+    return bytes(body)
+
+
+class _GdsWriter:
+    """Writes a top cell of SREFs to a GDS stream, instance by instance."""
+
+    def __init__(self, f: BinaryIO, top: str) -> None:
+        self.f = f
+        f.write(_record(0x00, 0x02, struct.pack(">h", 600)))
+        f.write(_record(0x01, 0x02, _timestamp()))
+        f.write(_string(0x02, "gf180mcu"))
+        f.write(_record(0x03, 0x05, _real8(0.001) + _real8(1e-9)))
+        f.write(_record(0x05, 0x02, _timestamp()))
+        f.write(_string(0x06, top))
+
+    def add(
+        self, names: list[bytes], x: np.ndarray, y: np.ndarray, mirror: np.ndarray
+    ) -> None:
+        """Writes one SREF per instance; names are encoded SNAME records."""
+        sref = _record(0x0A, 0x00)
+        strans = _record(0x1A, 0x01, struct.pack(">H", 0x8000))
+        xy = struct.pack(">HBB", 12, 0x10, 0x03)
+        endel = _record(0x11, 0x00)
+        self.f.write(
+            b"".join(
+                sref
+                + name
+                + (strans if mi else b"")
+                + xy
+                + struct.pack(">ii", xi, yi)
+                + endel
+                for name, xi, yi, mi in zip(
+                    names, x.tolist(), y.tolist(), mirror.tolist()
+                )
+            )
+        )
+
+    def close(self, masters: bytes) -> None:
+        self.f.write(_record(0x07, 0x00))
+        self.f.write(masters)
+        self.f.write(_record(0x04, 0x00))
+
+
+def write_layout(
+    netlist: str | Path,
+    filepath: str | Path,
+    row_width: float,
+    module: str | None = None,
+    top: str | None = None,
+    chunk_size: int = 50_000,
+) -> Path:
+    """Places the cells of a gate-level netlist in rows and writes the layout.
+
+    Args:
+        netlist: gate-level Verilog file instantiating gf180mcu.logic cells.
+        filepath: output file, .gds or .oas.
+        row_width: row width in um.
+        module: only place instances of this module. Defaults to all modules.
+        top: top cell name. Defaults to module or the netlist file stem.
+        chunk_size: number of instances read and placed at a time.
+    """
+    filepath = Path(filepath)
+    top = top or module or Path(netlist).stem
+    width = _um(row_width)
+    instances = read_instances(netlist, module=module)
+
+    library: str | None = None
+    widths: dict[str, int] = {}
+    x0 = row0 = 0
+
+    is_gds = filepath.suffix.lower() in {".gds", ".gds2", ".gdsii"}
+    if is_gds:
+        f = open(filepath, "wb")
+        writer = _GdsWriter(f, top)
+        names: dict[str, bytes] = {}
+    else:
+        layout = kdb.Layout()
+        layout.dbu = 0.001
+        top_cell = layout.create_cell(top)
+        cell_index: dict[str, int] = {}
+
+    try:
+        while chunk := list(islice(instances, chunk_size)):
+            cells = [inst.cell for inst in chunk]
+            new = sorted(set(cells) - widths.keys())
+            if new:
+                if library is None:
+                    library = new[0].split("__", 1)[0]
+                if library not in ROW_HEIGHT or any(
+                    not c.startswith(f"{library}__") for c in new
+                ):
+                    raise ValueError(
+                        f"{netlist}: cells {new} are not all in one of {sorted(ROW_HEIGHT)}"
+                    )
+                widths.update(zip(new, master_widths(library, new).tolist()))
+            h = _um(ROW_HEIGHT[library])
+            w = np.fromiter(
+                (widths[c] for c in cells), dtype=np.int64, count=len(cells)
+            )
+            x, row, x0, row0 = pack_rows(w, width, x0, row0)
+            mirror = (row % 2).astype(bool)
+            y = row.astype(np.int64) * h + np.where(mirror, h, 0)
+
+            if is_gds:
+                for c in new:
+                    names[c] = _string(0x12, c)
+                writer.add([names[c] for c in cells], x, y, mirror)
+            else:
+                for c in new:
+                    src = getattr(logic, c)().kdb_cell
+                    target = layout.create_cell(c)
+                    target.copy_tree(src)
+                    cell_index[c] = target.cell_index()
+                for c, xi, yi, mi in zip(
+                    cells, x.tolist(), y.tolist(), mirror.tolist()
+                ):
+                    top_cell.insert(
+                        kdb.CellInstArray(cell_index[c], kdb.Trans(0, mi, xi, yi))
+                    )
+        if is_gds:
+            writer.close(_master_structures(sorted(widths)))
+        else:
+            layout.write(str(filepath))
+    finally:
+        if is_gds:
+            f.close()
+    return filepath
@@ -0,0 +1,171 @@
+"""Abstract views of the standard cells.
+
+An abstract holds what placement and routing need (cell outline, row height
+and pin shapes per metal layer) without building a Component. The abstracts
+of a library are extracted in one pass over its GDS files and stored as a
+single JSON file under ``PATH.abstract_cache``, which is rebuilt when any of
+the GDS files change.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+import klayout.db as kdb
+
+from gf180mcu.config import PATH
+from gf180mcu.layers import LAYER
+
+__all__ = ["ROW_HEIGHT", "SITE_WIDTH", "Abstract", "load_abstracts"]
+
+ROW_HEIGHT = {
+    "gf180mcu_fd_sc_mcu7t5v0": 3.92,
+    "gf180mcu_fd_sc_mcu9t5v0": 5.04,
+}
+SITE_WIDTH = 0.56
+
+# metal layer name -> (drawing layer, label layer)
+_PIN_LAYERS = {
+    "metal1": (LAYER.metal1, LAYER.metal1_label),
+    "metal2": (LAYER.metal2, LAYER.metal2_label),
+}
+
+_VERSION = 1
+_DBU = 0.001
+
+Rect = tuple[float, float, float, float]
+
+
+@dataclass(frozen=True)
+class Abstract:
+    """Outline and pins of a standard cell.
+
+    Args:
+        name: cell name.
+        width: cell width in um.
+        height: cell height in um.
+        row_height: row height of the library (7-track or 9-track) in um.
+        pins: {pin name: {metal layer: ((xmin, ymin, xmax, ymax), ...)}} in um.
+    """
+
+    name: str
+    width: float
+    height: float
+    row_height: float
+    pins: dict[str, dict[str, tuple[Rect, ...]]]
+
+
+def _key(gds_paths: dict[str, Path]) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{_VERSION}".encode())
+    for name, path in gds_paths.items():
+        st = path.stat()
+        h.update(f":{name}:{st.st_size}:{st.st_mtime_ns}".encode())
+    return h.hexdigest()
+
+
+def _extract(gds_path: Path, row_height: float) -> dict:
+    layout = kdb.Layout()
+    layout.read(str(gds_path))
+    dbu = layout.dbu / _DBU
+    cell = layout.top_cell()
+
+    boundary = layout.find_layer(*LAYER.pr_bndry)
+    box = cell.bbox_per_layer(boundary) if boundary is not None else kdb.Box()
+    if box.empty():
+        bbox = cell.bbox()
+        box = kdb.Box(bbox.left, 0, bbox.right, round(row_height / layout.dbu))
+
+    pins: dict[str, dict[str, list[list[int]]]] = {}
+    for layer_name, (metal, label) in _PIN_LAYERS.items():
+        metal_index = layout.find_layer(*metal)
+        label_index = layout.find_layer(*label)
+        if metal_index is None or label_index is None:
+            continue
+        shapes = kdb.Region(cell.begin_shapes_rec(metal_index)).merged()
+        for text in kdb.Texts(cell.begin_shapes_rec(label_index)).each():
+            probe = kdb.Region(kdb.Box(text.position(), text.position()).enlarged(1))
+            pin = shapes.interacting(probe).decompose_trapezoids_to_region()
+            rects = pins.setdefault(text.string, {}).setdefault(layer_name, [])
+            rects.extend(
+                [round(v * dbu) for v in (b.left, b.bottom, b.right, b.top)]
+                for b in (p.bbox() for p in pin.each())
+            )
+    return {
+        "size": [round(box.width() * dbu), round(box.height() * dbu)],
+        "pins": pins,
+    }
+
+
+def _to_abstract(name: str, data: dict, row_height: float) -> Abstract:
+    width, height = data["size"]
+    return Abstract(
+        name=name,
+        width=round(width * _DBU, 3),
+        height=round(height * _DBU, 3),
+        row_height=row_height,
+        pins={
+            pin: {
+                layer: tuple(tuple(round(v * _DBU, 3) for v in r) for r in rects)
+                for layer, rects in layers.items()
+            }
+            for pin, layers in data["pins"].items()
+        },
+    )
+
+
+def _write(path: Path, data: dict) -> None:
+    """Writes data to path atomically; the cache is skipped if that fails."""
+    try:
+        PATH.abstract_cache.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=PATH.abstract_cache, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp, path)
+    except OSError:
+        pass
+    finally:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+
+
+_LOADED: dict[str, dict[str, Abstract]] = {}
+
+
+def load_abstracts(library: str, gds_paths: dict[str, Path]) -> dict[str, Abstract]:
+    """Returns {cell name: Abstract} for a library, extracting it if needed.
+
+    Args:
+        library: library name, a key of ROW_HEIGHT.
+        gds_paths: {cell name: GDS file} of every cell in the library.
+    """
+    if library in _LOADED:
+        return _LOADED[library]
+
+    row_height = ROW_HEIGHT[library]
+    key = _key(gds_paths)
+    path = PATH.abstract_cache / f"{library}.json"
+    try:
+        stored = json.loads(path.read_text())
+    except (OSError, ValueError):
+        stored = {}
+
+    if stored.get("key") == key:
+        cells = stored["cells"]
+    else:
+        cells = {name: _extract(p, row_height) for name, p in gds_paths.items()}
+        _write(path, {"key": key, "cells": cells})
+
+    abstracts = {
+        name: _to_abstract(name, data, row_height) for name, data in cells.items()
+    }
+    _LOADED[library] = abstracts
+    return abstracts
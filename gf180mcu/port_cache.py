@@ -0,0 +1,168 @@
+"""On-disk cache for ports extracted from GDS labels.
+
+Fixed and standard cells get their ports by scanning metal1 labels after the
+GDS is read. The ports found for a file are stored as JSON under
+``PATH.port_cache``, keyed by a hash of the GDS content and of the port
+extraction settings, so later imports restore them without scanning.
+
+A PortTable holds the ports of a whole library in one JSON file instead,
+keyed by the size and modification time of its GDS files, for loaders that
+read the library in a single pass and should not reopen every file.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+
+import gdsfactory as gf
+
+from gf180mcu.config import PATH
+
+__all__ = ["PortTable", "add_ports", "import_gds"]
+
+_VERSION = 1
+
+AddPorts = Callable[[gf.Component], object]
+
+
+def _settings(add_ports_from_labels: AddPorts) -> str:
+    keywords = getattr(add_ports_from_labels, "keywords", {})
+    return repr(sorted((k, str(v)) for k, v in keywords.items()))
+
+
+def _key(gdspath: Path, add_ports_from_labels: AddPorts) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{_VERSION}:{_settings(add_ports_from_labels)}:".encode())
+    h.update(Path(gdspath).read_bytes())
+    return h.hexdigest()
+
+
+def _read_json(path: Path):
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json(path: Path, data) -> None:
+    """Writes data to path atomically; the cache is skipped if that fails."""
+    try:
+        PATH.port_cache.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=PATH.port_cache, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+    except (OSError, TypeError, ValueError):
+        pass
+    finally:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+
+
+def _port_dicts(component: gf.Component) -> list[dict]:
+    return [
+        {
+            "name": p.name,
+            "center": list(p.center),
+            "orientation": p.orientation,
+            "width": p.width,
+            "layer": [p.layer_info.layer, p.layer_info.datatype],
+            "port_type": p.port_type,
+        }
+        for p in component.ports
+    ]
+
+
+def _apply(component: gf.Component, ports: list[dict]) -> gf.Component:
+    for p in ports:
+        component.add_port(
+            name=p["name"],
+            center=p["center"],
+            orientation=p["orientation"],
+            width=p["width"],
+            layer=tuple(p["layer"]),
+            port_type=p["port_type"],
+        )
+    return component
+
+
+def add_ports(
+    component: gf.Component, gdspath: Path, add_ports_from_labels: AddPorts
+) -> gf.Component:
+    """Adds ports to a component read from gdspath, using the cache if possible.
+
+    Args:
+        component: component read from gdspath.
+        gdspath: GDS file the component was read from.
+        add_ports_from_labels: port extraction run on a cache miss.
+    """
+    key = _key(gdspath, add_ports_from_labels)
+    path = PATH.port_cache / f"{key}.json"
+    ports = _read_json(path)
+    if ports is None:
+        add_ports_from_labels(component)
+        _write_json(path, _port_dicts(component))
+        return component
+    return _apply(component, ports)
+
+
+class PortTable:
+    """Cached ports of a set of GDS files, stored as one JSON file.
+
+    Args:
+        name: table name, the file is PATH.port_cache / f"{name}.ports.json".
+        gds_paths: {cell name: GDS file} of every cell in the table.
+        add_ports_from_labels: port extraction run on a cache miss.
+    """
+
+    def __init__(
+        self, name: str, gds_paths: dict[str, Path], add_ports_from_labels: AddPorts
+    ) -> None:
+        h = hashlib.blake2b(digest_size=16)
+        h.update(f"{_VERSION}:{_settings(add_ports_from_labels)}".encode())
+        for cell, path in gds_paths.items():
+            st = Path(path).stat()
+            h.update(f":{cell}:{st.st_size}:{st.st_mtime_ns}".encode())
+        self.key = h.hexdigest()
+        self.path = PATH.port_cache / f"{name}.ports.json"
+        self.add_ports_from_labels = add_ports_from_labels
+        stored = _read_json(self.path) or {}
+        self.ports: dict[str, list[dict]] = (
+            stored["cells"] if stored.get("key") == self.key else {}
+        )
+        self._changed = False
+
+    def add_ports(self, component: gf.Component, name: str) -> gf.Component:
+        """Adds the ports of cell name to component, extracting them on a miss."""
+        ports = self.ports.get(name)
+        if ports is None:
+            self.add_ports_from_labels(component)
+            self.ports[name] = _port_dicts(component)
+            self._changed = True
+            return component
+        return _apply(component, ports)
+
+    def save(self) -> None:
+        """Writes the table if ports were extracted since it was read."""
+        if self._changed:
+            _write_json(self.path, {"key": self.key, "cells": self.ports})
+            self._changed = False
+
+
+def import_gds(gdspath: Path, add_ports_from_labels: AddPorts) -> gf.Component:
+    """Returns a component read from gdspath with cached ports.
+
+    Args:
+        gdspath: GDS file to read.
+        add_ports_from_labels: port extraction run on a cache miss.
+    """
+    component = gf.import_gds(gdspath)
+    return add_ports(component, gdspath, add_ports_from_labels)
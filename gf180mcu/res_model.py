@@ -0,0 +1,241 @@
+"""Nominal resistance of the gf180mcu.cells.res devices, from the SPICE models.
+
+The resistor subcircuits of ``models/ngspice/sm141064.ngspice`` are a body
+resistor plus, for all but the metal resistors, a terminal resistor at each
+end:
+
+    R = rsh * (l - 2 dl) / (w - 2 dw) * (1 + tc1 dT + tc2 dT^2)
+      + 2 * rsh_t * 1 um / (w - 2 dw) * (1 + tc1_t dT + tc2_t dT^2)
+
+with dT = temp - 25 C. The parameters are read from the model file once per
+corner (``res_typical``, ``res_ss``, ``res_ff``) with the statistical terms
+at zero. resistance and size_resistor then work on NumPy arrays of any
+shape without building components or running a simulator:
+
+    from gf180mcu import res_model
+
+    r = res_model.resistance("ppolyf_u_1k", w=[1, 2], l=10, temp=[25, 125])
+    w, l = res_model.size_resistor("ppolyf_u_1k", [10e3, 20e3])
+"""
+
+from __future__ import annotations
+
+import ast
+import functools
+import operator
+import re
+from typing import NamedTuple
+
+import numpy as np
+
+from gf180mcu.config import PATH
+
+__all__ = [
+    "CORNERS",
+    "RES_TYPES",
+    "ResParams",
+    "res_params",
+    "resistance",
+    "size_resistor",
+]
+
+_MODEL = PATH.module / "models" / "ngspice" / "sm141064.ngspice"
+_TNOM = 25.0
+
+# Minimum width and length per res_type (wmin, lmin of the Magic generators).
+_LIMITS = {
+    "rm1": (0.16, 0.16),
+    "rm2": (0.20, 0.20),
+    "rm3": (0.20, 0.20),
+    "ppolyf_u": (0.80, 1.00),
+    "npolyf_u": (0.80, 1.00),
+    "ppolyf_s": (0.80, 1.00),
+    "npolyf_s": (0.80, 1.00),
+    "nplus_u": (1.00, 1.00),
+    "pplus_u": (1.00, 1.00),
+    "nwell": (2.00, 2.00),
+    "ppolyf_u_1k": (1.00, 1.00),
+    "ppolyf_u_1k_6p0": (1.00, 1.00),
+}
+RES_TYPES = tuple(_LIMITS)
+CORNERS = ("typical", "ss", "ff")
+
+
+class ResParams(NamedTuple):
+    """Model parameters of one res_type, lengths in um."""
+
+    rsh: float  # body sheet resistance (ohm/sq)
+    dw: float  # width reduction per side
+    dl: float  # length reduction per end
+    tc1: float
+    tc2: float
+    rsh_end: float  # terminal sheet resistance over 1 um (ohm/sq), 0 for metals
+    tc1_end: float
+    tc2_end: float
+    w_min: float
+    l_min: float
+
+
+_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+}
+
+
+def _eval(expr: str, names: dict[str, float]) -> float:
+    """Evaluate a SPICE parameter expression; unknown names (mismatch and
+    Monte Carlo switches) are 0."""
+
+    def ev(node: ast.AST) -> float:
+        if isinstance(node, ast.Constant):
+            return float(node.value)
+        if isinstance(node, ast.Name):
+            return names.get(node.id, 0.0)
+        if isinstance(node, ast.BinOp):
+            return _OPS[type(node.op)](ev(node.left), ev(node.right))
+        if isinstance(node, ast.UnaryOp):
+            return _OPS[type(node.op)](ev(node.operand))
+        raise ValueError(f"Unsupported expression in {_MODEL.name}: {expr}")
+
+    return ev(ast.parse(expr.strip("'\" "), mode="eval").body)
+
+
+def _assignments(text: str) -> dict[str, str]:
+    """name -> expression of the '+ name=value' continuation lines in text."""
+    pattern = r"^\+\s*(\w+)\s*=\s*('[^']*'|\S+)"
+    return dict(re.findall(pattern, text, flags=re.MULTILINE))
+
+
+def _section(text: str, start: str, end: str) -> str:
+    match = re.search(rf"^{start}\b(.*?)^{end}\b", text, re.MULTILINE | re.DOTALL)
+    if match is None:
+        raise ValueError(f"{start!r} not found in {_MODEL.name}")
+    return match.group(1)
+
+
+@functools.cache
+def _model_text() -> str:
+    return _MODEL.read_text()
+
+
+@functools.cache
+def res_params(res_type: str, corner: str = "typical") -> ResParams:
+    """Returns the model parameters of res_type at a corner.
+
+    Args:
+        res_type: resistor variant of gf180mcu.cells.res.
+        corner: "typical", "ss" or "ff".
+    """
+    if res_type not in _LIMITS:
+        raise ValueError(f"Unknown res_type: {res_type}, expected one of {RES_TYPES}")
+    if corner not in CORNERS:
+        raise ValueError(f"Unknown corner: {corner}, expected one of {CORNERS}")
+    text = _model_text()
+    corner_params = {
+        k: _eval(v, {})
+        for k, v in _assignments(_section(text, f".LIB res_{corner}", ".lib")).items()
+    }
+    block = _section(text, rf"\.subckt {res_type}\s", rf"\.ends {res_type}")
+    body = _assignments(block.split("\n.model", 1)[0])
+
+    def p(name: str) -> float:
+        return _eval(body[name], corner_params)
+
+    rsh_end = tc1_end = tc2_end = 0.0
+    terminal = re.search(r"^rt1\s+\S+\s+\S+\s+(\w+)", block, re.MULTILINE)
+    if terminal is not None:
+        model = _section(block, rf"\.model {terminal.group(1)} r", r"(?!\+)")
+        t = {k: _eval(v, corner_params) for k, v in _assignments(model).items()}
+        rsh_end, tc1_end, tc2_end = t["rsh"], t.get("tc1", 0.0), t.get("tc2", 0.0)
+
+    return ResParams(
+        rsh=p("r_rsh0"),
+        dw=p("r_dw") * 1e6,
+        dl=p("r_dl") * 1e6,
+        tc1=p("r_tc1"),
+        tc2=p("r_tc2"),
+        rsh_end=rsh_end,
+        tc1_end=tc1_end,
+        tc2_end=tc2_end,
+        w_min=_LIMITS[res_type][0],
+        l_min=_LIMITS[res_type][1],
+    )
+
+
+@functools.cache
+def _table(corner: str) -> tuple[np.ndarray, np.ndarray]:
+    types = np.array(sorted(RES_TYPES))
+    return types, np.array([res_params(t, corner) for t in types])
+
+
+def _columns(res_type, corner: str) -> np.ndarray:
+    """ResParams fields as arrays shaped like res_type (first axis: field)."""
+    if isinstance(res_type, str):
+        return np.asarray(res_params(res_type, corner))
+    types, table = _table(corner)
+    res_type = np.asarray(res_type)
+    index = np.searchsorted(types, res_type).clip(0, len(types) - 1)
+    unknown = types[index] != res_type
+    if unknown.any():
+        raise ValueError(f"Unknown res_type: {sorted(set(res_type[unknown]))}")
+    return np.moveaxis(table[index], -1, 0)
+
+
+def _scales(p: np.ndarray, temp) -> tuple[np.ndarray, np.ndarray]:
+    """Body sheet and terminal resistance times width at temp."""
+    dt = np.asarray(temp, dtype=float) - _TNOM
+    body = p[0] * (1 + p[3] * dt + p[4] * dt * dt)
+    ends = 2 * p[5] * (1 + p[6] * dt + p[7] * dt * dt)
+    return body, ends
+
+
+def resistance(res_type, w, l, temp=25.0, corner: str = "typical") -> np.ndarray:
+    """Nominal resistance in ohm, broadcast over the inputs.
+
+    Args:
+        res_type: resistor variant, or an array of them.
+        w: drawn widths (um).
+        l: drawn lengths (um).
+        temp: temperatures (C).
+        corner: "typical", "ss" or "ff".
+    """
+    p = _columns(res_type, corner)
+    body, ends = _scales(p, temp)
+    w_eff = np.asarray(w, dtype=float) - 2 * p[1]
+    return (body * (np.asarray(l, dtype=float) - 2 * p[2]) + ends) / w_eff
+
+
+def size_resistor(
+    res_type,
+    r,
+    w=None,
+    temp=25.0,
+    corner: str = "typical",
+    grid: float = 0.01,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Width and length for resistance r, broadcast over the inputs.
+
+    w is raised to the minimum width and rounded up to the grid, l is solved
+    for it and rounded to the grid. Targets that need less than the minimum
+    length get l = nan.
+
+    Args:
+        res_type: resistor variant, or an array of them.
+        r: target resistances (ohm).
+        w: widths (um), the minimum width if None.
+        temp: temperatures (C).
+        corner: "typical", "ss" or "ff".
+        grid: layout grid of w and l (um).
+    """
+    p = _columns(res_type, corner)
+    w = p[8] if w is None else np.maximum(np.asarray(w, dtype=float), p[8])
+    w = np.ceil(np.round(w / grid, 6)) * grid
+    body, ends = _scales(p, temp)
+    l = (np.asarray(r, dtype=float) * (w - 2 * p[1]) - ends) / body + 2 * p[2]
+    l = np.round(l / grid) * grid
+    w, l = np.broadcast_arrays(np.round(w, 6), np.round(l, 6))
+    return w, np.where(l >= p[9], l, np.nan)
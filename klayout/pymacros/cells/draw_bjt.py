@@ -18,15 +18,16 @@
 
 import os
 
-gds_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "bjt")
+from .gds_cache import cells_path, copy_cell
+
+gds_path = os.path.join(cells_path, "bjt")
 
 
 def draw_bjt(layout, device_name):
     gds_file = f"{gds_path}/{device_name}.gds"
 
-    if os.path.exists(gds_file) and os.path.isfile(gds_file):
-        layout.read(gds_file)
-    else:
+    if not os.path.isfile(gds_file):
         print(f"{gds_file} is not exist, please recheck")
+        return layout.cell(device_name)
 
-    return layout.cell(device_name)
+    return copy_cell(layout, gds_file, device_name)
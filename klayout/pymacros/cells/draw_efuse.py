@@ -14,12 +14,10 @@
 
 import os
 
-USER = os.environ["USER"]
-gds_path = f"/home/{USER}/.klayout/pymacros/cells/efuse"
+from .gds_cache import cells_path, copy_cell
 
+gds_path = os.path.join(cells_path, "efuse")
 
-def draw_efuse(layout, device_name):
-    layout.read(f"{gds_path}/efuse.gds")
-    cell_name = "efuse_cell"
 
-    return layout.cell(cell_name)
+def draw_efuse(layout, device_name="efuse_cell"):
+    return copy_cell(layout, f"{gds_path}/efuse.gds", device_name)
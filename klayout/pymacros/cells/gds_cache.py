@@ -0,0 +1,53 @@
+# Copyright 2022 GlobalFoundries PDK Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+########################################################################################################################
+## In-memory cache of the fixed-geometry GDS cells (BJT, efuse) of GF180MCU
+########################################################################################################################
+
+import os
+
+import pya
+
+cells_path = os.path.dirname(os.path.abspath(__file__))
+
+# One source layout per GDS file, read once per process.
+_sources = {}
+
+
+def read_gds(gds_file):
+    """Returns the layout of a GDS file, reading it on first use only."""
+    gds_file = os.path.abspath(gds_file)
+    source = _sources.get(gds_file)
+    if source is None:
+        source = pya.Layout()
+        source.read(gds_file)
+        _sources[gds_file] = source
+    return source
+
+
+def copy_cell(layout, gds_file, cell_name):
+    """Returns cell_name in layout, copied from the cached GDS if not there yet.
+
+    PCells regenerate into the same library layout, so the cell (and its
+    children) is copied once per layout instead of reading the file again.
+    """
+    if layout.has_cell(cell_name):
+        return layout.cell(cell_name)
+    source = read_gds(gds_file).cell(cell_name)
+    if source is None:
+        raise ValueError(f"{gds_file} has no cell {cell_name}")
+    cell = layout.create_cell(cell_name)
+    cell.copy_tree(source)
+    return cell
@@ -0,0 +1,63 @@
+"""Benchmark generation time of the device cells over the XOR sweep cases.
+
+Every case of scripts/magic/sweep_params.json is generated ``--repeat``
+times from an empty cell cache, so each run includes the sub-cells the
+device instantiates. Prints the best time per case, averaged per device,
+and the total.
+
+    python scripts/benchmarks/device_cells.py --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import inspect
+import json
+import time
+from pathlib import Path
+
+import gdsfactory as gf
+
+import gf180mcu  # noqa: F401  (activates the PDK)
+
+SWEEP = Path(__file__).resolve().parents[1] / "magic" / "sweep_params.json"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--device", nargs="*", help="only these sweep devices")
+    args = parser.parse_args()
+
+    devices = json.loads(SWEEP.read_text())["devices"]
+    total = 0.0
+    for name, cfg in devices.items():
+        if args.device and name not in args.device:
+            continue
+        module = importlib.import_module(cfg["cell_module"])
+        cell = getattr(module, cfg.get("cell_fn", name))
+        accepted = set(inspect.signature(cell).parameters)
+
+        best = []
+        for params in cfg["sweep"]:
+            kwargs = {**params, **cfg.get("extra_params", {})}
+            kwargs = {k: v for k, v in kwargs.items() if k in accepted}
+            times = []
+            for _ in range(args.repeat):
+                gf.clear_cache()
+                t0 = time.perf_counter()
+                cell(**kwargs)
+                times.append(time.perf_counter() - t0)
+            best.append(min(times))
+        total += sum(best)
+        print(
+            f"{name:<20} {len(best):>3} cases  "
+            f"mean {1e3 * sum(best) / len(best):7.2f} ms  "
+            f"max {1e3 * max(best):7.2f} ms"
+        )
+    print(f"{'total':<20} {1e3 * total:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
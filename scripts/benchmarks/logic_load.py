@@ -0,0 +1,59 @@
+"""Cold-start benchmark: instantiate every cell of a standard-cell library.
+
+Compares one GDS read per cell (calling each cell function) against the
+single-pass ``gf180mcu.logic.load_library``. Each run uses a fresh
+interpreter so caches from earlier runs do not leak in.
+
+    python scripts/benchmarks/logic_load.py --library gf180mcu_fd_sc_mcu7t5v0
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+_PER_CELL = """
+import time
+from gf180mcu import logic
+names = list(logic._LIBRARY_PATHS[{library!r}])
+t0 = time.perf_counter()
+for name in names:
+    getattr(logic, name)()
+print(time.perf_counter() - t0)
+"""
+
+_BULK = """
+import time
+from gf180mcu import logic
+t0 = time.perf_counter()
+logic.load_library({library!r})
+print(time.perf_counter() - t0)
+"""
+
+
+def _run(code: str) -> float:
+    out = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    )
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--library", default="gf180mcu_fd_sc_mcu7t5v0")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for label, template in (("per-cell", _PER_CELL), ("load_library", _BULK)):
+        code = template.format(library=args.library)
+        times = [_run(code) for _ in range(args.repeat)]
+        print(
+            f"{label:>14}: median {statistics.median(times):.3f} s "
+            f"(min {min(times):.3f} s, {args.repeat} runs)"
+        )
+
+
+if __name__ == "__main__":
+    main()
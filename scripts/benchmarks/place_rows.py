@@ -0,0 +1,54 @@
+"""Benchmark the row placer at 1k, 10k and 100k instances.
+
+Cells are drawn at random from one library. Master cells are loaded once
+before timing, so the numbers cover placement and instance emission only.
+
+    python scripts/benchmarks/place_rows.py --library gf180mcu_fd_sc_mcu7t5v0
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+
+import gdsfactory as gf
+import numpy as np
+
+from gf180mcu import logic
+from gf180mcu.logic import placer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--library", default="gf180mcu_fd_sc_mcu7t5v0")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000]
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    names = list(logic.load_library(args.library))
+    rng = np.random.default_rng(args.seed)
+
+    for n in args.sizes:
+        cells = [names[i] for i in rng.integers(0, len(names), n)]
+
+        tracemalloc.start()
+        t0 = time.perf_counter()
+        placement = placer.place_rows(cells)
+        t1 = time.perf_counter()
+        placer.build(placement, gf.Component())
+        t2 = time.perf_counter()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(
+            f"{n:>8} cells, {placement.rows:>4} rows: "
+            f"place {t1 - t0:.3f} s, build {t2 - t1:.3f} s, "
+            f"peak {peak / 2**20:.1f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
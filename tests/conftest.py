@@ -5,14 +5,29 @@ import pathlib
 import shutil
 
 import gdsfactory as gf
+import pytest
 from gdsfactory.name import clean_name, get_name_short
 
+from gf180mcu.config import PATH
+
 PROJECT_ROOT = pathlib.Path(__file__).parent.parent
 DIFF_DIR = PROJECT_ROOT / "test_diffs"
 
 _config = {"update_gds_refs": False}
 
 
+@pytest.fixture(autouse=True, scope="session")
+def _isolated_caches(tmp_path_factory):
+    """Keep the port and abstract caches of the test run out of ~/.cache."""
+    cache = tmp_path_factory.mktemp("cache")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("GF180MCU_CACHE", str(cache))
+        mp.setattr(PATH, "cache", cache)
+        mp.setattr(PATH, "port_cache", cache / "ports")
+        mp.setattr(PATH, "abstract_cache", cache / "abstracts")
+        yield
+
+
 def pytest_addoption(parser):
     """Add --update-gds-refs option to pytest."""
     parser.addoption(
@@ -0,0 +1,39 @@
+"""Batch generated layouts must match the cells built in this process."""
+
+import gdsfactory as gf
+import klayout.db as kdb
+import pytest
+
+from gf180mcu import batch
+
+PARAMS = [
+    {"w_gate": 1.0, "nf": 2},
+    {"w_gate": 1.0, "nf": 2, "deepnwell": 1, "pcmpgr": 1},
+    {"w_gate": 0.5, "l_gate": 0.5, "deepnwell": 1, "pcmpgr": 1},
+    {"w_gate": 1.0, "nf": 2},
+]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_generate_merges_workers(workers: int) -> None:
+    result = batch.generate("nfet", PARAMS, workers=workers)
+    layout = result.layout
+    names = [c.name for c in layout.each_cell()]
+    assert len(names) == len(set(names))
+    assert result.names[0] == result.names[3]
+
+    for params, name in zip(PARAMS, result.names):
+        c = gf.get_component("nfet", **params)
+        assert c.name == name
+        for index in c.kcl.layout.layer_indexes():
+            expected = kdb.Region(c.kdb_cell.begin_shapes_rec(index))
+            target = layout.find_layer(c.kcl.layout.get_info(index))
+            got = kdb.Region()
+            if target is not None:
+                got = kdb.Region(layout.cell(name).begin_shapes_rec(target))
+            assert (expected ^ got).is_empty(), (name, c.kcl.layout.get_info(index))
+
+
+def test_generate_rejects_unknown_cell() -> None:
+    with pytest.raises(ValueError, match="not a cell"):
+        batch.generate("no_such_cell", [{}])
@@ -0,0 +1,36 @@
+"""Contact cut arrays shared by the device generators."""
+
+import gdsfactory as gf
+import klayout.db as kdb
+import pytest
+
+from gf180mcu.cells import contacts
+from gf180mcu.cells.diode import diode_nd2ps
+from gf180mcu.layers import layer
+
+
+def _cuts(c: gf.Component) -> kdb.Region:
+    c.kcl.layout.update()
+    return kdb.Region(c.begin_shapes_rec(gf.get_layer(layer["contact"]))).merged()
+
+
+@pytest.mark.parametrize("nx,ny", [(0, 3), (3, 0), (0, 0)])
+def test_zero_count_adds_no_cuts(nx: int, ny: int) -> None:
+    c = gf.Component()
+    contacts.add_contacts(c, 0, 0, nx, ny)
+    assert not list(c.kdb_cell.each_inst())
+    assert _cuts(c).is_empty()
+
+
+def test_contacts_are_centered() -> None:
+    c = gf.Component()
+    contacts.add_contacts(c, 1.0, 2.0, 3, 2)
+    assert _cuts(c).count() == 6
+    assert c.dbbox().center() == kdb.DPoint(1.0, 2.0)
+
+
+def test_small_diode_has_no_anode_cuts() -> None:
+    # 0.3 um is below one inner contact: only the guard ring is contacted
+    c = diode_nd2ps(la=0.3, wa=0.3, volt="3.3V")
+    anode = kdb.Region(kdb.Box(-150, -150, 150, 150))
+    assert _cuts(c).interacting(anode).is_empty()
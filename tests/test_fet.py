@@ -0,0 +1,214 @@
+"""Geometry-only helpers of the gf180mcu.cells.fet generators."""
+
+import dataclasses
+import itertools
+
+import gdsfactory as gf
+import klayout.db as kdb
+import numpy as np
+import pytest
+
+from gf180mcu.cells import fet
+from gf180mcu.cells.fet_array import fet_array
+from gf180mcu.cells.fet_stack import fet_stack
+from gf180mcu.cells.rules import rule_deck
+from gf180mcu.layers import layer
+
+SIZES = list(itertools.product((0.22, 0.36, 1.0), (0.28, 0.5, 1.8), (1, 2, 5)))
+
+
+def _bbox(c) -> tuple[float, ...]:
+    b = c.dbbox()
+    return tuple(round(v, 4) for v in (b.left, b.bottom, b.right, b.top))
+
+
+@pytest.mark.parametrize("volt", ["3.3V", "5.0V", "10.0V", "nvt"])
+@pytest.mark.parametrize("pmos", [False, True])
+def test_footprint_matches_drawn_bbox(volt: str, pmos: bool) -> None:
+    if volt == "nvt" and pmos:
+        pytest.skip("no native pfet")
+    cell = fet.pfet if pmos else fet.nfet
+    for (w, l, nf), grw in itertools.product(SIZES, (0.22, 0)):
+        if volt == "nvt":
+            c = fet.nfet_06v0_nvt(w_gate=w, l_gate=l, nf=nf, grw=grw)
+        else:
+            c = cell(w_gate=w, l_gate=l, nf=nf, grw=grw, volt=volt)
+        fp = fet.fet_footprint(w, l, nf, volt, grw > 0, pmos)
+        assert fp.bbox == _bbox(c), (w, l, nf, grw)
+        assert len(fp.drain) + len(fp.source) == nf + 1
+
+    w, l, nf = np.array(SIZES).T
+    batch = fet.fet_footprints(w, l, nf.astype(int), volt, True, pmos)
+    expected = [fet.fet_footprint(*s, volt, True, pmos) for s in SIZES]
+    assert np.array_equal(batch["bbox"], [fp.bbox for fp in expected])
+    assert np.allclose(batch["area"], [fp.area for fp in expected])
+    assert np.allclose(batch["sd_x"], [min(fp.drain)[0] for fp in expected])
+
+
+def _drawn_lde(c, fp) -> dict[str, float]:
+    """sa/sb/sd and as/ad/ps/pd measured on the drawn COMP and poly."""
+    comp = kdb.Region(c.begin_shapes_rec(gf.get_layer(layer["comp"]))).merged()
+    poly = kdb.Region(c.begin_shapes_rec(gf.get_layer(layer["poly2"])))
+    gates = sorted((poly & kdb.Region(comp.bbox())).each(), key=lambda p: p.bbox().left)
+    drains = [kdb.Point(round(x * 1000), 0) for x, _ in fp.drain]
+    lde = dict.fromkeys(("as", "ad", "ps", "pd"), 0.0)
+    for piece in (comp - poly).each():
+        terminal = "d" if any(piece.inside(p) for p in drains) else "s"
+        lde[f"a{terminal}"] += piece.area() / 1e6
+        lde[f"p{terminal}"] += piece.perimeter() / 1e3
+    lde["sa"] = (gates[0].bbox().left - comp.bbox().left) / 1e3
+    lde["sb"] = (comp.bbox().right - gates[-1].bbox().right) / 1e3
+    lde["sd"] = (
+        (gates[1].bbox().left - gates[0].bbox().right) / 1e3
+        if fp.pitch and len(gates) > 1
+        else 0.0
+    )
+    return lde
+
+
+@pytest.mark.parametrize(
+    "volt,asym,sizes",
+    [
+        ("3.3V", False, SIZES),
+        ("6.0V", False, SIZES),
+        ("10.0V", True, [(4.0, 0.6, 1), (4.0, 0.6, 2), (8.0, 1.0, 3), (4.0, 0.6, 4)]),
+    ],
+)
+def test_lde_params_match_drawn_diffusion(volt: str, asym: bool, sizes) -> None:
+    for w, l, nf in sizes:
+        c = fet.nfet(w_gate=w, l_gate=l, nf=nf, grw=0, volt=volt, asym=asym)
+        drawn = _drawn_lde(c, fet.fet_footprint(w, l, nf, volt, False))
+        assert {k: c.info[k] for k in drawn} == pytest.approx(drawn, abs=1e-6)
+
+    w, l, nf = np.array(sizes).T
+    batch = fet.fet_lde_params_batch(w, l, nf.astype(int), volt, asym)
+    for i, (w, l, nf) in enumerate(sizes):
+        params = fet.fet_lde_params(w, l, nf, volt, asym)
+        assert params == {k: v[i] for k, v in batch.items()}
+
+
+def _port_nets(c) -> tuple[int, dict[str, int]]:
+    """Number of metal1/via1/metal2 nets and the net of every port."""
+    l2n = kdb.LayoutToNetlist(kdb.RecursiveShapeIterator(c.kcl.layout, c.kdb_cell, []))
+    m1, v1, m2 = (
+        l2n.make_layer(gf.get_layer(layer[name]), name)
+        for name in ("metal1", "via1", "metal2")
+    )
+    for a, b in ((m1, m1), (m2, m2), (m1, v1), (v1, m2)):
+        l2n.connect(a, b)
+    l2n.extract_netlist()
+    nets = {}
+    for p in c.ports:
+        inside = -0.05 if p.orientation == 90 else 0.05
+        net = l2n.probe_net(m1, kdb.DPoint(p.center[0], p.center[1] + inside))
+        nets[p.name] = net.cluster_id
+    return len(list(l2n.netlist().top_circuit().each_net())), nets
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        dict(pattern="AABB/BBAA", dummies=2, pmos=True, volt="5.0V"),
+        dict(pattern="AA/BB", common_source=False, w_gate=0.22, l_gate=0.5),
+    ],
+)
+def test_fet_array_routes_every_net_once(kwargs) -> None:
+    c = fet_array(**kwargs)
+    n_nets, port_nets = _port_nets(c)
+    # one net per port plus the guard ring: no opens, no shorts
+    assert n_nets == len(c.ports) + 1
+    assert len(set(port_nets.values())) == len(c.ports)
+    assert sum(c.info["fingers"].values()) == len(
+        kwargs.get("pattern", "ABBA/BAAB").replace("/", "")
+    )
+
+
+def test_fet_array_rejects_unmatched_drains() -> None:
+    with pytest.raises(ValueError, match="drains of different devices"):
+        fet_array(pattern="ABCCBA")
+
+
+@pytest.mark.parametrize(
+    "kwargs,diffusions",
+    [
+        ({}, 1),
+        (
+            dict(
+                gates=(
+                    (1.0, 0.28, "a", "out", "x"),
+                    (1.0, 0.5, "b", "x", "y"),
+                    (1.0, 0.28, "c", "y", "vss"),
+                )
+            ),
+            1,
+        ),
+        (
+            dict(
+                gates=(
+                    (2.0, 0.28, "a", "out", "vss"),
+                    (2.0, 0.28, "a", "vss", "out"),
+                    (0.5, 0.6, "b", "out", "vss"),
+                ),
+                pmos=True,
+                volt="5.0V",
+            ),
+            2,
+        ),
+        (dict(gates=((1.0, 0.28, "out", "out", "x"), (1.0, 0.28, "b", "y", "vss"))), 2),
+    ],
+)
+def test_fet_stack_shares_diffusion(kwargs, diffusions: int) -> None:
+    c = fet_stack(**kwargs)
+    n_nets, port_nets = _port_nets(c)
+    assert n_nets == len(c.ports) + 1
+    assert len(set(port_nets.values())) == len(c.ports)
+    assert c.info["diffusions"] == diffusions
+    comp = kdb.Region(c.begin_shapes_rec(gf.get_layer(layer["comp"]))).merged()
+    # the guard ring is one more diffusion
+    assert comp.count() == diffusions + (1 if c.settings["grw"] else 0)
+
+
+@pytest.mark.parametrize("pmos", [False, True])
+def test_deepnwell_isolates_device(pmos: bool) -> None:
+    cell = fet.pfet if pmos else fet.nfet
+    c = cell(w_gate=1.0, l_gate=0.5, nf=2, deepnwell=1, pcmpgr=1, volt="5.0V")
+
+    def region(name):
+        return kdb.Region(c.begin_shapes_rec(gf.get_layer(layer[name]))).merged()
+
+    rules = rule_deck("5.0V")
+    dnwell = region("dnwell")
+    assert region("nwell").is_empty()
+    if not pmos:
+        enc = round(rules.dnwell_enc_lvpwell * 1e3)
+        assert (region("lvpwell").sized(enc) - dnwell).is_empty()
+    enc = round(rules.dualgate_enc_dnwell * 1e3)
+    assert (dnwell.sized(enc) - region("dualgate")).is_empty()
+    # the P+ ring sits 2.5 outside the DNWELL and is cached on its size
+    ring = dnwell.sized(2500).bbox()
+    assert region("comp").bbox().enlarged(-360, -360) == ring
+    box = dnwell.bbox()
+    hx, hy = box.width() / 2e3, box.height() / 2e3
+    ring_cell = fet._dnwell_ring(hx, hy)
+    assert fet._dnwell_ring(hx + 1e-4, hy).cell_index() == ring_cell.cell_index()
+
+
+def test_rule_decks_are_shared_and_frozen() -> None:
+    rules = rule_deck("5/6V")
+    assert rules is rule_deck("6.0V")
+    assert rules.difft == 0.36 and rules.cif_contact_cut == 0.22
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        rules.sub_surround = 0.12
+    with pytest.raises(ValueError, match="Unknown voltage class"):
+        rule_deck("1.8V")
+
+
+@pytest.mark.parametrize(
+    "volt, dnwell_enc_comp", [("3.3V", 0.66), ("6.0V", 0.62), ("nvt", 0.62)]
+)
+def test_rule_decks_hold_well_enclosures(volt: str, dnwell_enc_comp: float) -> None:
+    rules = rule_deck(volt)
+    assert rules.dnwell_enc_comp == dnwell_enc_comp
+    assert rules.dnwell_enc_lvpwell == 2.5 and rules.dualgate_enc_dnwell == 0.5
+    assert rules.metal_spacing == 0.23
@@ -0,0 +1,191 @@
+"""Row placement and related tools for the gf180mcu.logic standard cells."""
+
+import subprocess
+import sys
+
+import klayout.db as kdb
+import numpy as np
+import pytest
+
+from gf180mcu import logic
+from gf180mcu.layers import LAYER
+from gf180mcu.logic import families, fill, pins, placer, verilog, views
+
+LIB = "gf180mcu_fd_sc_mcu7t5v0"
+CELLS = [f"{LIB}__{name}" for name in ("inv_1", "nand2_1", "dffq_1", "buf_4")] * 25
+
+
+def test_place_rows_packs_without_overlap() -> None:
+    p = placer.place_rows(CELLS, row_width=40)
+    widths = p.widths()
+    assert p.row_height == 3920
+    assert np.all(p.x + widths <= p.row_width)
+    assert np.array_equal(p.y, p.row * p.row_height)
+    for r in range(p.rows):
+        in_row = p.row == r
+        x, w = p.x[in_row], widths[in_row]
+        assert x[0] == 0
+        assert np.array_equal(x[1:], (x + w)[:-1])
+
+
+def test_build_mirrors_odd_rows() -> None:
+    p = placer.place_rows(CELLS, row_width=40)
+    c = placer.build(p)
+    insts = list(c.kdb_cell.each_inst())
+    assert len(insts) == len(CELLS)
+    mirrored = np.array([inst.trans.is_mirror() for inst in insts])
+    assert np.array_equal(mirrored, p.row % 2 == 1)
+    assert c.dbbox().height() >= p.rows * logic.abstract(CELLS[0]).row_height
+
+
+def test_verilog_streams_to_gds(tmp_path) -> None:
+    netlist = tmp_path / "top.v"
+    netlist.write_text(
+        "// gate-level\n`timescale 1ns / 1ps\n`define WIDTH 1\n"
+        '(* top = 1 *)\n(* src = "top.v:1.1-9.10" *)\n'
+        "module top (a, y);\n  input a;\n  output y;\n  wire n1;\n"
+        + "".join(
+            f'  (* src = "top.v:{i}" *)\n  {cell} u{i} (.I(a), /* pin */ .ZN(n{i}));\n'
+            for i, cell in enumerate(CELLS)
+        )
+        + "endmodule\n"
+    )
+    instances = list(verilog.read_instances(netlist))
+    assert [i.cell for i in instances] == CELLS
+    assert instances[1].pins == {"I": "a", "ZN": "n1"}
+
+    gdspath = verilog.write_layout(netlist, tmp_path / "top.gds", 40, chunk_size=7)
+    layout = kdb.Layout()
+    layout.read(str(gdspath))
+    expected = placer.build(placer.place_rows(CELLS, row_width=40))
+    got = [(i.cell.name, i.trans) for i in layout.cell("top").each_inst()]
+    assert sorted(got, key=str) == sorted(
+        ((i.cell.name, i.trans) for i in expected.kdb_cell.each_inst()), key=str
+    )
+
+
+# At 2.24 um every cell but nand2_1 is wider than the row and buf_4 is wider
+# than two rows.
+@pytest.mark.parametrize("row_width", [40.32, 2.24])
+def test_fill_rows_closes_every_gap(row_width: float) -> None:
+    p = placer.place_rows(CELLS, row_width=row_width)
+    keep = np.arange(len(p)) % 3 != 0
+    p.master, p.x, p.y, p.row = p.master[keep], p.x[keep], p.y[keep], p.row[keep]
+
+    f = fill.fill_rows(p, tap_pitch=10, decap=True)
+    assert f"{LIB}__filltie" in f.masters
+    row = np.concatenate([p.row, f.row])
+    start = np.concatenate([p.x, f.x])
+    end = start + np.concatenate([p.widths(), f.widths()])
+    order = np.lexsort((start, row))
+    row, start, end = row[order], start[order], end[order]
+    same_row = row[1:] == row[:-1]
+    assert not np.any(same_row & (start[1:] < end[:-1]))
+    assert len(fill.free_intervals(p, (row, start, end))[0]) == 0
+
+
+def test_pin_index_matches_brute_force() -> None:
+    p = placer.place_rows(CELLS, row_width=40)
+    nets = [{"I": "a", "ZN": f"n{i}"} for i in range(len(CELLS))]
+    index = pins.PinIndex(p, nets, grid=2)
+    index.add(placer.place_rows(CELLS[:8], row_width=40))
+    assert len(index.by_net("a")) == CELLS.count(f"{LIB}__inv_1")
+
+    r = index.rects
+    box = (5_000, 3_000, 12_000, 9_000)
+    hit = (r[:, 0] <= box[2]) & (r[:, 2] >= box[0])
+    hit &= (r[:, 1] <= box[3]) & (r[:, 3] >= box[1])
+    got = index.in_region(5, 3, 12, 9)
+    assert sorted(got) == sorted(index.pins(np.flatnonzero(hit)))
+
+    def distance(rects: np.ndarray) -> np.ndarray:
+        dx = np.maximum(np.maximum(rects[:, 0] - 20_100, 20_100 - rects[:, 2]), 0)
+        dy = np.maximum(np.maximum(rects[:, 1] - 10_200, 10_200 - rects[:, 3]), 0)
+        return np.hypot(dx, dy)
+
+    nearest = np.array([p.rect for p in index.nearest(20.1, 10.2, k=3)]) * 1000
+    assert np.allclose(distance(nearest), np.sort(distance(r))[:3], atol=1)
+
+
+def test_resize_keeps_origin_and_matches_rebuild() -> None:
+    nand2 = families.variants(f"{LIB}__nand2_1")
+    assert [v.drive for v in nand2] == sorted(v.drive for v in nand2)
+    assert families.next_size(f"{LIB}__nand2_1") == nand2[1].name
+
+    p = placer.place_rows(CELLS, row_width=40)
+    c = placer.build(p)
+    x = p.x[1]
+    families.resize(p, 1, families.next_size(CELLS[1], 2), component=c)
+    assert p.x[1] == x
+    assert p.masters[p.master[1]] == families.next_size(CELLS[1], 2)
+
+    def instances(component):
+        return sorted(
+            (i.cell.name, str(i.trans)) for i in component.kdb_cell.each_inst()
+        )
+
+    assert instances(c) == instances(placer.build(p))
+
+
+def test_cells_register_lazily() -> None:
+    # fresh interpreter: other tests build cells in this one
+    code = """
+import inspect
+import gf180mcu
+from gf180mcu import PDK, logic
+
+names = list(logic._GDS_PATHS)
+for name in names:
+    inspect.signature(PDK.cells[name])
+    inspect.unwrap(PDK.cells[name])
+    assert PDK.cells[name].__name__ == name
+assert not set(names) & set(vars(logic))
+assert PDK.cells[names[0]]().name == names[0]
+assert names[0] in vars(logic)
+"""
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+    for library, paths in logic._LIBRARY_PATHS.items():
+        assert len(paths) == 229, library
+        assert all(p.is_file() for p in paths.values())
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        f"{LIB}__inv_1",
+        f"{LIB}__dffq_1",
+        "gf180mcu_fd_sc_mcu9t5v0__nand2_1",
+        "gf180mcu_fd_sc_mcu9t5v0__addf_1",
+    ],
+)
+def test_abstract_matches_cell(name: str) -> None:
+    a = logic.abstract(name)
+    c = getattr(logic, name)()
+    boundary = c.kdb_cell.dbbox_per_layer(c.kcl.layer(*LAYER.pr_bndry))
+    box = c.dbbox() if boundary.empty() else boundary
+    assert (a.width, a.height) == pytest.approx((box.width(), box.height()))
+    assert a.row_height == (3.92 if "7t5v0" in name else 5.04)
+
+    labelled = set()
+    for metal, label in (
+        ("metal1", LAYER.metal1_label),
+        ("metal2", LAYER.metal2_label),
+    ):
+        for shape in c.kdb_cell.shapes(c.kcl.layer(*label)).each():
+            x, y = shape.dtext.x, shape.dtext.y
+            rects = a.pins[shape.text_string][metal]
+            assert any(r[0] <= x <= r[2] and r[1] <= y <= r[3] for r in rects)
+            labelled.add(shape.text_string)
+    assert labelled == set(a.pins) and a.pins
+
+
+def test_abstracts_are_served_from_the_table(monkeypatch) -> None:
+    library = "gf180mcu_fd_sc_mcu9t5v0"
+    first = logic.abstract(f"{library}__inv_1")
+    assert logic.abstract(f"{library}__inv_1") is first
+
+    # a new process finds the JSON table and extracts nothing
+    monkeypatch.delitem(views._LOADED, library)
+    monkeypatch.setattr(views, "_extract", None)
+    assert logic.abstract(f"{library}__inv_1") == first
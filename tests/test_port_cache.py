@@ -0,0 +1,59 @@
+"""Cached ports must match the ports found by scanning labels."""
+
+from pathlib import Path
+
+import gdsfactory as gf
+
+from gf180mcu import fixed, port_cache
+from gf180mcu.config import PATH
+
+
+def _ports(component: gf.Component) -> list[tuple]:
+    return [
+        (p.name, p.center, p.orientation, p.width, p.layer, p.port_type)
+        for p in component.ports
+    ]
+
+
+def test_port_cache_roundtrip(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(PATH, "port_cache", tmp_path)
+    gdspath = fixed._GDS_DIR / "bjt" / "npn_05p00x05p00.gds"
+
+    scanned = port_cache.import_gds(gdspath, fixed._add_ports)
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+    cached = port_cache.import_gds(gdspath, fixed._add_ports)
+    assert _ports(cached) == _ports(scanned)
+    assert _ports(scanned)
+
+
+def test_port_table_roundtrip(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(PATH, "port_cache", tmp_path)
+    paths = {
+        name: fixed._GDS_DIR / "bjt" / f"{name}.gds"
+        for name in ("npn_05p00x05p00", "pnp_05p00x05p00")
+    }
+
+    table = port_cache.PortTable("bjt", paths, fixed._add_ports)
+    scanned = [table.add_ports(gf.import_gds(p), n) for n, p in paths.items()]
+    table.save()
+    assert [p.name for p in tmp_path.iterdir()] == ["bjt.ports.json"]
+
+    def fail(component: gf.Component) -> None:
+        raise AssertionError("ports extracted despite a cached table")
+
+    table = port_cache.PortTable("bjt", paths, fixed._add_ports)
+    table.add_ports_from_labels = fail
+    cached = [table.add_ports(gf.import_gds(p), n) for n, p in paths.items()]
+    assert [_ports(c) for c in cached] == [_ports(c) for c in scanned]
+
+
+def test_failed_write_leaves_no_temp_file(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(PATH, "port_cache", tmp_path)
+    port_cache._write_json(tmp_path / "bad.json", {"port": object()})
+    assert not list(tmp_path.iterdir())
+
+
+def test_tests_do_not_write_to_home_cache() -> None:
+    assert Path.home() not in PATH.port_cache.parents
+    assert Path.home() not in PATH.abstract_cache.parents
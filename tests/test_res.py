@@ -0,0 +1,159 @@
+"""Resistor generators built on gf180mcu.cells.res."""
+
+import gdsfactory as gf
+import klayout.db as kdb
+import numpy as np
+import pytest
+
+from gf180mcu.cells.res import res
+from gf180mcu.cells.res_array import res_array
+from gf180mcu.cells.res_serpentine import res_serpentine, serpentine_segments
+from gf180mcu.layers import layer
+from gf180mcu.res_model import RES_TYPES, res_params, resistance, size_resistor
+
+
+def _region(c, name: str) -> kdb.Region:
+    return kdb.Region(c.begin_shapes_rec(gf.get_layer(layer[name]))).merged()
+
+
+def _port_nets(c, conductors) -> dict[str, int]:
+    """Net of every port, counting resistor bodies as conductors."""
+    l2n = kdb.LayoutToNetlist(kdb.RecursiveShapeIterator(c.kcl.layout, c.kdb_cell, []))
+    layers = {
+        name: l2n.make_layer(gf.get_layer(layer[name]), name) for name in conductors
+    }
+    for a in layers.values():
+        l2n.connect(a)
+    for cut in ("contact", "via1"):
+        for name, other in layers.items():
+            if cut in layers and name not in ("contact", "via1"):
+                l2n.connect(layers[cut], other)
+    l2n.extract_netlist()
+    return {
+        p.name: l2n.probe_net(layers[conductors[0]], kdb.DPoint(*p.center)).cluster_id
+        for p in c.ports
+    }
+
+
+@pytest.mark.parametrize(
+    "r_target,res_type,w_res",
+    [
+        (100e3, "ppolyf_u_1k", 1.0),
+        (20e3, "ppolyf_u", 0.8),
+        (2e3, "nplus_u", 1.0),
+        (500.0, "npolyf_s", 1.0),
+        (20.0, "rm2", 0.5),
+    ],
+)
+def test_serpentine_meets_target(r_target: float, res_type: str, w_res: float) -> None:
+    c = res_serpentine(r_target, res_type, w_res, max_aspect=2.0)
+    n, l = c.info["n_segments"], c.info["l_segment"]
+    assert (n, l) == serpentine_segments(r_target, res_type, w_res, 2.0)
+    assert c.info["r_nominal"] == pytest.approx(r_target, rel=0.01)
+    box = c.dbbox()
+    assert box.height() <= 2.0 * box.width()
+
+    metal = {"rm2": "metal2"}.get(res_type, "metal1")
+    mark = {"rm2": "metal2_res"}.get(res_type, "res_mk")
+    body = {"nplus_u": "comp", "rm2": "metal2"}.get(res_type, "poly2")
+    assert _region(c, mark).count() == n
+    # the bends chain all segments: both ends on one net
+    conductors = [metal] if res_type == "rm2" else [metal, "contact", body]
+    nets = _port_nets(c, conductors)
+    assert nets["r0"] == nets["r1"]
+
+
+@pytest.mark.parametrize("res_type", ["ppolyf_u_1k", "ppolyf_u_1k_6p0", "pplus_u"])
+def test_single_segment_serpentine_is_res(res_type: str) -> None:
+    c = res_serpentine(1500.0, res_type, 1.0, max_aspect=4.0)
+    assert c.info["n_segments"] == 1
+    r = res(l_res=c.info["l_segment"], w_res=1.0, res_type=res_type)
+    for index in c.kcl.layer_indexes():
+        a = kdb.Region(c.begin_shapes_rec(index)).merged()
+        b = kdb.Region(r.begin_shapes_rec(index)).merged()
+        assert (a ^ b).is_empty(), c.kcl.get_info(index)
+
+
+def test_serpentine_rejects_short_target() -> None:
+    with pytest.raises(ValueError, match="below one"):
+        serpentine_segments(100.0, "ppolyf_u_1k")
+    with pytest.raises(ValueError, match="Unsupported res_type"):
+        serpentine_segments(1e4, "nwell")
+
+
+def test_resistance_matches_model_equation() -> None:
+    # ppolyf_u_1k, w=2, l=10 at 125 C, from the subcircuit in sm141064.ngspice
+    w_eff, dt = 2 - 2 * 0.0148, 100
+    body = 1000 * (10 - 2 * 3.85e-5) / w_eff * (1 - 9.39e-4 * dt + 2.51e-6 * dt**2)
+    ends = 2 * 85.45 / w_eff * (1 - 7.92e-3 * dt + 4.25e-5 * dt**2)
+    assert resistance("ppolyf_u_1k", 2, 10, 125) == pytest.approx(body + ends)
+    assert resistance("rm1", 1, 10) == pytest.approx(0.9)
+    assert resistance("ppolyf_u", 1, 10, corner="ss") > resistance("ppolyf_u", 1, 10)
+
+
+def test_resistance_vectorizes_over_res_type() -> None:
+    types = np.array(RES_TYPES * 3)
+    rng = np.random.default_rng(0)
+    w = rng.uniform(2, 5, types.shape)
+    l = rng.uniform(2, 50, types.shape)
+    temp = rng.uniform(-40, 125, types.shape)
+    batch = resistance(types, w, l, temp)
+    for i, t in enumerate(types):
+        assert batch[i] == pytest.approx(float(resistance(t, w[i], l[i], temp[i])))
+
+    w, l = size_resistor(types, batch, w, temp)
+    assert np.all(w >= [res_params(t).w_min for t in types])
+    assert np.allclose(resistance(types, w, l, temp), batch, rtol=0.01)
+    _, l = size_resistor("ppolyf_u_1k", [1e3, 100e3])
+    assert np.isnan(l[0]) and l[1] > 0
+
+
+@pytest.mark.parametrize("pattern", ["ABBA", "ABAB", "ABCCBA", "AABA"])
+def test_res_array_routes_every_device(pattern: str) -> None:
+    c = res_array(pattern, "ppolyf_u_1k", 1.0, 5.0, dummies=1)
+    devices = [*sorted(set(pattern)), "dummy"]
+    assert c.info["segments"] == {
+        d: pattern.count(d) if d != "dummy" else 2 for d in devices
+    }
+    assert _region(c, "res_mk").count() == len(pattern) + 2
+    nets = _port_nets(c, ["metal1", "metal2", "contact", "via1", "poly2"])
+    # both ends of a device on one net, one net per device
+    assert all(nets[f"r0_{d}"] == nets[f"r1_{d}"] for d in devices)
+    assert len({nets[f"r0_{d}"] for d in devices}) == len(devices)
+
+
+def test_res_array_shares_one_ring() -> None:
+    small, large = res_array("AB" * 2), res_array("AB" * 32)
+    # one segment array and one ring, only the routing grows with the count
+    assert len(list(large.kdb_cell.each_inst())) == len(
+        list(small.kdb_cell.each_inst())
+    )
+    assert _region(large, "comp").count() == 1
+
+
+def test_res_labels_share_one_device_cell() -> None:
+    a = res(10, 1, "ppolyf_u", label=True, r0_label="in", r1_label="out")
+    b = res(10, 1, "ppolyf_u", label=True, r0_label="x", r1_label="y")
+    assert a is not b
+    assert res(10, 1, "ppolyf_u", label=True, r0_label="in", r1_label="out") is a
+    (ia,), (ib,) = a.kdb_cell.each_inst(), b.kdb_cell.each_inst()
+    assert ia.cell_index == ib.cell_index
+    assert ia.cell.name.startswith("_res_device")
+    texts = list(a.kdb_cell.shapes(gf.get_layer(layer["metal1_label"])).each())
+    assert [t.text_string for t in texts] == ["in", "out"]
+    metal1 = _region(a, "metal1")
+    for t in texts:
+        assert metal1.interacting(kdb.Region(t.text.bbox().enlarged(1))).count() == 1
+
+
+@pytest.mark.parametrize(
+    "res_type", ["ppolyf_u", "nplus_u", "nwell", "ppolyf_u_1k", "rm1", "rm2"]
+)
+def test_res_labels_sit_on_terminal_metal(res_type: str) -> None:
+    c = res(10, 2, res_type, label=True, r0_label="r0", r1_label="r1")
+    metal = {"rm2": "metal2"}.get(res_type, "metal1")
+    region = _region(c, metal)
+    texts = list(c.kdb_cell.shapes(gf.get_layer(layer[f"{metal}_label"])).each())
+    assert [t.text_string for t in texts] == ["r0", "r1"]
+    for t in texts:
+        assert region.interacting(kdb.Region(t.text.bbox().enlarged(1))).count() == 1
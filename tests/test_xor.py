@@ -185,3 +185,40 @@ def test_xor(device_name: str, params: dict, cell_module: str) -> None:
             )
     finally:
         run_gds.unlink(missing_ok=True)
+
+
+_fet_cases = [
+    case
+    for case in _sweep_cases
+    if case[2] == "gf180mcu.cells.fet"
+    and case[1].get("nf", 1) > 1
+    and json.loads(_SWEEP_JSON.read_text())["devices"][case[0]].get("cell_fn")
+    in ("nfet", "pfet")
+]
+
+
+@pytest.mark.parametrize(
+    "device_name,params,cell_module",
+    _fet_cases,
+    ids=[_human_id(dev, params) for dev, params, _ in _fet_cases],
+)
+def test_xor_hierarchical_fet(device_name: str, params: dict, cell_module: str) -> None:
+    """Fingers placed as instance arrays flatten to the Magic reference."""
+    ref_gds = _REF_GDS_DIR / device_name / f"{_param_hash(params)}.gds"
+    if not ref_gds.exists():
+        pytest.skip(f"Reference GDS not found: {ref_gds}")
+
+    device_cfg = json.loads(_SWEEP_JSON.read_text())["devices"][device_name]
+    cell_fn = getattr(importlib.import_module(cell_module), device_cfg["cell_fn"])
+    component = cell_fn(
+        **params, **device_cfg.get("extra_params", {}), hierarchical=True
+    )
+    with tempfile.NamedTemporaryFile(suffix=".gds", delete=False) as tmp:
+        run_gds = pathlib.Path(tmp.name)
+    component.write_gds(str(run_gds))
+
+    try:
+        failures = xor_gds_files(ref_gds, run_gds)
+        assert not failures, f"XOR differences for {device_name} with {params}"
+    finally:
+        run_gds.unlink(missing_ok=True)